@@ -31,6 +31,13 @@ def pytest_addoption(parser):
         default=None,
         help="MLIPs, in comma-separated list. Default is all models",
     )
+    parser.addoption(
+        "--jobs",
+        action="store",
+        default=1,
+        type=int,
+        help="Number of parallel workers for benchmarks that support it",
+    )
 
 
 def pytest_configure(config):
@@ -52,3 +59,21 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_very_slow)
         elif "slow" in item.keywords and not config.getoption("--run-slow"):
             item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def n_jobs(request) -> int:
+    """
+    Get number of parallel workers from the `--jobs` option.
+
+    Parameters
+    ----------
+    request
+        Request.
+
+    Returns
+    -------
+    int
+        Number of parallel workers.
+    """
+    return request.config.getoption("--jobs")
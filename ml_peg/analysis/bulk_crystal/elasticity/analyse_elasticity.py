@@ -13,6 +13,7 @@ from numpy.typing import ArrayLike
 import pandas as pd
 import pytest
 
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME, cache_per_model
 from ml_peg.analysis.utils.decorators import (
     build_table,
     plot_density_scatter,
@@ -293,56 +294,79 @@ def _filter_results(df: pd.DataFrame, model_name: str) -> tuple[pd.DataFrame, in
     return valid, excluded
 
 
+@cache_per_model(
+    OUT_PATH / CACHE_DIR_NAME, inputs=lambda model_name: CALC_PATH / model_name
+)
+def model_elasticity_stats(model_name: str) -> dict[str, Any]:
+    """
+    Process benchmark statistics for a single model.
+
+    Relaxed structures are also written for the app.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+
+    Returns
+    -------
+    dict[str, Any]
+        Statistics including bulk, shear, elastic tensors, and exclusions.
+    """
+    results_path = CALC_PATH / model_name / "moduli_results.csv"
+    df = pd.read_csv(results_path)
+    filtered, excluded = _filter_results(df, model_name)
+
+    stats = {
+        "bulk": {
+            "ref": filtered[f"{K_COLUMN}_DFT"].tolist(),
+            "pred": filtered[f"{K_COLUMN}_{model_name}"].tolist(),
+        },
+        "shear": {
+            "ref": filtered[f"{G_COLUMN}_DFT"].tolist(),
+            "pred": filtered[f"{G_COLUMN}_{model_name}"].tolist(),
+        },
+        "elastic_tensor": {
+            "ref": filtered[f"{E_TENSOR_COLUMN}_DFT"].tolist(),
+            "pred": filtered[f"{E_TENSOR_COLUMN}_{model_name}"].tolist(),
+        },
+        "crystal_system": {
+            "ref": filtered[f"{SYMMETRY_COLUMN}_DFT"].tolist(),
+            "pred": filtered[f"{SYMMETRY_COLUMN}_{model_name}"].tolist(),
+        },
+        "mp_ids": filtered["mp_id"].tolist(),
+        "excluded": excluded,
+    }
+
+    structs_path = CALC_PATH / model_name / "relaxed_structures.extxyz"
+    if structs_path.exists():
+        all_atoms = read(str(structs_path), index=":")
+        mp_id_to_atoms = {str(a.info["mp_id"]): a for a in all_atoms}
+        struct_dir = OUT_PATH / model_name
+        struct_dir.mkdir(parents=True, exist_ok=True)
+        for i, mp_id in enumerate(filtered["mp_id"].tolist()):
+            atoms = mp_id_to_atoms.get(str(mp_id))
+            if atoms is not None:
+                write_xyz(str(struct_dir / f"{i}.xyz"), atoms)
+
+    return stats
+
+
 @pytest.fixture
 def elasticity_stats() -> dict[str, dict[str, Any]]:
     """
     Load and cache processed benchmark statistics per model.
 
+    Results for models whose outputs are unchanged since the last analysis are loaded
+    from the cache.
+
     Returns
     -------
     dict[str, dict[str, Any]]
         Aggregated statistics including bulk, shear, elastic tensors, and exclusions.
     """
     OUT_PATH.mkdir(parents=True, exist_ok=True)
-    stats: dict[str, dict[str, Any]] = {}
-    for model_name in MODELS:
-        results_path = CALC_PATH / model_name / "moduli_results.csv"
-        df = pd.read_csv(results_path)
-        filtered, excluded = _filter_results(df, model_name)
-
-        stats[model_name] = {
-            "bulk": {
-                "ref": filtered[f"{K_COLUMN}_DFT"].tolist(),
-                "pred": filtered[f"{K_COLUMN}_{model_name}"].tolist(),
-            },
-            "shear": {
-                "ref": filtered[f"{G_COLUMN}_DFT"].tolist(),
-                "pred": filtered[f"{G_COLUMN}_{model_name}"].tolist(),
-            },
-            "elastic_tensor": {
-                "ref": filtered[f"{E_TENSOR_COLUMN}_DFT"].tolist(),
-                "pred": filtered[f"{E_TENSOR_COLUMN}_{model_name}"].tolist(),
-            },
-            "crystal_system": {
-                "ref": filtered[f"{SYMMETRY_COLUMN}_DFT"].tolist(),
-                "pred": filtered[f"{SYMMETRY_COLUMN}_{model_name}"].tolist(),
-            },
-            "mp_ids": filtered["mp_id"].tolist(),
-            "excluded": excluded,
-        }
-
-        structs_path = CALC_PATH / model_name / "relaxed_structures.extxyz"
-        if structs_path.exists():
-            all_atoms = read(str(structs_path), index=":")
-            mp_id_to_atoms = {str(a.info["mp_id"]): a for a in all_atoms}
-            struct_dir = OUT_PATH / model_name
-            struct_dir.mkdir(parents=True, exist_ok=True)
-            for i, mp_id in enumerate(filtered["mp_id"].tolist()):
-                atoms = mp_id_to_atoms.get(str(mp_id))
-                if atoms is not None:
-                    write_xyz(str(struct_dir / f"{i}.xyz"), atoms)
-
-    return stats
+    return {model_name: model_elasticity_stats(model_name) for model_name in MODELS}
 
 
 @pytest.fixture
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
-from ase.io import read as ase_read
-from ase.io import write as ase_write
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -19,6 +19,8 @@ from ml_peg.analysis.utils.utils import (
 )
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.extxyz import read_extxyz
+from ml_peg.calcs.utils.results_table import ID_COLUMN, read_results_table
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -41,6 +43,84 @@ DEFAULT_THRESHOLDS, DEFAULT_TOOLTIPS, DEFAULT_WEIGHTS = load_metrics_config(
 ENERGY_OUTLIER_MIN = -25
 ENERGY_OUTLIER_MAX = 25
 
+# Results stored in the info of structures written before results tables
+INFO_KEYS = (
+    "ref_volume_per_atom",
+    "ref_energy_per_atom",
+    "pred_volume_per_atom",
+    "pred_energy_per_atom",
+)
+
+
+@functools.cache
+def load_results_for_pressure(
+    model_name: str, pressure_label: str
+) -> dict[str, np.ndarray] | None:
+    """
+    Load results of all structures for a model at a specific pressure.
+
+    Results are read from the table written by the calculation in a single load.
+    For outputs written before the table was introduced, results are instead read
+    from the results CSV and individual per-structure xyz files.
+
+    Parameters
+    ----------
+    model_name
+        Name of the model.
+    pressure_label
+        Pressure label (e.g., "P000").
+
+    Returns
+    -------
+    dict[str, np.ndarray] | None
+        Mat_ids, convergence, and ref/pred volumes and energies per atom, with NaN
+        predictions for structures that did not converge, or None if no data.
+    """
+    table_path = CALC_PATH / model_name / f"results_{pressure_label}.npz"
+    if table_path.exists():
+        return read_results_table(table_path)
+
+    csv_path = CALC_PATH / model_name / f"results_{pressure_label}.csv"
+    if not csv_path.exists():
+        return None
+    df = pd.read_csv(csv_path)
+    table = {
+        ID_COLUMN: df["mat_id"].astype(str).to_numpy(),
+        "converged": df["converged"].astype(bool).to_numpy(),
+    }
+    rows = {mat_id: i for i, mat_id in enumerate(table[ID_COLUMN])}
+    for key in INFO_KEYS:
+        table[key] = np.full(len(df), np.nan)
+
+    xyz_dir = CALC_PATH / model_name / pressure_label
+    for xyz_file in xyz_dir.glob("*.xyz"):
+        atoms = read_extxyz(xyz_file)
+        row = rows.get(xyz_file.stem)
+        if row is None:
+            continue
+        for key in INFO_KEYS:
+            value = atoms.info.get(key)
+            table[key][row] = np.nan if value is None else value
+    return table
+
+
+def _energy_outliers(results: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Get whether each structure has an outlying predicted energy.
+
+    Parameters
+    ----------
+    results
+        Results of all structures, as returned by `load_results_for_pressure`.
+
+    Returns
+    -------
+    np.ndarray
+        Whether the predicted energy per atom is outside the outlier range.
+    """
+    pred_e = results["pred_energy_per_atom"]
+    return (pred_e <= ENERGY_OUTLIER_MIN) | (pred_e >= ENERGY_OUTLIER_MAX)
+
 
 def get_converged_data_for_pressure(
     model_name: str, pressure_label: str
@@ -48,8 +128,7 @@ def get_converged_data_for_pressure(
     """
     Get converged volume and energy data for a model at a specific pressure.
 
-    Reads individual per-structure xyz files and copies them to the app data
-    directory. Filters energy outliers.
+    Filters energy outliers.
 
     Parameters
     ----------
@@ -63,8 +142,8 @@ def get_converged_data_for_pressure(
     dict[str, list]
         Labels (mat_ids) and lists of ref/pred volumes and energies.
     """
-    xyz_dir = CALC_PATH / model_name / pressure_label
-    if not xyz_dir.exists():
+    results = load_results_for_pressure(model_name, pressure_label)
+    if results is None:
         return {
             "labels": [],
             "ref_vol": [],
@@ -73,33 +152,31 @@ def get_converged_data_for_pressure(
             "pred_energy": [],
         }
 
-    app_dir = OUT_PATH / model_name / pressure_label
-    app_dir.mkdir(parents=True, exist_ok=True)
-
-    labels, ref_vol, pred_vol, ref_energy, pred_energy = [], [], [], [], []
-    for xyz_file in sorted(xyz_dir.glob("*.xyz")):
-        atoms = ase_read(xyz_file)
-        pred_e = atoms.info.get("pred_energy_per_atom")
-        if (
-            pred_e is None
-            or pred_e <= ENERGY_OUTLIER_MIN
-            or pred_e >= ENERGY_OUTLIER_MAX
-        ):
-            continue
-        labels.append(xyz_file.stem)
-        ref_vol.append(atoms.info["ref_volume_per_atom"])
-        pred_vol.append(atoms.info["pred_volume_per_atom"])
-        ref_energy.append(atoms.info["ref_energy_per_atom"])
-        pred_energy.append(pred_e)
-        # Copy structure to app data directory
-        ase_write(app_dir / xyz_file.name, atoms)
+    mask = np.isfinite(results["pred_energy_per_atom"]) & ~_energy_outliers(results)
+    order = np.argsort(results[ID_COLUMN][mask], kind="stable")
+
+    def column(key: str) -> list:
+        """
+        Get converged values of a column, sorted by mat_id.
+
+        Parameters
+        ----------
+        key
+            Column name.
+
+        Returns
+        -------
+        list
+            Values of converged structures.
+        """
+        return results[key][mask][order].tolist()
 
     return {
-        "labels": labels,
-        "ref_vol": ref_vol,
-        "pred_vol": pred_vol,
-        "ref_energy": ref_energy,
-        "pred_energy": pred_energy,
+        "labels": column(ID_COLUMN),
+        "ref_vol": column("ref_volume_per_atom"),
+        "pred_vol": column("pred_volume_per_atom"),
+        "ref_energy": column("ref_energy_per_atom"),
+        "pred_energy": column("pred_energy_per_atom"),
     }
 
 
@@ -149,26 +226,13 @@ def get_convergence_rate_for_pressure(
     float | None
         Convergence rate (%) or None if no data.
     """
-    csv_path = CALC_PATH / model_name / f"results_{pressure_label}.csv"
-    if not csv_path.exists():
-        return None
-    df = pd.read_csv(csv_path)
-    if df.empty:
+    results = load_results_for_pressure(model_name, pressure_label)
+    if results is None or not len(results[ID_COLUMN]):
         return None
 
-    n_total = len(df)
-    n_converged = int(df["converged"].sum())
-
+    n_total = len(results[ID_COLUMN])
     # Subtract converged structures whose energy is an outlier
-    xyz_dir = CALC_PATH / model_name / pressure_label
-    if xyz_dir.is_dir():
-        for xyz_file in xyz_dir.glob("*.xyz"):
-            atoms = ase_read(xyz_file)
-            pred_e = atoms.info.get("pred_energy_per_atom")
-            if pred_e is not None and (
-                pred_e <= ENERGY_OUTLIER_MIN or pred_e >= ENERGY_OUTLIER_MAX
-            ):
-                n_converged -= 1
+    n_converged = int(np.sum(results["converged"] & ~_energy_outliers(results)))
 
     return (n_converged / n_total) * 100
 
@@ -239,7 +303,8 @@ def _build_density_plot_for_pressure(
                 labels_list=model_stats["labels"],
                 ref_vals=model_stats[quantity]["ref"],
                 pred_vals=model_stats[quantity]["pred"],
-                struct_dir=OUT_PATH / model_name / pressure_label,
+                # Sampled structures are stored for the app from the calc outputs
+                struct_dir=CALC_PATH / model_name / pressure_label,
                 traj_dir=OUT_PATH / model_name / traj_dirname,
                 struct_filename_builder=lambda label: f"{label}.xyz",
             )
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import functools
+import hashlib
 import json
+import os
 from pathlib import Path
 import pickle
+import tempfile
 from typing import Any
 
 import ase
@@ -16,10 +21,17 @@ import pytest
 from sklearn.metrics import f1_score
 from tqdm import tqdm
 
+from ml_peg.analysis.utils.cache import (
+    CACHE_DIR_NAME,
+    ItemCache,
+    cache_per_model,
+    inputs_key,
+)
 from ml_peg.analysis.utils.decorators import build_table, cell_to_scatter
 from ml_peg.analysis.utils.utils import load_metrics_config, mae
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.parallel import parallel_map
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -29,6 +41,10 @@ REF_PATH = CALC_PATH / "DFT"
 OUT_PATH = APP_ROOT / "data" / "bulk_crystal" / "phonons"
 ASSETS_PATH = OUT_PATH.parent.parent / "assets" / "bulk_crystal" / "phonons"
 SCATTER_FILENAME = OUT_PATH / "phonon_interactive.json"
+# Directory of reference data packed into arrays
+REF_STORE_PATH = OUT_PATH / CACHE_DIR_NAME / "reference"
+# Version of the packed reference data format, to be incremented if it changes
+REF_STORE_VERSION = 1
 
 METRICS_CONFIG_PATH = Path(__file__).with_name("metrics.yml")
 DEFAULT_THRESHOLDS, DEFAULT_TOOLTIPS, DEFAULT_WEIGHTS = load_metrics_config(
@@ -49,77 +65,7 @@ BZ_COLUMN = "Avg BZ MAE"
 STABILITY_COLUMN = "Stability F1"
 STABILITY_THRESHOLD = -0.05 * THZ_TO_K
 T_300K_INDEX = 3  # Index for 300K in thermal properties (0, 75, 150, 300, 600)
-
-
-def _load_band_structure(file_path: Path) -> dict[str, Any] | None:
-    """
-    Load a serialized band-structure dataset.
-
-    Parameters
-    ----------
-    file_path
-        Absolute path to the ``npz`` file containing the band structure.
-
-    Returns
-    -------
-    dict[str, Any] | None
-        Parsed dictionary describing distances/frequencies, or ``None`` if the
-        file cannot be read.
-    """
-    try:
-        with open(file_path, "rb") as f:
-            return pickle.load(f)
-    except OSError as exc:
-        print(f"Failed to load band structure from {file_path}: {exc}")
-        return None
-
-
-def _load_dos(file_path: Path) -> tuple[np.ndarray, np.ndarray] | None:
-    """
-    Load frequencies and densities of states.
-
-    Parameters
-    ----------
-    file_path
-        Location of the ``npz`` file storing DOS data.
-
-    Returns
-    -------
-    tuple[np.ndarray, np.ndarray] | None
-        Pair of ``(frequency_points, total_dos)`` arrays, or ``None`` if the
-        file content could not be opened.
-    """
-    try:
-        with open(file_path, "rb") as f:
-            dos_dict = pickle.load(f)
-        return dos_dict["frequency_points"], dos_dict["total_dos"]
-    except OSError as exc:
-        print(f"Failed to load DOS from {file_path}: {exc}")
-        return None
-
-
-def _load_thermal_properties(file_path: Path) -> dict[str, Any] | None:
-    """
-    Load vibrational thermodynamic properties.
-
-    Parameters
-    ----------
-    file_path
-        Path to the JSON file containing entropy, free energy, and heat
-        capacity arrays.
-
-    Returns
-    -------
-    dict[str, Any] | None
-        Mapping of thermal quantities keyed by temperature, or ``None`` if the
-        JSON file is missing.
-    """
-    try:
-        with open(file_path, encoding="utf8") as f:
-            return json.load(f)
-    except OSError as exc:
-        print(f"Failed to load thermal properties from {file_path}: {exc}")
-        return None
+THERMAL_KEYS = ("entropy", "free_energy", "heat_capacity")
 
 
 def _get_mp_ids() -> list[str]:
@@ -245,276 +191,563 @@ def _stability_statistics(
     return f1_value, matrix
 
 
-@pytest.fixture
-def phonon_stats() -> dict[str, dict[str, Any]]:
+@dataclass(frozen=True)
+class _ReferenceStore:
     """
-    Aggregate phonon benchmark statistics per model.
+    Reference data of all systems, with band frequencies memory-mapped from disk.
 
-    Returns
-    -------
-    dict[str, dict[str, Any]]
-        Mapping of model display name to its metrics, BZ errors, and stability
-        summaries.
+    Band structures are stored as the concatenated, flattened frequencies of every
+    path segment. Each system's segments are found from `system_offsets`, which
+    indexes `segment_offsets` and `segment_shapes`.
+
+    Attributes
+    ----------
+    ids
+        Materials Project IDs of systems with complete reference data.
+    hashes
+        SHA-256 hash of the reference band structure and thermal properties files
+        of each system.
+    freq_stats
+        Maximum, average and minimum frequency of each system, in K.
+    thermal
+        Entropy, free energy and heat capacity of each system at 300 K.
+    frequencies
+        Frequencies of all segments, in THz, flattened and concatenated.
+    segment_offsets
+        Start of each segment in `frequencies`, followed by the total length.
+    segment_shapes
+        Number of q-points and branches of each segment. Segments which are not
+        2-D have -1 branches.
+    system_offsets
+        Index of the first segment of each system, followed by the number of
+        segments.
     """
-    OUT_PATH.mkdir(parents=True, exist_ok=True)
-    ASSETS_PATH.mkdir(parents=True, exist_ok=True)
 
-    mp_ids = _get_mp_ids()
-    if not mp_ids:
-        print("ERROR: No reference data found!")
-        print(f"Expected DFT reference files in: {REF_PATH}")
-        return {}
+    ids: np.ndarray
+    hashes: np.ndarray
+    freq_stats: np.ndarray
+    thermal: np.ndarray
+    frequencies: np.ndarray
+    segment_offsets: np.ndarray
+    segment_shapes: np.ndarray
+    system_offsets: np.ndarray
 
-    print(f"Found {len(mp_ids)} systems with reference data")
+    def __len__(self) -> int:
+        """
+        Get the number of systems.
 
-    # optimisation: Pre-load all reference data once (not per-model)
-    print("Pre-loading reference data...")
-    ref_cache: dict[str, dict[str, Any]] = {}
-    for mp_id in tqdm(mp_ids, desc="Loading reference data", leave=False):
-        ref_band_path = REF_PATH / f"{mp_id}_band_structure.npz"
-        ref_dos_path = REF_PATH / f"{mp_id}_dos.npz"
-        ref_thermal_path = REF_PATH / f"{mp_id}_thermal_properties.json"
-        ref_labels_path = REF_PATH / f"{mp_id}_labels.json"
-        ref_connections_path = REF_PATH / f"{mp_id}_connections.json"
-
-        ref_band = _load_band_structure(ref_band_path)
-        ref_dos = _load_dos(ref_dos_path)
-        ref_thermal = _load_thermal_properties(ref_thermal_path)
-        # Reuse JSON loader for band metadata
-        ref_labels = _load_thermal_properties(ref_labels_path)
-        ref_connections = _load_thermal_properties(ref_connections_path)
-
-        if all([ref_band, ref_dos, ref_thermal]):
-            # Add labels and connections to band structure dict
-            if ref_labels and ref_connections:
-                ref_band["labels"] = ref_labels
-                ref_band["path_connections"] = ref_connections
-
-            ref_cache[mp_id] = {
-                "band": ref_band,
-                "dos": ref_dos,
-                "thermal": ref_thermal,
-                "band_path": ref_band_path,
-                "dos_path": ref_dos_path,
-            }
+        Returns
+        -------
+        int
+            Number of systems.
+        """
+        return len(self.ids)
+
+    def get_segments(self, index: int) -> list[np.ndarray]:
+        """
+        Get the band structure segments of a system.
 
-    print(f"Loaded {len(ref_cache)} reference systems into memory\n")
+        Parameters
+        ----------
+        index
+            Index of the system.
 
-    stats: dict[str, dict[str, Any]] = {}
+        Returns
+        -------
+        list[np.ndarray]
+            Frequencies of each segment, in THz, as views of the memory-mapped
+            store.
+        """
+        segments = []
+        start, stop = self.system_offsets[index : index + 2]
+        for segment in range(start, stop):
+            offset, end = self.segment_offsets[segment : segment + 2]
+            shape = tuple(
+                int(size) for size in self.segment_shapes[segment] if size >= 0
+            )
+            segments.append(self.frequencies[offset:end].reshape(shape))
+        return segments
 
-    for model_name in tqdm(MODELS, desc="Processing models"):
-        print(f"\n Processing model: {model_name}")
-        model_dir = CALC_PATH / model_name
 
-        if not model_dir.exists():
-            print(f"Model directory not found: {model_dir}")
-            continue
+def _pack_reference_data(mp_ids: list[str]) -> Path:
+    """
+    Pack reference data for all systems into a store that can be memory-mapped.
 
-        metrics_data: dict[str, dict[str, Any]] = {
-            key: {"points": [], "ref": [], "pred": [], "mae": None}
-            for key in METRIC_LABELS
-        }
-        band_errors: dict[str, list[float]] = {}
-        stability_points: list[dict[str, Any]] = []
-
-        # Mean-of-means calculation: store mean per system, then average those means
-        system_mean_errors: list[float] = []
-
-        processed_count = 0
-        skipped_missing = 0
-        skipped_band_mismatch = 0
-        skipped_value_error = 0
-
-        for mp_id in tqdm(ref_cache.keys(), desc=f"  {model_name[:20]}", leave=False):
-            # optimisation: Use pre-loaded reference data
-            ref_data = ref_cache[mp_id]
-            ref_band = ref_data["band"]
-            ref_dos = ref_data["dos"]
-            ref_thermal = ref_data["thermal"]
-            ref_band_path = ref_data["band_path"]
-            ref_dos_path = ref_data["dos_path"]
-
-            # Load predicted data
-            pred_band_path = model_dir / f"{mp_id}_band_structure.npz"
-            pred_dos_path = model_dir / f"{mp_id}_dos.npz"
-            pred_thermal_path = model_dir / f"{mp_id}_thermal_properties.json"
-
-            pred_band = _load_band_structure(pred_band_path)
-            pred_dos = _load_dos(pred_dos_path)
-            pred_thermal = _load_thermal_properties(pred_thermal_path)
-
-            if not all([pred_band, pred_dos, pred_thermal]):
-                skipped_missing += 1
+    The store is only rebuilt if the reference files or `REF_STORE_VERSION` change,
+    and is read by `_load_reference_data`.
+
+    Parameters
+    ----------
+    mp_ids
+        Materials Project IDs of systems.
+
+    Returns
+    -------
+    Path
+        Directory of the store.
+    """
+    index_path = REF_STORE_PATH / "index.npz"
+    key = inputs_key([REF_PATH], mp_ids=mp_ids, version=REF_STORE_VERSION)
+    try:
+        with np.load(index_path, allow_pickle=False) as index:
+            if str(index["key"]) == key:
+                return REF_STORE_PATH
+    except (OSError, KeyError, ValueError):
+        pass
+
+    print("Packing reference data...")
+    REF_STORE_PATH.mkdir(parents=True, exist_ok=True)
+    columns: dict[str, list] = {
+        "ids": [],
+        "hashes": [],
+        "freq_stats": [],
+        "thermal": [],
+        "segment_offsets": [0],
+        "segment_shapes": [],
+        "system_offsets": [0],
+    }
+    with tempfile.NamedTemporaryFile(
+        dir=REF_STORE_PATH, prefix=".frequencies.", delete=False
+    ) as freqs_file:
+        for mp_id in tqdm(mp_ids, desc="Packing reference data", leave=False):
+            ref_band_path = REF_PATH / f"{mp_id}_band_structure.npz"
+            ref_dos_path = REF_PATH / f"{mp_id}_dos.npz"
+            ref_thermal_path = REF_PATH / f"{mp_id}_thermal_properties.json"
+            try:
+                band_bytes = ref_band_path.read_bytes()
+                thermal_bytes = ref_thermal_path.read_bytes()
+            except OSError as exc:
+                print(f"Failed to load reference data for {mp_id}: {exc}")
+                continue
+            if not ref_dos_path.exists():
+                print(f"Failed to load reference DOS for {mp_id}")
                 continue
 
-            processed_count += 1
+            ref_band = pickle.loads(band_bytes)
+            ref_thermal = json.loads(thermal_bytes)
 
-            # Calculate metrics
             ref_freqs = np.concatenate(ref_band["frequencies"]) * THZ_TO_K
-            pred_freqs = np.concatenate(pred_band["frequencies"]) * THZ_TO_K
-
-            max_freq_ref = float(np.max(ref_freqs))
-            max_freq_pred = float(np.max(pred_freqs))
-            avg_freq_ref = float(np.mean(ref_freqs))
-            avg_freq_pred = float(np.mean(pred_freqs))
-            min_freq_ref = float(np.min(ref_freqs))
-            min_freq_pred = float(np.min(pred_freqs))
-
-            s_ref = ref_thermal["entropy"][T_300K_INDEX]
-            s_pred = pred_thermal["entropy"][T_300K_INDEX]
-            f_ref = ref_thermal["free_energy"][T_300K_INDEX]
-            f_pred = pred_thermal["free_energy"][T_300K_INDEX]
-            cv_ref = ref_thermal["heat_capacity"][T_300K_INDEX]
-            cv_pred = pred_thermal["heat_capacity"][T_300K_INDEX]
-
-            # Store data paths for on the fly plot generation -> 10-100x speed increase
-            data_paths = {
-                "ref_band": str(ref_band_path.relative_to(CALC_PATH.parent)),
-                "ref_dos": str(ref_dos_path.relative_to(CALC_PATH.parent)),
-                "pred_band": str(pred_band_path.relative_to(CALC_PATH.parent)),
-                "pred_dos": str(pred_dos_path.relative_to(CALC_PATH.parent)),
-            }
+            columns["ids"].append(mp_id)
+            columns["hashes"].append(
+                hashlib.sha256(band_bytes + thermal_bytes).hexdigest()
+            )
+            columns["freq_stats"].append(
+                (np.max(ref_freqs), np.mean(ref_freqs), np.min(ref_freqs))
+            )
+            columns["thermal"].append(
+                [ref_thermal[key][T_300K_INDEX] for key in THERMAL_KEYS]
+            )
+            for segment in ref_band["frequencies"]:
+                segment = np.asarray(segment, dtype=np.float64)
+                if segment.ndim > 2:
+                    raise ValueError(f"Invalid band structure segment for {mp_id}")
+                freqs_file.write(segment.tobytes())
+                columns["segment_offsets"].append(
+                    columns["segment_offsets"][-1] + segment.size
+                )
+                columns["segment_shapes"].append(
+                    (len(segment), segment.shape[1] if segment.ndim == 2 else -1)
+                )
+            columns["system_offsets"].append(len(columns["segment_shapes"]))
+    os.replace(freqs_file.name, REF_STORE_PATH / "frequencies.bin")
+
+    with tempfile.NamedTemporaryFile(
+        dir=REF_STORE_PATH, prefix=".index.", suffix=".npz", delete=False
+    ) as index_file:
+        np.savez(
+            index_file,
+            key=np.array(key),
+            ids=np.array(columns["ids"], dtype=str),
+            hashes=np.array(columns["hashes"], dtype=str),
+            freq_stats=np.array(columns["freq_stats"], dtype=float).reshape(-1, 3),
+            thermal=np.array(columns["thermal"], dtype=float).reshape(-1, 3),
+            segment_offsets=np.array(columns["segment_offsets"], dtype=np.int64),
+            segment_shapes=np.array(columns["segment_shapes"], dtype=np.int64).reshape(
+                -1, 2
+            ),
+            system_offsets=np.array(columns["system_offsets"], dtype=np.int64),
+        )
+    os.replace(index_file.name, index_path)
 
-            # Store metric points
-            metric_values = {
-                "max_freq": (max_freq_ref, max_freq_pred),
-                "avg_freq": (avg_freq_ref, avg_freq_pred),
-                "min_freq": (min_freq_ref, min_freq_pred),
-                "S": (s_ref, s_pred),
-                "F": (f_ref, f_pred),
-                "C_V": (cv_ref, cv_pred),
-            }
+    print(f"Packed {len(columns['ids'])} reference systems\n")
+    return REF_STORE_PATH
 
-            for metric_key, (ref_val, pred_val) in metric_values.items():
-                metrics_data[metric_key]["ref"].append(ref_val)
-                metrics_data[metric_key]["pred"].append(pred_val)
-                metrics_data[metric_key]["points"].append(
-                    {
-                        "id": mp_id,
-                        "label": mp_id,
-                        "ref": ref_val,
-                        "pred": pred_val,
-                        "data_paths": data_paths,
-                    }
-                )
 
-            band_abs_diffs = []
-            skip_system = False
-            # Band structures are stored as a list of path segments; each segment is
-            # an array of shape ``(n_kpoints_in_segment, n_branches)``. We compare
-            # segment-by-segment to preserve the original Brillouin-path ordering.
-            for pred_segment, ref_segment in zip(
-                pred_band["frequencies"], ref_band["frequencies"], strict=False
+@functools.cache
+def _load_reference_data(store_path: Path) -> _ReferenceStore:
+    """
+    Load packed reference data, memory-mapping band frequencies.
+
+    Parameters
+    ----------
+    store_path
+        Directory of the store written by `_pack_reference_data`.
+
+    Returns
+    -------
+    _ReferenceStore
+        Reference data of each system with complete reference data.
+    """
+    with np.load(store_path / "index.npz", allow_pickle=False) as index:
+        arrays = {name: index[name] for name in index.files if name != "key"}
+    freqs_path = store_path / "frequencies.bin"
+    frequencies = (
+        np.memmap(freqs_path, dtype=np.float64, mode="r")
+        if freqs_path.stat().st_size
+        else np.empty(0)
+    )
+    return _ReferenceStore(frequencies=frequencies, **arrays)
+
+
+def _system_phonon_stats(
+    mp_id: str,
+    ref_segments: list[np.ndarray],
+    ref_freq_stats: np.ndarray,
+    ref_thermal: np.ndarray,
+    pred_band: dict[str, Any],
+    pred_thermal: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Compute phonon statistics of a single system for a single model.
+
+    Parameters
+    ----------
+    mp_id
+        Materials Project ID of system.
+    ref_segments
+        Reference frequencies of each band structure segment, in THz.
+    ref_freq_stats
+        Reference maximum, average and minimum frequency, in K.
+    ref_thermal
+        Reference entropy, free energy and heat capacity at 300 K.
+    pred_band
+        Predicted band structure.
+    pred_thermal
+        Predicted thermal properties.
+
+    Returns
+    -------
+    dict[str, Any]
+        Reference and predicted values of each metric, the mean band error, and the
+        ``status`` of the band comparison: ``"ok"``, ``"band_mismatch"`` or
+        ``"value_error"``.
+    """
+    pred_freqs = np.concatenate(pred_band["frequencies"]) * THZ_TO_K
+    max_freq_ref, avg_freq_ref, min_freq_ref = (float(val) for val in ref_freq_stats)
+    s_ref, f_ref, cv_ref = (float(val) for val in ref_thermal)
+
+    metric_values = {
+        "max_freq": (max_freq_ref, float(np.max(pred_freqs))),
+        "avg_freq": (avg_freq_ref, float(np.mean(pred_freqs))),
+        "min_freq": (min_freq_ref, float(np.min(pred_freqs))),
+        "S": (s_ref, pred_thermal["entropy"][T_300K_INDEX]),
+        "F": (f_ref, pred_thermal["free_energy"][T_300K_INDEX]),
+        "C_V": (cv_ref, pred_thermal["heat_capacity"][T_300K_INDEX]),
+    }
+    stats = {"metrics": metric_values, "band_error": float("nan"), "status": "ok"}
+
+    band_abs_diffs = []
+    # Band structures are stored as a list of path segments; each segment is
+    # an array of shape ``(n_kpoints_in_segment, n_branches)``. We compare
+    # segment-by-segment to preserve the original Brillouin-path ordering.
+    for pred_segment, ref_segment in zip(
+        pred_band["frequencies"], ref_segments, strict=False
+    ):
+        len_pred = len(pred_segment)
+        len_ref = len(ref_segment)
+        min_len = min(len_pred, len_ref)
+
+        pred_arr = np.array(pred_segment[:min_len])
+        ref_arr = np.array(ref_segment[:min_len])
+
+        try:
+            # within each segment of the BZ path, we have multiple branches.
+            # Both arrays are ``(n_kpoints, n_branches)``. The first
+            # dimension (points sampled along the path) can differ because we
+            # truncate to the shorter one, but the branch count (second axis)
+            # must match so each phonon mode is compared like-for-like.
+            if (
+                pred_arr.ndim == 2
+                and ref_arr.ndim == 2
+                and pred_arr.shape[1] != ref_arr.shape[1]
             ):
-                len_pred = len(pred_segment)
-                len_ref = len(ref_segment)
-                min_len = min(len_pred, len_ref)
-
-                pred_arr = np.array(pred_segment[:min_len])
-                ref_arr = np.array(ref_segment[:min_len])
-
-                try:
-                    # within each segment of the BZ path, we have multiple branches.
-                    # Both arrays are ``(n_kpoints, n_branches)``. The first
-                    # dimension (points sampled along the path) can differ because we
-                    # truncate to the shorter one, but the branch count (second axis)
-                    # must match so each phonon mode is compared like-for-like.
-                    if (
-                        pred_arr.ndim == 2
-                        and ref_arr.ndim == 2
-                        and pred_arr.shape[1] != ref_arr.shape[1]
-                    ):
-                        print(
-                            f"  Skipping {mp_id} due to band mismatch: "
-                            f"{pred_arr.shape} vs {ref_arr.shape}"
-                        )
-                        skip_system = True
-                        skipped_band_mismatch += 1
-                        break
-
-                    # When either array is not 2-D (e.g., flattened lists), we fall
-                    # back to straight subtraction; ``np.abs`` will raise ValueError if
-                    # the shapes are incompatible, and we skip that system entirely.
-                    abs_diff = np.abs(pred_arr - ref_arr) * THZ_TO_K
-                    band_abs_diffs.append(abs_diff)
-
-                except ValueError as e:
-                    # Skip entire system on ValueError
-                    print(f"  Skipping {mp_id} due to ValueError: {e}")
-                    skip_system = True
-                    skipped_value_error += 1
-                    break
-
-            # If system was skipped, don't include it in BZ MAE calculation
-            if skip_system:
-                print(f"No valid band differences for {mp_id}/{model_name}")
-                band_errors[mp_id] = float("nan")
-                continue  # Skip to next system without adding to system_mean_errors
-
-            # Calculate mean for this system and store for mean-of-means
-            if band_abs_diffs:
-                stacked = np.concatenate([arr.ravel() for arr in band_abs_diffs])
-                valid = stacked[np.isfinite(stacked)]
-                if valid.size:
-                    system_mean = float(np.nanmean(np.abs(valid)))
-                    band_errors[mp_id] = system_mean
-                    system_mean_errors.append(system_mean)  # For mean-of-means
-                else:
-                    band_errors[mp_id] = float("nan")
-                del stacked, band_abs_diffs
-            else:
-                print(f"No valid band differences for {mp_id}/{model_name}")
-                band_errors[mp_id] = float("nan")
+                print(
+                    f"  Skipping {mp_id} due to band mismatch: "
+                    f"{pred_arr.shape} vs {ref_arr.shape}"
+                )
+                stats["status"] = "band_mismatch"
+                return stats
+
+            # When either array is not 2-D (e.g., flattened lists), we fall
+            # back to straight subtraction; ``np.abs`` will raise ValueError if
+            # the shapes are incompatible, and we skip that system entirely.
+            abs_diff = np.abs(pred_arr - ref_arr) * THZ_TO_K
+            band_abs_diffs.append(abs_diff)
+
+        except ValueError as e:
+            # Skip entire system on ValueError
+            print(f"  Skipping {mp_id} due to ValueError: {e}")
+            stats["status"] = "value_error"
+            return stats
+
+    # Calculate mean for this system, for the mean-of-means
+    if band_abs_diffs:
+        stacked = np.concatenate([arr.ravel() for arr in band_abs_diffs])
+        valid = stacked[np.isfinite(stacked)]
+        if valid.size:
+            stats["band_error"] = float(np.nanmean(np.abs(valid)))
+
+    return stats
+
+
+@cache_per_model(
+    OUT_PATH / CACHE_DIR_NAME,
+    inputs=lambda model_name: [CALC_PATH / model_name, REF_PATH],
+)
+def model_phonon_stats(model_name: str, mp_ids: list[str]) -> dict[str, Any] | None:
+    """
+    Compute phonon benchmark statistics for a single model.
 
-            # Stability classification
-            stability_points.append(
+    Statistics of each system are cached by the hash of its reference and predicted
+    files, so only systems whose files change are recomputed.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    mp_ids
+        Materials Project IDs of systems with reference data.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Metrics, BZ errors, and stability summaries of the model, or `None` if the
+        model has no outputs.
+    """
+    print(f"\n Processing model: {model_name}")
+    model_dir = CALC_PATH / model_name
+
+    if not model_dir.exists():
+        print(f"Model directory not found: {model_dir}")
+        return None
+
+    ref_store = _load_reference_data(_pack_reference_data(mp_ids))
+    system_cache = ItemCache(
+        OUT_PATH / CACHE_DIR_NAME / "system_phonon_stats" / f"{model_name}.pkl",
+        source_file=__file__,
+    )
+
+    metrics_data: dict[str, dict[str, Any]] = {
+        key: {"points": [], "ref": [], "pred": [], "mae": None} for key in METRIC_LABELS
+    }
+    band_errors: dict[str, float] = {}
+    stability_points: list[dict[str, Any]] = []
+
+    # Mean-of-means calculation: store mean per system, then average those means
+    system_mean_errors: list[float] = []
+
+    processed_count = 0
+    skipped_missing = 0
+    skipped_band_mismatch = 0
+    skipped_value_error = 0
+
+    for index in tqdm(range(len(ref_store)), desc=f"  {model_name[:20]}", leave=False):
+        mp_id = str(ref_store.ids[index])
+        ref_band_path = REF_PATH / f"{mp_id}_band_structure.npz"
+        ref_dos_path = REF_PATH / f"{mp_id}_dos.npz"
+
+        # Load predicted data
+        pred_band_path = model_dir / f"{mp_id}_band_structure.npz"
+        pred_dos_path = model_dir / f"{mp_id}_dos.npz"
+        pred_thermal_path = model_dir / f"{mp_id}_thermal_properties.json"
+
+        try:
+            pred_band_bytes = pred_band_path.read_bytes()
+            pred_thermal_bytes = pred_thermal_path.read_bytes()
+        except OSError:
+            skipped_missing += 1
+            continue
+        if not pred_dos_path.exists():
+            skipped_missing += 1
+            continue
+
+        processed_count += 1
+
+        key = hashlib.sha256(
+            ref_store.hashes[index].encode() + pred_band_bytes + pred_thermal_bytes
+        ).hexdigest()
+        system_stats = system_cache.get(mp_id, key)
+        if system_stats is None:
+            system_stats = _system_phonon_stats(
+                mp_id,
+                ref_store.get_segments(index),
+                ref_store.freq_stats[index],
+                ref_store.thermal[index],
+                pickle.loads(pred_band_bytes),
+                json.loads(pred_thermal_bytes),
+            )
+            system_cache.set(mp_id, key, system_stats)
+
+        # Store data paths for on the fly plot generation -> 10-100x speed increase
+        data_paths = {
+            "ref_band": str(ref_band_path.relative_to(CALC_PATH.parent)),
+            "ref_dos": str(ref_dos_path.relative_to(CALC_PATH.parent)),
+            "pred_band": str(pred_band_path.relative_to(CALC_PATH.parent)),
+            "pred_dos": str(pred_dos_path.relative_to(CALC_PATH.parent)),
+        }
+
+        # Store metric points
+        for metric_key, (ref_val, pred_val) in system_stats["metrics"].items():
+            metrics_data[metric_key]["ref"].append(ref_val)
+            metrics_data[metric_key]["pred"].append(pred_val)
+            metrics_data[metric_key]["points"].append(
                 {
                     "id": mp_id,
                     "label": mp_id,
-                    "ref": min_freq_ref,
-                    "pred": min_freq_pred,
-                    "class": _classify_stability(min_freq_ref, min_freq_pred),
+                    "ref": ref_val,
+                    "pred": pred_val,
                     "data_paths": data_paths,
                 }
             )
 
-        # Calculate MAEs
-        for metric_key in METRIC_LABELS:
-            ref_vals = metrics_data[metric_key]["ref"]
-            pred_vals = metrics_data[metric_key]["pred"]
-            metrics_data[metric_key]["mae"] = (
-                mae(ref_vals, pred_vals) if ref_vals and pred_vals else None
-            )
+        band_errors[mp_id] = system_stats["band_error"]
 
-        # BZ mean error - mean-of-means (treats each material equally)
-        bz_mean = float(np.mean(system_mean_errors))
-
-        # Stability statistics
-        stability_f1, confusion = _stability_statistics(stability_points)
-
-        stats[model_name] = {
-            "model": model_name,
-            "metrics": metrics_data,
-            "band_errors": band_errors,
-            "bz_mean": bz_mean,
-            "stability": {
-                "points": stability_points,
-                "f1": stability_f1,
-                "confusion": confusion,
-            },
-        }
+        # If system was skipped, don't include it in BZ MAE calculation
+        if system_stats["status"] != "ok":
+            print(f"No valid band differences for {mp_id}/{model_name}")
+            if system_stats["status"] == "band_mismatch":
+                skipped_band_mismatch += 1
+            else:
+                skipped_value_error += 1
+            continue
 
-        total_skipped = skipped_missing + skipped_band_mismatch + skipped_value_error
-        print(
-            f"Completed {model_name}: {processed_count} processed, "
-            f"{total_skipped} skipped "
-            f"(missing data={skipped_missing}, band mismatch={skipped_band_mismatch}, "
-            f"value errors={skipped_value_error})"
+        if np.isfinite(system_stats["band_error"]):
+            system_mean_errors.append(system_stats["band_error"])
+        else:
+            print(f"No valid band differences for {mp_id}/{model_name}")
+
+        # Stability classification
+        min_freq_ref, min_freq_pred = system_stats["metrics"]["min_freq"]
+        stability_points.append(
+            {
+                "id": mp_id,
+                "label": mp_id,
+                "ref": min_freq_ref,
+                "pred": min_freq_pred,
+                "class": _classify_stability(min_freq_ref, min_freq_pred),
+                "data_paths": data_paths,
+            }
         )
 
+    system_cache.save()
+
+    # Calculate MAEs
+    for metric_key in METRIC_LABELS:
+        ref_vals = metrics_data[metric_key]["ref"]
+        pred_vals = metrics_data[metric_key]["pred"]
+        metrics_data[metric_key]["mae"] = (
+            mae(ref_vals, pred_vals) if ref_vals and pred_vals else None
+        )
+
+    # BZ mean error - mean-of-means (treats each material equally)
+    bz_mean = float(np.mean(system_mean_errors))
+
+    # Stability statistics
+    stability_f1, confusion = _stability_statistics(stability_points)
+
+    stats = {
+        "model": model_name,
+        "metrics": metrics_data,
+        "band_errors": band_errors,
+        "bz_mean": bz_mean,
+        "stability": {
+            "points": stability_points,
+            "f1": stability_f1,
+            "confusion": confusion,
+        },
+    }
+
+    total_skipped = skipped_missing + skipped_band_mismatch + skipped_value_error
+    print(
+        f"Completed {model_name}: {processed_count} processed, "
+        f"{total_skipped} skipped "
+        f"(missing data={skipped_missing}, band mismatch={skipped_band_mismatch}, "
+        f"value errors={skipped_value_error})"
+    )
+
     return stats
 
 
+def _model_phonon_stats_item(
+    model_name: str, _state: None, mp_ids: list[str]
+) -> dict[str, Any] | None:
+    """
+    Compute phonon benchmark statistics for a single model in a worker process.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    _state
+        Unused worker state.
+    mp_ids
+        Materials Project IDs of systems with reference data.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Statistics of the model from `model_phonon_stats`.
+    """
+    return model_phonon_stats(model_name, mp_ids)
+
+
+@pytest.fixture
+def phonon_stats(n_jobs: int) -> dict[str, dict[str, Any]]:
+    """
+    Aggregate phonon benchmark statistics per model.
+
+    Models are processed across `n_jobs` processes, sharing reference data packed
+    once into a memory-mapped store. Results for models whose outputs are unchanged
+    since the last analysis are loaded from the cache.
+
+    Parameters
+    ----------
+    n_jobs
+        Number of models to process in parallel.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Mapping of model display name to its metrics, BZ errors, and stability
+        summaries.
+    """
+    OUT_PATH.mkdir(parents=True, exist_ok=True)
+    ASSETS_PATH.mkdir(parents=True, exist_ok=True)
+
+    mp_ids = _get_mp_ids()
+    if not mp_ids:
+        print("ERROR: No reference data found!")
+        print(f"Expected DFT reference files in: {REF_PATH}")
+        return {}
+
+    print(f"Found {len(mp_ids)} systems with reference data")
+
+    # Pack reference data before starting workers, so it is only packed once
+    _pack_reference_data(mp_ids)
+
+    results = parallel_map(
+        functools.partial(_model_phonon_stats_item, mp_ids=mp_ids),
+        MODELS,
+        n_jobs=min(n_jobs, len(MODELS)),
+        desc="Processing models",
+    )
+    return {
+        model_name: model_stats
+        for model_name, model_stats in zip(MODELS, results, strict=True)
+        if model_stats is not None
+    }
+
+
 @pytest.fixture
 @build_table(
     filename=OUT_PATH / "phonon_metrics_table.json",
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ase.data import atomic_numbers
-from ase.geometry.rdf import get_rdf
 import ase.io as aio
 import numpy as np
 import pytest
-from tqdm import tqdm
 
 from ml_peg.analysis.utils.decorators import build_table, plot_scatter
+from ml_peg.analysis.utils.rdf import compute_partial_rdfs
 from ml_peg.analysis.utils.utils import load_metrics_config
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.molecular.utils.bmimcl_utils import BOND_CUTOFF
+from ml_peg.calcs.utils.md_monitors import read_failure
+from ml_peg.calcs.utils.trajectory import BinaryTrajectoryReader
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -30,12 +31,7 @@ DEFAULT_THRESHOLDS, DEFAULT_TOOLTIPS, DEFAULT_WEIGHTS = load_metrics_config(
 # RDF parameters
 ELEMENT1 = "Cl"
 ELEMENT2 = "C"
-Z1 = atomic_numbers[ELEMENT1]
-Z2 = atomic_numbers[ELEMENT2]
 BINS_PER_ANG = 50
-UNPHYSICAL_CUTOFF = 2.5
-# Angstrom - any Cl-C closer than this indicates
-# a bond which should not be there
 PEAK_THRESHOLD = 0.1  # g(r) threshold for bond detection
 
 
@@ -46,34 +42,30 @@ def compute_rdf_from_trajectory(traj_path: Path) -> tuple[np.ndarray, np.ndarray
     Parameters
     ----------
     traj_path
-        Path to trajectory xyz file.
+        Path to binary trajectory, or trajectory xyz file.
 
     Returns
     -------
     tuple[np.ndarray, np.ndarray]
         (r, rdf) arrays - distances and averaged g(r) values.
     """
-    images = aio.read(traj_path, index=":")
+    # Frames are read lazily, so the full trajectory is never held in memory
+    if traj_path.suffix == ".btraj":
+        images = BinaryTrajectoryReader(traj_path)
+        first = images[0]
+    else:
+        images = aio.iread(traj_path, index=":")
+        first = aio.read(traj_path, index=0)
 
     # Infer rmax from cell (NVT)
-    cell_lengths = images[0].cell.lengths()
+    cell_lengths = first.cell.lengths()
     rmax = min(cell_lengths) / 2 - 0.01
     nbins = int(rmax * BINS_PER_ANG)
 
-    # Compute RDFs with progress bar
-    rdfs = []
-    r = None
-    for atoms in tqdm(images, desc="Computing RDF"):
-        rdf_frame, distances = get_rdf(
-            atoms, rmax, nbins, elements=(Z1, Z2), no_dists=False
-        )
-        rdfs.append(rdf_frame)
-        if r is None:
-            r = distances
-
-    rdf = np.mean(rdfs, axis=0)
-
-    return r, rdf
+    r, rdfs = compute_partial_rdfs(
+        images, [(ELEMENT1, ELEMENT2)], rmax, nbins, desc="Computing RDF"
+    )
+    return r, rdfs[(ELEMENT1, ELEMENT2)]
 
 
 def check_bond_formation(r: np.ndarray, rdf: np.ndarray) -> int:
@@ -92,7 +84,7 @@ def check_bond_formation(r: np.ndarray, rdf: np.ndarray) -> int:
     int
         1 if bonds formed (bad), 0 if no bonds (good).
     """
-    mask = r < UNPHYSICAL_CUTOFF
+    mask = r < BOND_CUTOFF
     max_gr = rdf[mask].max() if mask.any() else 0.0
     return 1 if max_gr > PEAK_THRESHOLD else 0
 
@@ -119,7 +111,10 @@ def rdf_data() -> dict[str, list]:
     OUT_PATH.mkdir(parents=True, exist_ok=True)
 
     for model_name in MODELS:
-        traj_path = CALC_PATH / model_name / "md.xyz"
+        traj_path = CALC_PATH / model_name / "md.btraj"
+        if not traj_path.exists():
+            # Trajectories from older calculations
+            traj_path = traj_path.with_suffix(".xyz")
         if not traj_path.exists():
             continue
 
@@ -143,6 +138,10 @@ def bond_formation(rdf_data: dict[str, list]) -> dict[str, int]:
     """
     Check bond formation for all models.
 
+    Runs stopped early for any reason, such as Cl-C bond formation or NaN forces,
+    are flagged as failed regardless of the RDF, as the RDF of a shortened run does
+    not show whether bonds would have formed.
+
     Parameters
     ----------
     rdf_data
@@ -155,9 +154,10 @@ def bond_formation(rdf_data: dict[str, list]) -> dict[str, int]:
     """
     results = {}
     for model_name, (r, rdf) in rdf_data.items():
-        r_arr = np.array(r)
-        rdf_arr = np.array(rdf)
-        results[model_name] = check_bond_formation(r_arr, rdf_arr)
+        if read_failure(CALC_PATH / model_name / "failure.json") is not None:
+            results[model_name] = 1
+        else:
+            results[model_name] = check_bond_formation(np.array(r), np.array(rdf))
     return results
 
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 
 from ase import units
-from ase.io import read, write
 import numpy as np
 from numpy.typing import NDArray
 import pytest
@@ -14,6 +13,7 @@ from ml_peg.analysis.utils.decorators import build_table, plot_parity
 from ml_peg.analysis.utils.utils import build_dispersion_name_map, load_metrics_config
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.extxyz import read_extxyz, write_extxyz
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -57,7 +57,7 @@ def structure_info() -> dict[str, dict[str, float] | list | NDArray]:
             count = 0
             for system_path in sorted((CALC_PATH / model_name / subset).glob("*.xyz")):
                 count += 1
-                structs = read(system_path, index=":")
+                structs = read_extxyz(system_path, index=":")
                 info["subsets"].append(subset)
 
                 info["categories"].append(structs[0].info["category"])
@@ -113,7 +113,7 @@ def rel_energies() -> dict[str, list[float]]:
         count = 0
         for subset in [dir.name for dir in sorted((CALC_PATH / model_name).glob("*"))]:
             for system_path in sorted((CALC_PATH / model_name / subset).glob("*.xyz")):
-                structs = read(system_path, index=":")
+                structs = read_extxyz(system_path, index=":")
                 pred_rel_energy = 0
 
                 for struct in structs:
@@ -132,7 +132,7 @@ def rel_energies() -> dict[str, list[float]]:
                 # Write out all structs in system for app
                 structs_dir = OUT_PATH / model_name
                 structs_dir.mkdir(parents=True, exist_ok=True)
-                write(structs_dir / f"{count}.xyz", structs)
+                write_extxyz(structs_dir / f"{count}.xyz", structs)
                 count += 1
 
         ref_stored = True
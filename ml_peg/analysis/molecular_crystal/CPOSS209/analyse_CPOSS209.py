@@ -8,6 +8,7 @@ from ase import units
 from ase.io import read, write
 import pytest
 
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME, cache_per_model
 from ml_peg.analysis.utils.decorators import build_table, plot_parity
 from ml_peg.analysis.utils.utils import (
     build_dispersion_name_map,
@@ -87,6 +88,85 @@ def systems() -> list[str]:
     return INFO["systems"]
 
 
+@cache_per_model(
+    OUT_PATH / CACHE_DIR_NAME, inputs=lambda model_name: CALC_PATH / model_name
+)
+def model_structure_data(model_name: str, systems: list[str]) -> dict[str, dict]:
+    """
+    Read energies of the crystal and gas-phase structures for a single model.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    systems
+        List of CPOSS209 system names.
+
+    Returns
+    -------
+    dict[str, dict]
+        Energies of all gas-phase molecules, and energy, number of molecules,
+        molecular family and reference lattice energy of each crystal polymorph, for
+        each system.
+    """
+    model_dir = CALC_PATH / model_name
+    data = {}
+    for system in systems:
+        system_dir = model_dir / system
+
+        # Process all gas-phase molecule structures
+        molecule_energies = []
+        for molecule_file in sorted(system_dir.glob("gas*.xyz")):
+            molecule = read(molecule_file, 0)
+            molecule_energies.append(molecule.get_potential_energy())
+
+        # Process all crystal polymorph structures
+        crystals = []
+        for crystal_file in sorted(system_dir.glob("crystal*.xyz")):
+            crystal = read(crystal_file, 0)
+            crystals.append(
+                {
+                    "energy": crystal.get_potential_energy(),
+                    "num_molecules": crystal.info["num_molecules"],
+                    "molecular_family": crystal.info["molecular_family"],
+                    "ref": crystal.info["ref"],
+                }
+            )
+
+        data[system] = {"molecule_energies": molecule_energies, "crystals": crystals}
+    return data
+
+
+def write_app_structures(model_name: str, systems: list[str]) -> None:
+    """
+    Write structures for the app, if they are older than the calculations.
+
+    Structures are written even if energies are cached, so are restored if app data
+    is removed.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    systems
+        List of CPOSS209 system names.
+    """
+    for system in systems:
+        system_dir = CALC_PATH / model_name / system
+        out_dir = OUT_PATH / model_name / system
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for calc_file in sorted(system_dir.glob("gas*.xyz")) + sorted(
+            system_dir.glob("crystal*.xyz")
+        ):
+            struct_file = out_dir / calc_file.name
+            if (
+                struct_file.exists()
+                and struct_file.stat().st_mtime_ns >= calc_file.stat().st_mtime_ns
+            ):
+                continue
+            write(struct_file, read(calc_file, 0))
+
+
 @pytest.fixture
 def lattice_energies_raw(
     systems: list[str],
@@ -127,6 +207,7 @@ def lattice_energies_raw(
     - Energies are converted from eV to kcal/mol
     - Reference energies are stored from crystal.info["ref"]
     - Structure files are written to OUT_PATH for each model and system
+    - Energies are loaded from the cache for models whose outputs are unchanged
     """
     # Initialize result dictionaries: absolute and relative lattice energies
     results = {"ref": []} | {mlip: [] for mlip in MODELS}
@@ -155,32 +236,14 @@ def lattice_energies_raw(
         if not model_dir.exists():
             continue
 
+        # Energies of all structures, cached if unchanged since the last analysis
+        model_data = model_structure_data(model_name, systems)
+        write_app_structures(model_name, systems)
+
         # Process each system in the benchmark
         for system in systems:
-            system_dir = model_dir / system
-            # Find all crystal polymorph structure files
-            crystal_files = sorted(system_dir.glob("crystal*.xyz"))
-
-            # Find all gas-phase molecule structure files
-            molecule_files = sorted(system_dir.glob("gas*.xyz"))
-
-            # Process all gas-phase molecule structures to find minimum energy
-            molecule_energies = []
-            for molecule_file in molecule_files:
-                # Read molecule structure
-                molecule = read(system_dir / molecule_file, 0)
-
-                # Write molecule files to output directory for reference
-                out_dir = OUT_PATH / model_name / system
-                out_dir.mkdir(parents=True, exist_ok=True)
-                write(out_dir / molecule_file.name, molecule)
-
-                # Extract energy from structure
-                molecule_energy = molecule.get_potential_energy()
-                molecule_energies.append(molecule_energy)
-
             # Use lowest molecule energy as reference for lattice energy calculation
-            lowest_molecule_energy = min(molecule_energies)
+            lowest_molecule_energy = min(model_data[system]["molecule_energies"])
 
             # Calculate lattice energies for all polymorphs (only read files once)
             lattice_energies_list = []
@@ -188,18 +251,10 @@ def lattice_energies_raw(
             lattice_energies_families = []
             reference_lattice_energies_families = []
 
-            for crystal_file in crystal_files:
-                # Read crystal structure once
-                crystal = read(system_dir / crystal_file, 0)
-
-                # Write crystal files to output directory for reference
-                out_dir = OUT_PATH / model_name / system
-                out_dir.mkdir(parents=True, exist_ok=True)
-                write(out_dir / crystal_file.name, crystal)
-
+            for crystal in model_data[system]["crystals"]:
                 # Get crystal energy and number of molecules per unit cell
-                crystal_energy = crystal.get_potential_energy()
-                num_molecules = crystal.info["num_molecules"]
+                crystal_energy = crystal["energy"]
+                num_molecules = crystal["num_molecules"]
 
                 # Calculate lattice energy
                 # E_lattice = (E_crystal / n_molecules) - E_molecule
@@ -215,8 +270,8 @@ def lattice_energies_raw(
                 lattice_energies_list.append(lattice_energy_kcal)
 
                 # Track family for later per-family relative calculations
-                family = crystal.info["molecular_family"]
-                ref_energy = crystal.info["ref"] * KJ_PER_MOL_TO_KCAL_PER_MOL
+                family = crystal["molecular_family"]
+                ref_energy = crystal["ref"] * KJ_PER_MOL_TO_KCAL_PER_MOL
                 lattice_energies_families.append(family)
                 reference_lattice_energies_families.append(family)
 
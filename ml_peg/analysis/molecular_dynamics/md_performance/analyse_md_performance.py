@@ -0,0 +1,122 @@
+"""Analyse the throughput of molecular dynamics benchmarks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ml_peg.analysis.utils.decorators import build_table
+from ml_peg.analysis.utils.utils import build_dispersion_name_map, load_metrics_config
+from ml_peg.app import APP_ROOT
+from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.md_performance import read_performance_records
+from ml_peg.models.get_models import load_models
+from ml_peg.models.models import current_models
+
+MODELS = load_models(current_models)
+D3_MODEL_NAMES = build_dispersion_name_map(MODELS)
+
+# Output directories of benchmarks recording MD performance
+CALC_PATHS = {
+    "water_density": CALCS_ROOT / "molecular_dynamics" / "water_density" / "outputs",
+    "liquid_densities": CALCS_ROOT
+    / "molecular_dynamics"
+    / "liquid_densities"
+    / "outputs",
+    "BMIMCl_RDF": CALCS_ROOT / "molecular" / "BMIMCl_RDF" / "outputs",
+}
+OUT_PATH = APP_ROOT / "data" / "molecular_dynamics" / "md_performance"
+
+METRICS_CONFIG_PATH = Path(__file__).with_name("metrics.yml")
+DEFAULT_THRESHOLDS, DEFAULT_TOOLTIPS, DEFAULT_WEIGHTS = load_metrics_config(
+    METRICS_CONFIG_PATH
+)
+
+
+@pytest.fixture
+def performance_records() -> dict[str, list[dict[str, Any]]]:
+    """
+    Get performance records from all molecular dynamics benchmarks.
+
+    Returns
+    -------
+    dict[str, list[dict[str, Any]]]
+        Records for each model, labelled by benchmark and system.
+    """
+    results = {}
+    for model_name in MODELS:
+        records = []
+        for benchmark, calc_path in CALC_PATHS.items():
+            for path in sorted((calc_path / model_name).glob("*.perf.jsonl")):
+                system = path.name.removesuffix(".perf.jsonl")
+                records.extend(
+                    record | {"benchmark": benchmark, "system": system}
+                    for record in read_performance_records(path)
+                )
+        if records:
+            results[model_name] = records
+    return results
+
+
+@pytest.fixture
+@build_table(
+    filename=OUT_PATH / "md_performance_metrics_table.json",
+    metric_tooltips=DEFAULT_TOOLTIPS,
+    thresholds=DEFAULT_THRESHOLDS,
+    weights=DEFAULT_WEIGHTS,
+    mlip_name_map=D3_MODEL_NAMES,
+)
+def metrics(performance_records: dict[str, list[dict[str, Any]]]) -> dict[str, dict]:
+    """
+    Get all metrics.
+
+    Throughput is aggregated over all simulations of each model, weighting each by its
+    wall time.
+
+    Parameters
+    ----------
+    performance_records
+        Performance records for each model.
+
+    Returns
+    -------
+    dict[str, dict]
+        Metric names and values for all models.
+    """
+    results = {
+        "Speed": {},
+        "Throughput": {},
+        "Dispersion time": {},
+        "Integrator time": {},
+    }
+    for model_name, records in performance_records.items():
+        wall_time = sum(record["wall_time_s"] for record in records)
+        if not wall_time:
+            continue
+        simulated_ns = sum(
+            record["n_steps"] * record["timestep_fs"] * 1e-6 for record in records
+        )
+        atom_steps = sum(record["n_atoms"] * record["n_steps"] for record in records)
+        results["Speed"][model_name] = simulated_ns / (wall_time / 86400)
+        results["Throughput"][model_name] = atom_steps / wall_time
+        results["Dispersion time"][model_name] = (
+            100 * sum(record["dispersion_time_s"] for record in records) / wall_time
+        )
+        results["Integrator time"][model_name] = (
+            100 * sum(record["integrator_time_s"] for record in records) / wall_time
+        )
+    return results
+
+
+def test_md_performance(metrics: dict[str, dict]) -> None:
+    """
+    Run MD performance test.
+
+    Parameters
+    ----------
+    metrics
+        All new benchmark metric names and dictionary of values for each model.
+    """
+    return
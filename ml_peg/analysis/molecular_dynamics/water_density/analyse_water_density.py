@@ -16,6 +16,7 @@ from ml_peg.analysis.utils.utils import (
 )
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.md_monitors import read_failure
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
 
@@ -56,7 +57,7 @@ def labels() -> list:
     return []
 
 
-def compute_density(fname, density_col=13):
+def compute_density(fname, density_col=13, equilib_time_ps=EQUILIB_TIME_PS):
     """
     Compute average density from NPT log file.
 
@@ -66,6 +67,8 @@ def compute_density(fname, density_col=13):
         Path to the log file.
     density_col
         Which column the density numbers are in.
+    equilib_time_ps
+        Initial simulation time to omit, in ps. Default is `EQUILIB_TIME_PS`.
 
     Returns
     -------
@@ -79,7 +82,7 @@ def compute_density(fname, density_col=13):
             if len(items) != 15:
                 continue
             density_series.append(float(items[density_col]))
-    skip_frames = int(EQUILIB_TIME_PS / INTERVAL_PS)
+    skip_frames = round(equilib_time_ps / INTERVAL_PS)
     return np.mean(density_series[skip_frames:])
 
 
@@ -109,9 +112,22 @@ def water_density() -> dict[str, list]:
         for label in labels():
             atoms = Trajectory(CALC_PATH / model_name / f"{label}.traj")[-1]
 
-            results[model_name].append(
-                compute_density(CALC_PATH / model_name / f"{label}.log")
-            )
+            # Failed runs have no density, and runs stopped early use their
+            # detected equilibration time
+            convergence = atoms.info.get("density_convergence", {})
+            if read_failure(CALC_PATH / model_name / f"{label}.failure.json"):
+                results[model_name].append(np.nan)
+            else:
+                results[model_name].append(
+                    compute_density(
+                        CALC_PATH / model_name / f"{label}.log",
+                        equilib_time_ps=(
+                            convergence["equilibration_ps"]
+                            if convergence.get("converged")
+                            else EQUILIB_TIME_PS
+                        ),
+                    )
+                )
             if not ref_stored:
                 results["ref"].append(EXPERIMENTAL_DATA[label])
 
@@ -124,10 +140,13 @@ def water_density() -> dict[str, list]:
 
 
 @pytest.fixture
-def get_mae(water_density) -> dict[str, float]:
+def get_mae(water_density) -> dict[str, float | None]:
     """
     Get mean absolute error for water densities.
 
+    Models with any failed run have no MAE, so they are not scored on only the
+    systems that remained stable.
+
     Parameters
     ----------
     water_density
@@ -135,23 +154,53 @@ def get_mae(water_density) -> dict[str, float]:
 
     Returns
     -------
-    dict[str, float]
+    dict[str, float | None]
         Dictionary of predicted water density errors for all models.
     """
     results = {}
     for model_name in MODELS:
-        results[model_name] = mae(water_density["ref"], water_density[model_name])
+        predicted = np.asarray(water_density[model_name], dtype=float)
+        if predicted.size and np.isfinite(predicted).all():
+            results[model_name] = mae(water_density["ref"], predicted)
+        else:
+            results[model_name] = None
     return results
 
 
+@pytest.fixture
+def get_failed_runs(water_density) -> dict[str, int]:
+    """
+    Get number of failed runs for water densities.
+
+    Parameters
+    ----------
+    water_density
+        Dictionary of reference and predicted water densities.
+
+    Returns
+    -------
+    dict[str, int]
+        Dictionary of the number of failed runs for all models.
+    """
+    return {
+        model_name: int(
+            np.isnan(np.asarray(water_density[model_name], dtype=float)).sum()
+        )
+        for model_name in MODELS
+    }
+
+
 @pytest.fixture
 @build_table(
     filename=OUT_PATH / "water_density_metrics_table.json",
     metric_tooltips=DEFAULT_TOOLTIPS,
     thresholds=DEFAULT_THRESHOLDS,
+    weights=DEFAULT_WEIGHTS,
     mlip_name_map=D3_MODEL_NAMES,
 )
-def metrics(get_mae: dict[str, float]) -> dict[str, dict]:
+def metrics(
+    get_mae: dict[str, float | None], get_failed_runs: dict[str, int]
+) -> dict[str, dict]:
     """
     Get all metrics.
 
@@ -159,6 +208,8 @@ def metrics(get_mae: dict[str, float]) -> dict[str, dict]:
     ----------
     get_mae
         Mean absolute errors for all models.
+    get_failed_runs
+        Number of failed runs for all models.
 
     Returns
     -------
@@ -167,6 +218,7 @@ def metrics(get_mae: dict[str, float]) -> dict[str, dict]:
     """
     return {
         "MAE": get_mae,
+        "Failed runs": get_failed_runs,
     }
 
 
@@ -5,9 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 
 from ase import units
-from ase.io import read, write
 import pytest
 
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME, cache_per_model
 from ml_peg.analysis.utils.decorators import (
     build_table,
     plot_density_scatter,
@@ -20,6 +20,7 @@ from ml_peg.analysis.utils.utils import (
 )
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.extxyz import read_extxyz, write_extxyz
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
 
@@ -51,34 +52,87 @@ def labels() -> list:
     return labels
 
 
+@cache_per_model(
+    OUT_PATH / CACHE_DIR_NAME, inputs=lambda model_name: CALC_PATH / model_name
+)
+def model_interaction_energies(
+    model_name: str, system_labels: list[str]
+) -> tuple[list[float], list[float]]:
+    """
+    Get reference and predicted interaction energies for a single model.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    system_labels
+        Names of systems.
+
+    Returns
+    -------
+    tuple[list[float], list[float]]
+        Reference and predicted interaction energies for all systems.
+    """
+    ref_energies = []
+    pred_energies = []
+    for label in system_labels:
+        atoms = read_extxyz(CALC_PATH / model_name / f"{label}.xyz")
+        ref_energies.append(atoms.info["ref_int_energy"] * EV_TO_KCAL)
+        pred_energies.append(atoms.info["model_int_energy"] * EV_TO_KCAL)
+    return ref_energies, pred_energies
+
+
+def write_app_structures(model_name: str, system_labels: list[str]) -> None:
+    """
+    Write structures for the app, if they are older than the calculations.
+
+    Structures are written even if energies are cached, so are restored if app data
+    is removed.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    system_labels
+        Names of systems.
+    """
+    structs_dir = OUT_PATH / model_name
+    structs_dir.mkdir(parents=True, exist_ok=True)
+    for label in system_labels:
+        calc_file = CALC_PATH / model_name / f"{label}.xyz"
+        struct_file = structs_dir / f"{label}.xyz"
+        if (
+            struct_file.exists()
+            and struct_file.stat().st_mtime_ns >= calc_file.stat().st_mtime_ns
+        ):
+            continue
+        write_extxyz(struct_file, read_extxyz(calc_file))
+
+
 @pytest.fixture
 def interaction_energies() -> dict[str, list]:
     """
     Get interaction energies for all systems.
 
+    Results for models whose outputs are unchanged since the last analysis are loaded
+    from the cache.
+
     Returns
     -------
     dict[str, list]
         Dictionary of all reference and predicted interaction energies.
     """
     results = {"ref": []} | {mlip: [] for mlip in MODELS}
-
-    ref_stored = False
+    system_labels = labels()
 
     for model_name in MODELS:
-        for label in labels():
-            atoms = read(CALC_PATH / model_name / f"{label}.xyz")
-            if not ref_stored:
-                results["ref"].append(atoms.info["ref_int_energy"] * EV_TO_KCAL)
-
-            results[model_name].append(atoms.info["model_int_energy"] * EV_TO_KCAL)
-
-            # Write structures for app
-            structs_dir = OUT_PATH / model_name
-            structs_dir.mkdir(parents=True, exist_ok=True)
-            write(structs_dir / f"{label}.xyz", atoms)
-
-        ref_stored = True
+        ref_energies, results[model_name] = model_interaction_energies(
+            model_name, system_labels
+        )
+        write_app_structures(model_name, system_labels)
+        # Reference energies are the same for all models
+        if not results["ref"]:
+            results["ref"] = ref_energies
     return results
 
 
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+import warnings
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import stats
 from scipy.signal import find_peaks
 
 from ml_peg.analysis.utils.decorators import build_table, periodic_curve_gallery
 from ml_peg.analysis.utils.utils import load_metrics_config
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.parallel import parallel_map
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -46,136 +49,225 @@ def load_model_data(model_name: str) -> pd.DataFrame:
     return pd.read_csv(csv_path)
 
 
-def prepare_pair_series(
-    pair_dataframe: pd.DataFrame,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+def prepare_pair_arrays(
+    model_dataframe: pd.DataFrame,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Sort and align energy/force series for a diatomic pair.
+    Sort and align energy/force series of all diatomic pairs into arrays.
+
+    Each row holds one pair, sorted by decreasing distance, with pairs ordered by
+    name. Pairs with fewer than three distinct distances are excluded, and rows are
+    padded with NaN to the length of the longest curve.
 
     Parameters
     ----------
-    pair_dataframe
-        Pair-specific dataframe.
+    model_dataframe
+        Per-model diatomic dataset.
 
     Returns
     -------
-    tuple[np.ndarray, np.ndarray, np.ndarray]
-        Distances, shifted energies, and projected forces sorted by decreasing
-        distance.
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Distances, shifted energies and projected forces, each with shape
+        ``(n_pairs, n_distances)``, and the number of distances of each pair.
     """
-    df_sorted = pair_dataframe.sort_values("distance").drop_duplicates("distance")
-    series = df_sorted[["distance", "energy", "force_parallel"]].to_numpy()
-    if len(series) < 3:
-        return np.array([]), np.array([]), np.array([])
+    df_sorted = model_dataframe.sort_values(
+        ["pair", "distance"], kind="stable"
+    ).drop_duplicates(["pair", "distance"])
+    codes, _ = pd.factorize(df_sorted["pair"], sort=True)
+    series = df_sorted[["distance", "energy", "force_parallel"]].to_numpy(dtype=float)
+
+    counts = np.bincount(codes)
+    starts = np.cumsum(counts) - counts
+    keep = counts[codes] >= 3
+    if not np.any(keep):
+        empty = np.empty((0, 0))
+        return empty, empty, empty, np.empty(0, dtype=int)
+
+    # Renumber kept pairs, and place each in its row by decreasing distance
+    rows = (np.cumsum(counts >= 3) - 1)[codes[keep]]
+    lengths = counts[counts >= 3]
+    columns = counts[codes] - 1 - (np.arange(len(codes)) - starts[codes])
+    columns = columns[keep]
+
+    arrays = np.full((3, len(lengths), lengths.max()), np.nan)
+    arrays[:, rows, columns] = series[keep].T
+    distances, energies, forces = arrays
+
+    shifted_energies = energies - energies[:, :1]
+    return distances, shifted_energies, forces, lengths
+
+
+def gradient_rows(
+    values: np.ndarray, coords: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    """
+    Compute `np.gradient` along each row of curves padded to the same length.
 
-    distances = series[:, 0]
-    energies = series[:, 1]
-    forces = series[:, 2]
+    Parameters
+    ----------
+    values
+        Values of each curve, with shape ``(n_curves, n_points)``.
+    coords
+        Coordinates of each value, with the same shape as `values`.
+    lengths
+        Number of points of each curve, which must be at least two.
 
-    descending = np.argsort(distances)[::-1]
-    distances = distances[descending]
-    energies = energies[descending]
-    forces = forces[descending]
+    Returns
+    -------
+    np.ndarray
+        Gradient of each curve, matching `np.gradient` for each row, with NaN
+        beyond the length of the curve.
+    """
+    rows = np.arange(len(values))
+    last = lengths - 1
+    gradient = np.full_like(values, np.nan)
+    if values.shape[1] < 2:
+        return gradient
+
+    dx = np.diff(coords, axis=1)
+    valid_dx = np.arange(dx.shape[1]) < last[:, None]
+    uniform = np.all((dx == dx[:, :1]) | ~valid_dx, axis=1)
+
+    # Second-order central differences for interior points, as in `np.gradient`
+    dx1 = dx[:, :-1]
+    dx2 = dx[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = -(dx2) / (dx1 * (dx1 + dx2))
+        b = (dx2 - dx1) / (dx1 * dx2)
+        c = dx1 / (dx2 * (dx1 + dx2))
+        gradient[:, 1:-1] = a * values[:, :-2] + b * values[:, 1:-1] + c * values[:, 2:]
+        gradient[uniform, 1:-1] = (values[uniform, 2:] - values[uniform, :-2]) / (
+            2.0 * dx[uniform, :1]
+        )
 
-    shifted_energies = energies - energies[0]
-    return distances, shifted_energies, forces
+    # First-order differences at the ends of each curve
+    gradient[:, 0] = (values[:, 1] - values[:, 0]) / dx[:, 0]
+    gradient[rows, last] = (values[rows, last] - values[rows, last - 1]) / dx[
+        rows, last - 1
+    ]
+    return gradient
 
 
-def count_sign_changes(array: np.ndarray, tol: float) -> int:
+def count_sign_changes_rows(values: np.ndarray, tol: float) -> np.ndarray:
     """
-    Count sign changes in a sequence while ignoring small magnitudes.
+    Count sign changes along each row while ignoring small magnitudes.
 
     Parameters
     ----------
-    array
-        Input values.
+    values
+        Input values, with shape ``(n_curves, n_points)``. NaN values are ignored.
     tol
         Absolute tolerance below which values are treated as zero.
 
     Returns
     -------
-    int
-        Number of sign changes exceeding the specified tolerance.
+    np.ndarray
+        Number of sign changes exceeding the specified tolerance in each row.
     """
-    if array.size < 3:
-        return 0
-    clipped = array.copy()
-    clipped = clipped[np.abs(clipped) > tol]
-    signs = np.sign(clipped)
-    sign_flips = signs[:-1] != signs[1:]
-    return int(np.sum(sign_flips))
+    significant = np.abs(values) > tol
+    rows = np.nonzero(significant)[0]
+    signs = np.sign(values[significant])
+    sign_flips = (signs[:-1] != signs[1:]) & (rows[:-1] == rows[1:])
+    return np.bincount(rows[1:][sign_flips], minlength=len(values))
 
 
-def compute_pair_metrics(
-    df_pair: pd.DataFrame,
-) -> dict[str, float] | None:
+def spearman_rows(x: np.ndarray, y: np.ndarray, mask: np.ndarray) -> np.ndarray:
     """
-    Compute diagnostics for a single diatomic pair.
+    Compute the Spearman correlation of the masked segment of each row.
 
     Parameters
     ----------
-    df_pair
-        Pair-specific dataframe.
+    x, y
+        Values to correlate, with shape ``(n_curves, n_points)``.
+    mask
+        Whether each point is part of the segment of its row.
 
     Returns
     -------
-    dict[str, float] | None
-        Dictionary of metrics, or None if insufficient data.
-    """
-    distances, shifted_energies, projected_forces = prepare_pair_series(df_pair)
-    if distances.size < 3:
-        return None
-
-    energy_gradient = np.gradient(shifted_energies, distances)
-    energy_curvature = np.gradient(energy_gradient, distances)
-
-    # Energy minima: count gradient sign changes from negative to positive
-    # Filter small gradients (< 0.01 eV/Å) to avoid counting noise as minima
-    minima = 0
-    if energy_gradient.size >= 2:
-        # Find minima (invert the signal)
-        minima_indices, properties = find_peaks(
-            -shifted_energies,
-            prominence=0.1,  # Very small prominence catches shallow minima
-            width=1,  # Require at least 1 point width
-        )
-        minima = len(minima_indices)
-
-    inflections = count_sign_changes(energy_curvature, tol=0.5)
-
-    # Force flip calculation: count sign changes in projected forces
-    # Use tolerance of 0.01 eV/Å to ignore numerical noise
-    force_flip_count = count_sign_changes(projected_forces, tol=1e-2)
-
-    spearman_repulsion = np.nan
-    spearman_attraction = np.nan
+    np.ndarray
+        Spearman correlation of each row, matching `scipy.stats.spearmanr`, or NaN
+        if the segment has fewer than two points, constant values or NaN.
+    """
+    n_points = mask.sum(axis=1)
+    ranks = []
+    for values in (x, y):
+        # Points outside the segment are ranked last, so do not affect the ranks
+        row_ranks = stats.rankdata(np.where(mask, values, np.inf), axis=1)
+        means = np.where(mask, row_ranks, 0.0).sum(axis=1) / n_points
+        ranks.append(np.where(mask, row_ranks - means[:, None], 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dof = n_points - 1
+        cov = np.sum(ranks[0] * ranks[1], axis=1) / dof
+        std_x = np.sqrt(np.sum(ranks[0] ** 2, axis=1) / dof)
+        std_y = np.sqrt(np.sum(ranks[1] ** 2, axis=1) / dof)
+        correlation = np.clip(cov / std_x / std_y, -1.0, 1.0)
+    correlation[n_points < 2] = np.nan
+    return correlation
+
+
+def compute_pair_metrics(model_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute diagnostics for all diatomic pairs of a model.
 
-    try:
-        from scipy import stats
+    Parameters
+    ----------
+    model_dataframe
+        Per-model diatomic dataset.
 
-        well_index = int(np.argmin(shifted_energies))
-        if distances[well_index:].size > 1:
-            spearman_repulsion = float(
-                stats.spearmanr(
-                    distances[well_index:], shifted_energies[well_index:]
-                ).statistic
-            )
-        if distances[:well_index].size > 1:
-            spearman_attraction = float(
-                stats.spearmanr(
-                    distances[:well_index], shifted_energies[:well_index]
-                ).statistic
+    Returns
+    -------
+    pd.DataFrame
+        Metrics of each pair with at least three distances, ordered by pair.
+    """
+    distances, shifted_energies, projected_forces, lengths = prepare_pair_arrays(
+        model_dataframe
+    )
+    if not len(lengths):
+        return pd.DataFrame(columns=list(DEFAULT_THRESHOLDS))
+
+    energy_gradient = gradient_rows(shifted_energies, distances, lengths)
+    energy_curvature = gradient_rows(energy_gradient, distances, lengths)
+
+    # Energy minima: find peaks of the inverted energy of each pair
+    minima = np.array(
+        [
+            len(
+                find_peaks(
+                    -shifted_energies[row, :length],
+                    prominence=0.1,  # Very small prominence catches shallow minima
+                    width=1,  # Require at least 1 point width
+                )[0]
             )
-    except Exception:
-        pass
+            for row, length in enumerate(lengths)
+        ]
+    )
 
-    return {
-        "Force flips": float(force_flip_count),
-        "Energy minima": float(minima),
-        "Energy inflections": float(inflections),
-        "ρ(E, repulsion)": float(spearman_repulsion),
-        "ρ(E, attraction)": float(spearman_attraction),
-    }
+    inflections = count_sign_changes_rows(energy_curvature, tol=0.5)
+
+    # Force flip calculation: count sign changes in projected forces
+    # Use tolerance of 0.01 eV/Å to ignore numerical noise
+    force_flip_count = count_sign_changes_rows(projected_forces, tol=1e-2)
+
+    # Padding is placed after the well, as with `np.argmin` for each curve
+    columns = np.arange(distances.shape[1])
+    in_curve = columns < lengths[:, None]
+    well_index = np.argmin(np.where(in_curve, shifted_energies, np.inf), axis=1)
+    after_well = columns >= well_index[:, None]
+    spearman_repulsion = spearman_rows(
+        distances, shifted_energies, in_curve & after_well
+    )
+    spearman_attraction = spearman_rows(distances, shifted_energies, ~after_well)
+
+    return pd.DataFrame(
+        {
+            "Force flips": force_flip_count.astype(float),
+            "Energy minima": minima.astype(float),
+            "Energy inflections": inflections.astype(float),
+            "ρ(E, repulsion)": spearman_repulsion,
+            "ρ(E, attraction)": spearman_attraction,
+        }
+    )
 
 
 def aggregate_model_metrics(
@@ -197,21 +289,37 @@ def aggregate_model_metrics(
     if model_dataframe.empty:
         return {}
 
-    pair_metrics: list[dict[str, float]] = []
+    pair_metrics = compute_pair_metrics(model_dataframe)
+    if pair_metrics.empty:
+        return {}
 
-    for _pair, pair_dataframe in model_dataframe.groupby("pair"):
-        metrics = compute_pair_metrics(pair_dataframe)
-        if metrics is None:
-            continue
-        pair_metrics.append(metrics)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return {
+            key: float(np.nanmean(pair_metrics[key].to_numpy()))
+            for key in DEFAULT_THRESHOLDS.keys()
+        }
 
-    if not pair_metrics:
-        return {}
 
-    return {
-        key: float(np.nanmean([metrics.get(key, np.nan) for metrics in pair_metrics]))
-        for key in DEFAULT_THRESHOLDS.keys()
-    }
+def _aggregate_model_metrics_item(
+    model_dataframe: pd.DataFrame, _state: None
+) -> dict[str, float]:
+    """
+    Aggregate metrics of a model in a worker process.
+
+    Parameters
+    ----------
+    model_dataframe
+        Per-model diatomic dataset.
+    _state
+        Unused worker state.
+
+    Returns
+    -------
+    dict[str, float]
+        Aggregated model metrics from `aggregate_model_metrics`.
+    """
+    return aggregate_model_metrics(model_dataframe)
 
 
 # helper to load per-model pair data -----------------------------------------
@@ -260,20 +368,26 @@ def persist_diatomics_pair_data() -> dict[str, pd.DataFrame]:
 
 
 @pytest.fixture
-def diatomics_pair_data_fixture() -> dict[str, pd.DataFrame]:
+def diatomics_pair_data_fixture(n_jobs: int) -> dict[str, pd.DataFrame]:
     """
     Load curve data and persist gallery assets for pytest use.
 
+    Parameters
+    ----------
+    n_jobs
+        Number of models to write curve payloads for in parallel.
+
     Returns
     -------
     dict[str, pd.DataFrame]
         Mapping of model name to per-pair curve data.
     """
-    return persist_diatomics_pair_data()
+    return persist_diatomics_pair_data(n_jobs=n_jobs)
 
 
 def collect_metrics(
     pair_data: dict[str, pd.DataFrame] | None = None,
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     """
     Gather metrics for all models.
@@ -285,6 +399,8 @@ def collect_metrics(
     pair_data
         Optional mapping of model names to curve dataframes. When ``None``,
         the data is loaded via ``persist_diatomics_pair_data``.
+    n_jobs
+        Number of models to process in parallel. Default is 1.
 
     Returns
     -------
@@ -297,8 +413,13 @@ def collect_metrics(
 
     data = pair_data if pair_data is not None else persist_diatomics_pair_data()
 
-    for model_name, model_dataframe in data.items():
-        metrics = aggregate_model_metrics(model_dataframe)
+    model_metrics = parallel_map(
+        _aggregate_model_metrics_item,
+        list(data.values()),
+        n_jobs=min(n_jobs, len(data)),
+        desc="Diatomics metrics",
+    )
+    for model_name, metrics in zip(data, model_metrics, strict=True):
         row = {"Model": model_name} | metrics
         metrics_rows.append(row)
 
@@ -310,6 +431,7 @@ def collect_metrics(
 @pytest.fixture
 def diatomics_collection(
     diatomics_pair_data_fixture: dict[str, pd.DataFrame],
+    n_jobs: int,
 ) -> pd.DataFrame:
     """
     Collect diatomics metrics across all models.
@@ -318,13 +440,15 @@ def diatomics_collection(
     ----------
     diatomics_pair_data_fixture
         Mapping of model names to curve dataframes generated by the fixture.
+    n_jobs
+        Number of models to process in parallel.
 
     Returns
     -------
     pd.DataFrame
         Aggregated metrics dataframe.
     """
-    return collect_metrics(diatomics_pair_data_fixture)
+    return collect_metrics(diatomics_pair_data_fixture, n_jobs=n_jobs)
 
 
 @pytest.fixture
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 from ase import Atoms
 import ase.io
@@ -14,10 +16,13 @@ import pytest
 from scipy.optimize import curve_fit
 import yaml
 
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME, cache_per_model
 from ml_peg.analysis.utils.decorators import build_table
 from ml_peg.analysis.utils.utils import load_metrics_config, mae
 from ml_peg.app import APP_ROOT
 from ml_peg.calcs import CALCS_ROOT
+from ml_peg.calcs.utils.extxyz import read_extxyz
+from ml_peg.calcs.utils.parallel import parallel_map
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -36,25 +41,27 @@ ORIENTATIONS = DATABASE_INFO["orientations"]
 STRAINS = DATABASE_INFO["strains"]
 
 
-def get_molecule_distance(sys: Atoms) -> float:
+def get_molecule_distances(frames: Sequence[Atoms]) -> np.ndarray:
     """
-    Compute distance of water molecule from graphene sheet for one configuration.
+    Compute distance of water molecule from graphene sheet for each configuration.
 
     Parameters
     ----------
-    sys
-        Single frame of water molecule + graphene system.
+    frames
+        Frames of water molecule + graphene system, with the same atoms in each.
 
     Returns
     -------
-    float
-        Water molecule distance.
+    np.ndarray
+        Water molecule distance for each frame.
     """
-    assert np.sum(sys.symbols == "O") == 1
-    assert np.sum(sys.symbols == "C") > 1
-    oxygens = sys.positions[sys.symbols == "O"]
-    carbons = sys.positions[sys.symbols == "C"]
-    return oxygens[0, 2] - np.mean(carbons[:, 2])
+    numbers = frames[0].numbers
+    assert all(np.array_equal(atoms.numbers, numbers) for atoms in frames)
+    assert np.sum(numbers == 8) == 1
+    assert np.sum(numbers == 6) > 1
+    heights = np.array([atoms.positions[:, 2] for atoms in frames])
+    oxygen_heights = heights[:, numbers == 8][:, 0]
+    return oxygen_heights - np.mean(heights[:, numbers == 6], axis=1)
 
 
 def morse_potential(r: np.ndarray, de: float, a: float, re: float) -> np.ndarray:
@@ -110,8 +117,9 @@ def mie_potential(
 
 
 def get_binding_parameters(
-    distances: list[float], adsorption_energies: list[float]
-) -> tuple[float, float, float]:
+    distances: list[float] | np.ndarray,
+    adsorption_energies: list[float] | np.ndarray,
+) -> tuple[float, float]:
     """
     Compute best-fit parameters for adsorption energy curve.
 
@@ -176,89 +184,180 @@ def get_binding_parameters(
     return depth, re
 
 
-@pytest.fixture
-def processed_data() -> dict[str, list]:
+def fit_binding_curves(distances: np.ndarray, energies: np.ndarray) -> np.ndarray:
     """
-    Gather and process all data for all systems.
+    Compute best-fit parameters for a batch of adsorption energy curves.
+
+    Parameters
+    ----------
+    distances
+        Water molecule distances shared by all curves.
+    energies
+        Adsorption energies, with the final axis corresponding to `distances`.
+
+    Returns
+    -------
+    np.ndarray
+        Potential well depth and equilibrium length of each curve, with shape
+        ``energies.shape[:-1] + (2,)``.
+    """
+    curves = energies.reshape(-1, energies.shape[-1])
+    params = np.array(
+        [get_binding_parameters(distances, curve) for curve in curves], dtype=float
+    )
+    return params.reshape(*energies.shape[:-1], 2)
+
+
+@cache_per_model(
+    OUT_PATH / CACHE_DIR_NAME,
+    inputs=lambda model_name: CALC_PATH / model_name,
+)
+def model_binding_curves(model_name: str) -> dict[str, np.ndarray] | None:
+    """
+    Load adsorption energy curves of a model and fit their binding parameters.
+
+    Each configuration file is read once. Distances are computed from the first
+    orientation and strain, and shared by all curves.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+
+    Returns
+    -------
+    dict[str, np.ndarray] | None
+        Distances, and reference and predicted adsorption energies in meV with shape
+        ``(orientations, strains, distances)``, and fitted binding parameters of the
+        predicted curves, or `None` if the model has no outputs.
+    """
+    model_dir = CALC_PATH / model_name
+    if not model_dir.exists():
+        return None
+
+    distances = None
+    ref_energies = []
+    energies = []
+    for orientation in ORIENTATIONS:
+        for strain in STRAINS:
+            frames = read_extxyz(model_dir / f"{orientation}_{strain}.xyz", index=":")
+            if distances is None:
+                distances = get_molecule_distances(frames)
+            ref_energies.append(
+                [atoms.info["ref_adsorption_energy"] * 1000.0 for atoms in frames]
+            )
+            energies.append(
+                [atoms.info["mlip_adsorption_energy"] * 1000.0 for atoms in frames]
+            )
+
+    shape = (len(ORIENTATIONS), len(STRAINS), len(distances))
+    energies = np.array(energies).reshape(shape)
+    return {
+        "distances": distances,
+        "ref_energies": np.array(ref_energies).reshape(shape),
+        "energies": energies,
+        "params": fit_binding_curves(distances, energies),
+    }
+
+
+def _model_binding_curves_item(
+    model_name: str, _state: None
+) -> dict[str, np.ndarray] | None:
+    """
+    Load and fit adsorption energy curves of a model in a worker process.
+
+    Parameters
+    ----------
+    model_name
+        Name of model.
+    _state
+        Unused worker state.
 
     Returns
     -------
-    dict[str, list | dict[str, dict[str, dict[str, dict[str, list | tuple]]]]]
-        Dictionary of all processed data.
+    dict[str, np.ndarray] | None
+        Curves and binding parameters of the model from `model_binding_curves`.
+    """
+    return model_binding_curves(model_name)
+
+
+def write_app_structures(model_dir: Path) -> None:
+    """
+    Write configurations for the app, if they are older than the calculations.
+
+    Parameters
+    ----------
+    model_dir
+        Directory of calculation outputs to copy configurations from.
     """
-    results = {"distances": [], "ref": {}} | {model: {} for model in MODELS}
-    ref_stored = False
-    dist_stored = False
     struct_write_dir = OUT_PATH / "structs"
     struct_write_dir.mkdir(parents=True, exist_ok=True)
+    for orientation in ORIENTATIONS:
+        for strain in STRAINS:
+            calc_file = model_dir / f"{orientation}_{strain}.xyz"
+            struct_file = struct_write_dir / f"{orientation}_{strain}.xyz"
+            if (
+                struct_file.exists()
+                and struct_file.stat().st_mtime_ns >= calc_file.stat().st_mtime_ns
+            ):
+                continue
+            ase.io.write(struct_file, read_extxyz(calc_file, index=":"), format="xyz")
 
-    for model in MODELS:
-        model_dir = CALC_PATH / model
-        if not model_dir.exists():
-            continue
 
-        for orientation in ORIENTATIONS:
-            if not ref_stored:
-                results["ref"][orientation] = {}
-            results[model][orientation] = {}
-
-            for strain in STRAINS:
-                if not ref_stored:
-                    results["ref"][orientation][strain] = {
-                        "energies": [],
-                    }
-                results[model][orientation][strain] = {
-                    "energies": [],
-                }
-
-                systems = ase.io.iread(
-                    model_dir / f"{orientation}_{strain}.xyz",
-                    index=":",
-                    format="extxyz",
-                )
+@pytest.fixture
+def processed_data(n_jobs: int) -> dict[str, Any]:
+    """
+    Gather and process all data for all systems.
 
-                if not ref_stored:
-                    (struct_write_dir / f"{orientation}_{strain}.xyz").unlink(
-                        missing_ok=True
-                    )
-
-                for atoms in systems:
-                    dist = get_molecule_distance(atoms)
-                    if not dist_stored:
-                        results["distances"].append(dist)
-                    if not ref_stored:
-                        results["ref"][orientation][strain]["energies"].append(
-                            atoms.info["ref_adsorption_energy"] * 1000.0
-                        )
-                    results[model][orientation][strain]["energies"].append(
-                        atoms.info["mlip_adsorption_energy"] * 1000.0
-                    )
-
-                    if not ref_stored:
-                        ase.io.write(
-                            struct_write_dir / f"{orientation}_{strain}.xyz",
-                            atoms,
-                            format="xyz",
-                            append=True,
-                        )
-
-                if not ref_stored:
-                    results["ref"][orientation][strain]["params"] = (
-                        get_binding_parameters(
-                            results["distances"],
-                            results["ref"][orientation][strain]["energies"],
-                        )
-                    )
-                results[model][orientation][strain]["params"] = get_binding_parameters(
-                    results["distances"],
-                    results[model][orientation][strain]["energies"],
-                )
+    Curves of each model are loaded and fitted once, across `n_jobs` processes, and
+    cached until the model's outputs change.
 
-                dist_stored = True
+    Parameters
+    ----------
+    n_jobs
+        Number of models to process in parallel.
 
-        ref_stored = True
+    Returns
+    -------
+    dict[str, Any]
+        Distances, and adsorption energies with shape
+        ``(orientations, strains, distances)`` and binding parameters with shape
+        ``(orientations, strains, 2)`` for the reference and for each model with
+        outputs, under ``"models"``.
+    """
+    curves = dict(
+        zip(
+            MODELS,
+            parallel_map(
+                _model_binding_curves_item,
+                MODELS,
+                n_jobs=min(n_jobs, len(MODELS)),
+                desc="Fitting binding curves",
+            ),
+            strict=True,
+        )
+    )
+    curves = {model: data for model, data in curves.items() if data is not None}
+    if not curves:
+        return {"distances": np.empty(0), "ref": None, "models": {}}
 
-    return results
+    # Reference data is shared by all models, so is taken from the first
+    first_model = next(iter(curves))
+    write_app_structures(CALC_PATH / first_model)
+    distances = curves[first_model]["distances"]
+    ref_energies = curves[first_model]["ref_energies"]
+
+    return {
+        "distances": distances,
+        "ref": {
+            "energies": ref_energies,
+            "params": fit_binding_curves(distances, ref_energies),
+        },
+        "models": {
+            model: {"energies": data["energies"], "params": data["params"]}
+            for model, data in curves.items()
+        },
+    }
 
 
 @pytest.fixture
@@ -271,6 +370,8 @@ def generate_plots_for_app(processed_data) -> None:
     processed_data
         Dictionary of processed data.
     """
+    distances = processed_data["distances"].tolist()
+
     # These plots require a fairly low-level access to Plotly, in order to produce the
     # 3x3 grid of binding energy curves over 3 orientations and 3 strain conditions
 
@@ -285,12 +386,12 @@ def generate_plots_for_app(processed_data) -> None:
         cols=3,
         subplot_titles=subplot_titles,
     )
-    for i, orientation in enumerate(ORIENTATIONS):
-        for j, strain in enumerate(STRAINS):
+    for i in range(len(ORIENTATIONS)):
+        for j in range(len(STRAINS)):
             fig.add_trace(
                 go.Scatter(
-                    x=processed_data["distances"],
-                    y=processed_data["ref"][orientation][strain]["energies"],
+                    x=distances,
+                    y=processed_data["ref"]["energies"][i, j].tolist(),
                     name="Reference",
                     legendgroup="Reference",
                     showlegend=((i + j) == 0),
@@ -302,13 +403,16 @@ def generate_plots_for_app(processed_data) -> None:
                 col=(i + 1),
             )
     for iter, model in enumerate(MODELS):
-        for i, orientation in enumerate(ORIENTATIONS):
-            for j, strain in enumerate(STRAINS):
+        if model not in processed_data["models"]:
+            continue
+        energies = processed_data["models"][model]["energies"]
+        for i in range(len(ORIENTATIONS)):
+            for j in range(len(STRAINS)):
                 color = DEFAULT_PLOTLY_COLORS[iter % len(DEFAULT_PLOTLY_COLORS)]
                 fig.add_trace(
                     go.Scatter(
-                        x=processed_data["distances"],
-                        y=processed_data[model][orientation][strain]["energies"],
+                        x=distances,
+                        y=energies[i, j].tolist(),
                         name=model,
                         legendgroup=model,
                         showlegend=((i + j) == 0),
@@ -343,14 +447,11 @@ def generate_plots_for_app(processed_data) -> None:
         subplot_titles=ORIENTATIONS,
     )
     strains_to_plot = [float(strain[1:5]) for strain in STRAINS]
-    for i, orientation in enumerate(ORIENTATIONS):
+    for i in range(len(ORIENTATIONS)):
         fig.add_trace(
             go.Scatter(
                 x=strains_to_plot,
-                y=[
-                    processed_data["ref"][orientation][strain]["params"][0]
-                    for strain in STRAINS
-                ],
+                y=processed_data["ref"]["params"][i, :, 0].tolist(),
                 name="Reference",
                 legendgroup="Reference",
                 showlegend=(i == 0),
@@ -362,15 +463,15 @@ def generate_plots_for_app(processed_data) -> None:
             col=(i + 1),
         )
     for iter, model in enumerate(MODELS):
+        if model not in processed_data["models"]:
+            continue
+        params = processed_data["models"][model]["params"]
         color = DEFAULT_PLOTLY_COLORS[iter % len(DEFAULT_PLOTLY_COLORS)]
-        for i, orientation in enumerate(ORIENTATIONS):
+        for i in range(len(ORIENTATIONS)):
             fig.add_trace(
                 go.Scatter(
                     x=strains_to_plot,
-                    y=[
-                        processed_data[model][orientation][strain]["params"][0]
-                        for strain in STRAINS
-                    ],
+                    y=params[i, :, 0].tolist(),
                     name=model,
                     legendgroup=model,
                     showlegend=(i == 0),
@@ -401,14 +502,11 @@ def generate_plots_for_app(processed_data) -> None:
         cols=3,
         subplot_titles=ORIENTATIONS,
     )
-    for i, orientation in enumerate(ORIENTATIONS):
+    for i in range(len(ORIENTATIONS)):
         fig.add_trace(
             go.Scatter(
                 x=strains_to_plot,
-                y=[
-                    processed_data["ref"][orientation][strain]["params"][1]
-                    for strain in STRAINS
-                ],
+                y=processed_data["ref"]["params"][i, :, 1].tolist(),
                 name="Reference",
                 legendgroup="Reference",
                 showlegend=(i == 0),
@@ -420,15 +518,15 @@ def generate_plots_for_app(processed_data) -> None:
             col=(i + 1),
         )
     for iter, model in enumerate(MODELS):
+        if model not in processed_data["models"]:
+            continue
+        params = processed_data["models"][model]["params"]
         color = DEFAULT_PLOTLY_COLORS[iter % len(DEFAULT_PLOTLY_COLORS)]
-        for i, orientation in enumerate(ORIENTATIONS):
+        for i in range(len(ORIENTATIONS)):
             fig.add_trace(
                 go.Scatter(
                     x=strains_to_plot,
-                    y=[
-                        processed_data[model][orientation][strain]["params"][1]
-                        for strain in STRAINS
-                    ],
+                    y=params[i, :, 1].tolist(),
                     name=model,
                     legendgroup=model,
                     showlegend=(i == 0),
@@ -471,24 +569,38 @@ def all_adsorption_energies_mae(processed_data) -> dict[str, float]:
     dict[str, float]
         Dictionary of MAEs for all models.
     """
-    results = {}
+    ref = processed_data["ref"]["energies"].ravel()
+    return {
+        model: mae(ref, data["energies"].ravel())
+        for model, data in processed_data["models"].items()
+    }
 
-    ref = []
-    for orientation in ORIENTATIONS:
-        for strain in STRAINS:
-            for i in range(len(processed_data["distances"])):
-                ref.append(processed_data["ref"][orientation][strain]["energies"][i])
-
-    for model in MODELS:
-        prediction = []
-        for orientation in ORIENTATIONS:
-            for strain in STRAINS:
-                for i in range(len(processed_data["distances"])):
-                    prediction.append(
-                        processed_data[model][orientation][strain]["energies"][i]
-                    )
-        results[model] = mae(ref, prediction)
 
+def _params_mae(processed_data: dict[str, Any], index: int) -> dict[str, float | None]:
+    """
+    Get mean absolute error of a binding parameter across orientations and strains.
+
+    Parameters
+    ----------
+    processed_data
+        Dictionary of processed data.
+    index
+        Index of the binding parameter: 0 for energies, or 1 for lengths.
+
+    Returns
+    -------
+    dict[str, float | None]
+        Dictionary of MAEs for all models, or `None` for models with infinite
+        parameters.
+    """
+    ref = processed_data["ref"]["params"][..., index].ravel()
+    results = {}
+    for model, data in processed_data["models"].items():
+        prediction = data["params"][..., index].ravel()
+        if np.isinf(np.max(prediction)):
+            results[model] = None
+        else:
+            results[model] = mae(ref, prediction)
     return results
 
 
@@ -507,26 +619,7 @@ def binding_energies_mae(processed_data) -> dict[str, float]:
     dict[str, float]
         Dictionary of binding energy MAEs for all models.
     """
-    results = {}
-
-    ref = []
-    for orientation in ORIENTATIONS:
-        for strain in STRAINS:
-            ref.append(processed_data["ref"][orientation][strain]["params"][0])
-
-    for model in MODELS:
-        prediction = []
-        for orientation in ORIENTATIONS:
-            for strain in STRAINS:
-                prediction.append(
-                    processed_data[model][orientation][strain]["params"][0]
-                )
-        if np.isinf(np.max(prediction)):
-            results[model] = None
-        else:
-            results[model] = mae(ref, prediction)
-
-    return results
+    return _params_mae(processed_data, 0)
 
 
 @pytest.fixture
@@ -544,26 +637,7 @@ def binding_lengths_mae(processed_data) -> dict[str, float]:
     dict[str, float]
         Dictionary of binding length MAEs for all models.
     """
-    results = {}
-
-    ref = []
-    for orientation in ORIENTATIONS:
-        for strain in STRAINS:
-            ref.append(processed_data["ref"][orientation][strain]["params"][1])
-
-    for model in MODELS:
-        prediction = []
-        for orientation in ORIENTATIONS:
-            for strain in STRAINS:
-                prediction.append(
-                    processed_data[model][orientation][strain]["params"][1]
-                )
-        if np.isinf(np.max(prediction)):
-            results[model] = None
-        else:
-            results[model] = mae(ref, prediction)
-
-    return results
+    return _params_mae(processed_data, 1)
 
 
 @pytest.fixture
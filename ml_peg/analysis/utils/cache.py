@@ -0,0 +1,352 @@
+"""Cache per-model analysis results, recomputing only when calc outputs change."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import functools
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import pickle
+import sys
+import tempfile
+from typing import Any, TypeVar
+
+Result = TypeVar("Result")
+
+# Name of the directory within each benchmark's app data storing cached results
+CACHE_DIR_NAME = ".cache"
+# Version of cached results, to be increased when helpers that are not imported
+# directly by an analysis module change its results
+CACHE_VERSION = 1
+# Packages whose modules, if imported by an analysis module, invalidate its cached
+# results when changed
+HELPER_PACKAGES = ("ml_peg.analysis", "ml_peg.calcs")
+
+
+def _fingerprint(paths: Sequence[Path]) -> list[tuple[str, int, int]]:
+    """
+    Get the size and modification time of files, including those in directories.
+
+    Parameters
+    ----------
+    paths
+        Files or directories to fingerprint.
+
+    Returns
+    -------
+    list[tuple[str, int, int]]
+        Path, size and modification time in nanoseconds of each file. Missing paths
+        have a size and time of -1.
+    """
+    fingerprint = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                fingerprint.append((str(file), -1, -1))
+                continue
+            if not file.is_dir():
+                fingerprint.append((str(file), stat.st_size, stat.st_mtime_ns))
+    return fingerprint
+
+
+def _helper_files(source_file: Path) -> list[Path]:
+    """
+    Get the source files of helper modules imported by an analysis module.
+
+    Parameters
+    ----------
+    source_file
+        Path to the analysis module.
+
+    Returns
+    -------
+    list[Path]
+        Sorted paths of modules within `HELPER_PACKAGES` that the module imports, or
+        whose functions or classes it imports, other than the module itself.
+    """
+    module = next(
+        (
+            module
+            for module in list(sys.modules.values())
+            if getattr(module, "__file__", None)
+            and Path(module.__file__).resolve() == source_file
+        ),
+        None,
+    )
+    if module is None:
+        return []
+
+    files = set()
+    for value in vars(module).values():
+        name = (
+            value.__name__
+            if inspect.ismodule(value)
+            else getattr(value, "__module__", None)
+        )
+        if not isinstance(name, str) or not name.startswith(HELPER_PACKAGES):
+            continue
+        helper_file = getattr(sys.modules.get(name), "__file__", None)
+        if helper_file and Path(helper_file).resolve() != source_file:
+            files.add(Path(helper_file).resolve())
+    return sorted(files)
+
+
+@functools.cache
+def _source_hash(source_file: str) -> str:
+    """
+    Get the hash of an analysis module and the helpers it imports.
+
+    Changes to the module, to helper modules it imports from `HELPER_PACKAGES`, or to
+    `CACHE_VERSION` therefore invalidate cached results.
+
+    Parameters
+    ----------
+    source_file
+        Path to the module.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the sources and `CACHE_VERSION`.
+    """
+    source_file = Path(source_file).resolve()
+    digest = hashlib.sha256(f"version={CACHE_VERSION}".encode())
+    for path in [source_file, *_helper_files(source_file)]:
+        digest.update(str(path.name).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def inputs_key(paths: Sequence[Path], **values: Any) -> str:
+    """
+    Get a key identifying the state of input files and any other values.
+
+    Parameters
+    ----------
+    paths
+        Files or directories whose size and modification time are included.
+    **values
+        Other values to include, which must be JSON-serialisable or have a unique
+        string representation.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the fingerprint of `paths` and `values`.
+    """
+    return hashlib.sha256(
+        json.dumps({"inputs": _fingerprint(paths), **values}, default=str).encode()
+    ).hexdigest()
+
+
+def cache_per_model(
+    cache_dir: Path,
+    inputs: Callable[[str], Path | Sequence[Path]],
+) -> Callable[[Callable[..., Result]], Callable[..., Result]]:
+    """
+    Cache the results of a function analysing a single model.
+
+    Results are stored in ``cache_dir/[function name]/[model name].pkl``, keyed by
+    the size and modification time of the model's input files, the source of the
+    module defining the function and of the helper modules it imports, the
+    `CACHE_VERSION`, and any additional arguments. Results for a model
+    are only recomputed if any of these change, so adding a model only requires that
+    model to be analysed. Side effects of the function, such as writing structures
+    for the app, are not repeated for cached results.
+
+    Parameters
+    ----------
+    cache_dir
+        Directory to store cached results in, typically
+        ``OUT_PATH / CACHE_DIR_NAME``.
+    inputs
+        Function returning the files or directories, such as calculation outputs,
+        that results for a model are derived from.
+
+    Returns
+    -------
+    Callable[[Callable[..., Result]], Callable[..., Result]]
+        Decorator for a function whose first argument is the model name. Additional
+        arguments must be JSON-serialisable.
+    """
+
+    def decorator(func: Callable[..., Result]) -> Callable[..., Result]:
+        """
+        Decorate function to cache its results for each model.
+
+        Parameters
+        ----------
+        func
+            Function analysing a single model, called as ``func(model_name, *args)``.
+
+        Returns
+        -------
+        Callable[..., Result]
+            Function returning cached results when its inputs are unchanged.
+        """
+        source_file = inspect.getsourcefile(func)
+
+        @functools.wraps(func)
+        def wrapper(model_name: str, *args) -> Result:
+            """
+            Get cached results for a model, or compute and cache them.
+
+            Parameters
+            ----------
+            model_name
+                Name of model to analyse.
+            *args
+                Additional arguments passed to the function.
+
+            Returns
+            -------
+            Result
+                Results of the function for the model.
+            """
+            paths = inputs(model_name)
+            paths = [paths] if isinstance(paths, str | Path) else list(paths)
+            key = inputs_key(
+                paths,
+                source=_source_hash(source_file),
+                function=func.__qualname__,
+                args=args,
+            )
+
+            cache_path = Path(cache_dir) / func.__name__ / f"{model_name}.pkl"
+            cached = _load(cache_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            result = func(model_name, *args)
+            _save(cache_path, (key, result))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _load(path: Path) -> tuple[str, Any] | None:
+    """
+    Load cached results, if they exist and can be read.
+
+    Parameters
+    ----------
+    path
+        Path to cached results.
+
+    Returns
+    -------
+    tuple[str, Any] | None
+        Cache key and results, or `None` if not cached.
+    """
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+
+
+def _save(path: Path, cached: tuple[str, Any]) -> None:
+    """
+    Save results, replacing any existing cache atomically.
+
+    Parameters
+    ----------
+    path
+        Path to save cached results to.
+    cached
+        Cache key and results.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as file:
+        pickle.dump(cached, file)
+    os.replace(file.name, path)
+
+
+class ItemCache:
+    """
+    Cache of results for individual items, such as the systems of a model.
+
+    Each result is stored with a key, typically a hash of the files it was computed
+    from, and is only returned while the key is unchanged. All results are discarded
+    if the source of the module using the cache, or of the helper modules it imports,
+    changes.
+
+    Parameters
+    ----------
+    path
+        Path to store cached results in, typically
+        ``OUT_PATH / CACHE_DIR_NAME / [name] / [model name].pkl``.
+    source_file
+        Path to the module using the cache, typically ``__file__``.
+    """
+
+    def __init__(self, path: Path, source_file: str | Path) -> None:
+        """
+        Load cached results.
+
+        Parameters
+        ----------
+        path
+            Path to store cached results in.
+        source_file
+            Path to the module using the cache.
+        """
+        self.path = Path(path)
+        self._source = _source_hash(str(source_file))
+        cached = _load(self.path)
+        self._stored: dict[str, tuple[str, Any]] = (
+            cached[1] if cached is not None and cached[0] == self._source else {}
+        )
+        self._used: dict[str, tuple[str, Any]] = {}
+
+    def get(self, item: str, key: str) -> Any | None:
+        """
+        Get the cached result for an item.
+
+        Parameters
+        ----------
+        item
+            Name of item.
+        key
+            Key the result must have been stored with.
+
+        Returns
+        -------
+        Any | None
+            Cached result, or `None` if the item is not cached with `key`.
+        """
+        entry = self._stored.get(item)
+        if entry is None or entry[0] != key:
+            return None
+        self._used[item] = entry
+        return entry[1]
+
+    def set(self, item: str, key: str, result: Any) -> None:
+        """
+        Store the result for an item.
+
+        Parameters
+        ----------
+        item
+            Name of item.
+        key
+            Key identifying the inputs of the result.
+        result
+            Result to cache.
+        """
+        self._stored[item] = self._used[item] = (key, result)
+
+    def save(self) -> None:
+        """Save results that were stored or retrieved, discarding any others."""
+        _save(self.path, (self._source, self._used))
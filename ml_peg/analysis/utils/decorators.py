@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import functools
+import hashlib
 import json
 from json import dump
+import os
 from pathlib import Path
-from typing import Any
+import tempfile
+from typing import Any, Literal
 
 from dash import dash_table
 import numpy as np
@@ -22,6 +25,7 @@ from ml_peg.analysis.utils.utils import (
     sample_density_grid,
 )
 from ml_peg.app.utils.utils import Thresholds
+from ml_peg.calcs.utils.parallel import parallel_map
 from ml_peg.models.get_models import get_model_names, load_model_configs
 
 PERIODIC_TABLE_POSITIONS: dict[str, tuple[int, int]] = {
@@ -156,6 +160,99 @@ PERIODIC_TABLE_POSITIONS: dict[str, tuple[int, int]] = {
 PERIODIC_TABLE_ROWS = 10
 PERIODIC_TABLE_COLS = 18
 
+# Plotly defaults used to reproduce autoscaled axis ranges: figure size and margins
+# (left, right, top, bottom) in pixels, padding as a fraction of axis length, and
+# the scaling and minimum of padding for marker sizes
+PLOTLY_DEFAULT_SIZE = (700, 450)
+PLOTLY_DEFAULT_MARGIN = (80, 80, 100, 80)
+PLOTLY_AXIS_PAD_FRACTION = 0.05
+PLOTLY_MARKER_SIZE_REF = 1.6
+PLOTLY_MIN_MARKER_PAD = 3.0
+
+# Version of periodic-table gallery figures, included in the names of cached figures
+# so changes to how they are rendered invalidate them
+CURVE_GALLERY_VERSION = 1
+
+
+def _autorange(values: np.ndarray, axis_length: float, marker_pad: float) -> list:
+    """
+    Get the range Plotly autoscales a linear axis to for marker traces.
+
+    Parameters
+    ----------
+    values
+        Data plotted along the axis.
+    axis_length
+        Length of the axis, in pixels.
+    marker_pad
+        Padding for marker sizes, in pixels.
+
+    Returns
+    -------
+    list
+        Minimum and maximum of the axis.
+    """
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return [-1.0, 6.0]
+    v_min, v_max = float(values.min()), float(values.max())
+    if v_min == v_max:
+        return [v_min - 1.0, v_max + 1.0]
+    pad = marker_pad + PLOTLY_AXIS_PAD_FRACTION * axis_length
+    scale = (v_max - v_min) / (axis_length - 2 * pad)
+    return [v_min - scale * pad, v_max + scale * pad]
+
+
+def _parity_limits(fig: go.Figure) -> list:
+    """
+    Get limits of a y = x line spanning the autoscaled axes of a figure.
+
+    This reproduces the autoscaling Plotly applies to marker traces from the data, so
+    figures do not need to be rendered to read back their axis ranges.
+
+    Parameters
+    ----------
+    fig
+        Figure containing only scatter traces with markers.
+
+    Returns
+    -------
+    list
+        Minimum and maximum of both axes.
+    """
+    width = fig.layout.width or PLOTLY_DEFAULT_SIZE[0]
+    height = fig.layout.height or PLOTLY_DEFAULT_SIZE[1]
+    margin = fig.layout.margin
+    left, right, top, bottom = (
+        default if value is None else value
+        for value, default in zip(
+            (margin.l, margin.r, margin.t, margin.b), PLOTLY_DEFAULT_MARGIN, strict=True
+        )
+    )
+
+    # Missing values (None) are converted to NaN and ignored
+    x = np.concatenate(
+        [np.asarray(trace.x, dtype=float) for trace in fig.data if trace.x is not None]
+        or [np.empty(0)]
+    )
+    y = np.concatenate(
+        [np.asarray(trace.y, dtype=float) for trace in fig.data if trace.y is not None]
+        or [np.empty(0)]
+    )
+
+    # Axes are also padded for the largest marker, of size 6 pixels by default
+    marker_pad = max(
+        [PLOTLY_MIN_MARKER_PAD]
+        + [
+            float(np.max(trace.marker.size or 6)) / PLOTLY_MARKER_SIZE_REF
+            for trace in fig.data
+        ]
+    )
+
+    x_range = _autorange(x, width - left - right, marker_pad)
+    y_range = _autorange(y, height - top - bottom, marker_pad)
+    return [min(x_range[0], y_range[0]), max(x_range[1], y_range[1])]
+
 
 def plot_parity(
     title: str | None = None,
@@ -244,14 +341,7 @@ def plot_parity(
                     )
                 )
 
-            full_fig = fig.full_figure_for_development()
-            x_range = full_fig.layout.xaxis.range
-            y_range = full_fig.layout.yaxis.range
-
-            lims = [
-                np.min([x_range, y_range]),  # min of both axes
-                np.max([x_range, y_range]),  # max of both axes
-            ]
+            lims = _parity_limits(fig)
 
             fig.add_trace(
                 go.Scatter(
@@ -391,13 +481,7 @@ def cell_to_scatter(
                     )
 
                     # Add parity line
-                    full_fig = fig.full_figure_for_development()
-                    x_range = full_fig.layout.xaxis.range
-                    y_range = full_fig.layout.yaxis.range
-                    lims = [
-                        np.min([x_range, y_range]),
-                        np.max([x_range, y_range]),
-                    ]
+                    lims = _parity_limits(fig)
                     fig.add_trace(
                         go.Scatter(
                             x=lims,
@@ -665,16 +749,18 @@ def plot_density_scatter(
                 if ref_vals.size == 0 or pred_vals.size == 0:
                     sampled = ([], [], [])
                 else:
-                    sampled_indices, sampled_density, _ = sample_density_grid(
+                    sample = sample_density_grid(
                         ref_vals,
                         pred_vals,
                         grid_size=grid_size,
                         max_points_per_cell=max_points_per_cell,
                         seed=seed,
                     )
-                    sampled_x = [float(ref_vals[idx]) for idx in sampled_indices]
-                    sampled_y = [float(pred_vals[idx]) for idx in sampled_indices]
-                    sampled = (sampled_x, sampled_y, sampled_density)
+                    sampled = (
+                        ref_vals[sample.indices].tolist(),
+                        pred_vals[sample.indices].tolist(),
+                        sample.density.tolist(),
+                    )
                     global_min = min(global_min, ref_vals.min(), pred_vals.min())
                     global_max = max(global_max, ref_vals.max(), pred_vals.max())
 
@@ -1007,6 +1093,430 @@ def render_periodic_table_grid(
     plt.close(fig)
 
 
+def _read_curve_files(
+    model_curve_dir: Path, element: str | None, pair_separator: str
+) -> dict[str, bytes]:
+    """
+    Read the curve payload files drawn in a periodic-table gallery figure.
+
+    Parameters
+    ----------
+    model_curve_dir
+        Directory of per-pair JSON payloads for a model.
+    element
+        Element whose pairs are read, or ``None`` to read homonuclear pairs.
+    pair_separator
+        Separator used between elements within pair names.
+
+    Returns
+    -------
+    dict[str, bytes]
+        Contents of each payload file, keyed by the element whose position in the
+        periodic table the curve is drawn at.
+    """
+    files: dict[str, bytes] = {}
+    for other in PERIODIC_TABLE_POSITIONS:
+        pairs = (
+            (f"{other}{pair_separator}{other}",)
+            if element is None
+            else (
+                f"{element}{pair_separator}{other}",
+                f"{other}{pair_separator}{element}",
+            )
+        )
+        for pair in pairs:
+            try:
+                files[other] = (model_curve_dir / f"{pair}.json").read_bytes()
+            except OSError:
+                continue
+            break
+    return files
+
+
+def load_curve_payloads(
+    model_curve_dir: str | Path,
+    element: str | None = None,
+    *,
+    pair_separator: str = "-",
+) -> dict[str, dict[str, Any]]:
+    """
+    Load the curve payloads written by `periodic_curve_gallery` for one figure.
+
+    Only the payloads drawn in the figure are read, rather than every pair.
+
+    Parameters
+    ----------
+    model_curve_dir
+        Directory of per-pair JSON payloads for a model.
+    element
+        Element whose pairs are loaded, or ``None`` to load homonuclear pairs.
+    pair_separator
+        Separator used between elements within pair names. Default is ``"-"``.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Payload of each pair, keyed by the element whose position in the periodic
+        table the curve is drawn at.
+    """
+    files = _read_curve_files(Path(model_curve_dir), element, pair_separator)
+    payloads = {}
+    for other, contents in files.items():
+        try:
+            payloads[other] = json.loads(contents)
+        except ValueError:
+            continue
+    return payloads
+
+
+def _plot_curve_payload(
+    ax,
+    payload: dict[str, Any],
+    *,
+    x_ticks: tuple[float, ...],
+    y_ticks: tuple[float, ...],
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+    style: Literal["analysis", "app"] = "analysis",
+) -> float | None:
+    """
+    Plot a distance-energy curve, shifted so the energy at the largest distance is 0.
+
+    Parameters
+    ----------
+    ax
+        Matplotlib axes the curve is plotted onto.
+    payload
+        Curve payload, with ``distance`` and ``energy`` sorted by distance.
+    x_ticks, y_ticks
+        Tick locations for the plot.
+    x_range, y_range
+        Axis limits for the plot.
+    style
+        ``"analysis"`` for compact ticks and a light zero line, or ``"app"`` for
+        Matplotlib's default ticks and a grey zero line. Default is ``"analysis"``.
+
+    Returns
+    -------
+    float | None
+        Shift subtracted from the energies, or ``None`` if the curve has no samples.
+    """
+    x = np.asarray(payload.get("distance") or [], dtype=float)
+    y = np.asarray(payload.get("energy") or [], dtype=float)
+    if x.size == 0 or x.size != y.size:
+        return None
+    shift = float(y[-1])
+    ax.plot(x, y - shift, linewidth=1, color="tab:blue", zorder=1)
+    if style == "app":
+        ax.axhline(0, color="grey", linewidth=0.5, zorder=0)
+    else:
+        ax.axhline(0, color="lightgray", linewidth=0.6, zorder=0)
+        ax.set_facecolor("white")
+        ax.tick_params(labelsize=7, length=2, pad=1)
+    ax.set_xlim(*x_range)
+    ax.set_ylim(*y_range)
+    ax.set_xticks(x_ticks)
+    ax.set_yticks(y_ticks)
+    return shift
+
+
+def render_curve_gallery_figure(
+    payloads: dict[str, dict[str, Any]],
+    filename_stem: str | Path,
+    *,
+    element: str | None = None,
+    title: str | None = None,
+    formats: tuple[str, ...] = ("png",),
+    figsize: tuple[float, float] | None = (30, 15),
+    dpi: int | None = 200,
+    suptitle_kwargs: dict[str, Any] | None = None,
+    x_ticks: tuple[float, ...] = (0.0, 2.0, 4.0, 6.0),
+    y_ticks: tuple[float, ...] = (-20.0, -10.0, 0.0, 10.0, 20.0),
+    x_range: tuple[float, float] = (0.0, 6.0),
+    y_range: tuple[float, float] = (-20.0, 20.0),
+    style: Literal["analysis", "app"] = "analysis",
+) -> bool:
+    """
+    Render curves at the positions of elements in a periodic-table grid.
+
+    The figure is created without ``pyplot``, so figures can be rendered
+    concurrently, e.g. by a process pool or app callbacks.
+
+    Parameters
+    ----------
+    payloads
+        Curve payloads keyed by element, as returned by `load_curve_payloads`.
+    filename_stem
+        Base path for the output files (without extension).
+    element
+        Element paired with every curve, highlighting its homonuclear pair, or
+        ``None`` for an overview of homonuclear pairs labelled by well depth.
+    title
+        Figure title displayed above the grid.
+    formats
+        File formats to emit. Default is ``("png",)``.
+    figsize
+        Matplotlib figure size. Defaults to a size proportional to the table
+        geometry if ``None``.
+    dpi
+        Resolution of raster formats. Matplotlib's default is used if ``None``.
+    suptitle_kwargs
+        Extra keyword arguments forwarded to ``fig.suptitle``.
+    x_ticks, y_ticks
+        Tick locations for the plots.
+    x_range, y_range
+        Axis limits for the plots.
+    style
+        ``"analysis"`` to label the homonuclear overview by well depth, with compact
+        ticks, or ``"app"`` to title every curve with its pair and shift, with
+        Matplotlib's default ticks, as shown in the app. Default is ``"analysis"``.
+
+    Returns
+    -------
+    bool
+        ``True`` if any curve was drawn and the figure written.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(
+        figsize=figsize or (PERIODIC_TABLE_COLS * 1.5, PERIODIC_TABLE_ROWS * 1.2),
+        layout="constrained",
+    )
+    axes = fig.subplots(PERIODIC_TABLE_ROWS, PERIODIC_TABLE_COLS)
+    for ax in axes.ravel():
+        ax.axis("off")
+
+    has_data = False
+    for other, payload in payloads.items():
+        position = PERIODIC_TABLE_POSITIONS.get(other)
+        if position is None:
+            continue
+        ax = axes[position]
+        shift = _plot_curve_payload(
+            ax,
+            payload,
+            x_ticks=x_ticks,
+            y_ticks=y_ticks,
+            x_range=x_range,
+            y_range=y_range,
+            style=style,
+        )
+        if shift is None:
+            continue
+        ax.axis("on")
+        if style == "app":
+            pair = payload.get("pair") or f"{element or other}-{other}"
+            ax.set_title(f"{pair}, shift: {shift:.4f}", fontsize=8)
+            if other == element:
+                for spine in ax.spines.values():
+                    spine.set_edgecolor("crimson")
+                    spine.set_linewidth(2)
+        elif element is None:
+            ax.text(
+                0.02,
+                0.95,
+                f"{other}\n{min(payload['energy']):.2f} eV",
+                transform=ax.transAxes,
+                ha="left",
+                va="top",
+                fontsize=8,
+                fontweight="bold",
+            )
+        else:
+            ax.set_title(f"{element}-{other}, shift: {shift:.4f}", fontsize=8)
+            if other == element:
+                for spine in ax.spines.values():
+                    spine.set_edgecolor("crimson")
+                    spine.set_linewidth(2)
+        has_data = True
+
+    if not has_data:
+        return False
+
+    if title:
+        fig.suptitle(title, **(suptitle_kwargs or {}))
+    base_path = Path(filename_stem)
+    base_path.parent.mkdir(parents=True, exist_ok=True)
+    for fmt in formats:
+        fig.savefig(base_path.with_suffix(f".{fmt}"), format=fmt, dpi=dpi or "figure")
+    return True
+
+
+def cached_curve_gallery_figure(
+    model_curve_dir: str | Path,
+    cache_dir: str | Path,
+    *,
+    element: str | None = None,
+    title: str | None = None,
+    fmt: str = "png",
+    pair_separator: str = "-",
+    **render_kwargs: Any,
+) -> Path | None:
+    """
+    Get a gallery figure rendered on demand from curve payloads.
+
+    Figures are stored in `cache_dir` with a hash of the payloads drawn and the
+    rendering options in their name, so are only rendered the first time they are
+    requested after the curves or options change.
+
+    Parameters
+    ----------
+    model_curve_dir
+        Directory of per-pair JSON payloads for a model.
+    cache_dir
+        Directory to store rendered figures for the model in.
+    element
+        Element whose pairs are drawn, or ``None`` for the homonuclear overview.
+    title
+        Figure title displayed above the grid.
+    fmt
+        File format of the figure. Default is ``"png"``.
+    pair_separator
+        Separator used between elements within pair names. Default is ``"-"``.
+    **render_kwargs
+        Other options passed to `render_curve_gallery_figure`.
+
+    Returns
+    -------
+    Path | None
+        Path to the rendered figure, or ``None`` if there are no curves to draw.
+    """
+    files = _read_curve_files(Path(model_curve_dir), element, pair_separator)
+    if not files:
+        return None
+
+    digest = hashlib.sha256(
+        json.dumps(
+            {
+                "version": CURVE_GALLERY_VERSION,
+                "element": element,
+                "title": title,
+                "options": render_kwargs,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+    for other in sorted(files):
+        digest.update(other.encode())
+        digest.update(files[other])
+
+    cache_dir = Path(cache_dir)
+    name = element or "overview"
+    path = cache_dir / f"{name}-{digest.hexdigest()[:16]}.{fmt}"
+    if path.exists():
+        return path
+
+    payloads = {}
+    for other, contents in files.items():
+        try:
+            payloads[other] = json.loads(contents)
+        except ValueError:
+            continue
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+        if not render_curve_gallery_figure(
+            payloads,
+            Path(tmp_dir) / name,
+            element=element,
+            title=title,
+            formats=(fmt,),
+            **render_kwargs,
+        ):
+            return None
+        for stale in cache_dir.glob(f"{name}-*.{fmt}"):
+            stale.unlink(missing_ok=True)
+        os.replace(Path(tmp_dir) / f"{name}.{fmt}", path)
+    return path
+
+
+def _write_curve_payloads(
+    frame: pd.DataFrame,
+    model_curve_dir: Path,
+    *,
+    pair_column: str,
+    distance_column: str,
+    series_columns: dict[str, str],
+    scalar_columns: dict[str, str],
+) -> None:
+    """
+    Serialise per-pair JSON payloads for the Dash callbacks.
+
+    Parameters
+    ----------
+    frame
+        Dataframe containing all pair samples for a model.
+    model_curve_dir
+        Directory to write the payloads to.
+    pair_column, distance_column
+        Column names of the pair and distance.
+    series_columns
+        Mapping of payload keys to column names serialised as sequences.
+    scalar_columns
+        Mapping of payload keys to column names serialised as scalars.
+    """
+    model_curve_dir.mkdir(parents=True, exist_ok=True)
+    for pair, group in frame.groupby(pair_column, sort=False):
+        ordered = group.sort_values(distance_column).drop_duplicates(distance_column)
+        payload: dict[str, Any] = {"pair": str(pair)}
+        for key, column in scalar_columns.items():
+            if column in ordered:
+                payload[key] = ordered[column].iloc[0]
+        for key, column in series_columns.items():
+            if column in ordered:
+                payload[key] = ordered[column].tolist()
+        with (model_curve_dir / f"{pair}.json").open("w", encoding="utf8") as fh:
+            json.dump(payload, fh)
+
+
+def _write_curve_payloads_item(
+    item: tuple[pd.DataFrame, Path, dict[str, Any]], _state: None
+) -> None:
+    """
+    Write the curve payloads of a model, for use with `parallel_map`.
+
+    Parameters
+    ----------
+    item
+        Dataframe of the model, directory to write to, and options passed to
+        `_write_curve_payloads`.
+    _state
+        Unused worker state.
+    """
+    frame, model_curve_dir, options = item
+    _write_curve_payloads(frame, model_curve_dir, **options)
+
+
+def _render_curve_gallery_item(
+    item: tuple[Path, str | None, Path, str, dict[str, Any]], _state: None
+) -> bool:
+    """
+    Render one gallery figure from curve payloads, for use with `parallel_map`.
+
+    Parameters
+    ----------
+    item
+        Directory of the model's curve payloads, element to draw the pairs of (or
+        ``None`` for the overview), output filename stem, pair separator and options
+        passed to `render_curve_gallery_figure`.
+    _state
+        Unused worker state.
+
+    Returns
+    -------
+    bool
+        Whether the figure was written.
+    """
+    model_curve_dir, element, filename_stem, pair_separator, options = item
+    payloads = load_curve_payloads(
+        model_curve_dir, element, pair_separator=pair_separator
+    )
+    return render_curve_gallery_figure(
+        payloads, filename_stem, element=element, **options
+    )
+
+
 def periodic_curve_gallery(
     *,
     curve_dir: Path,
@@ -1019,6 +1529,7 @@ def periodic_curve_gallery(
     focus_formats: tuple[str, ...] = (),
     focus_figsize: tuple[float, float] = (30, 15),
     focus_dpi: int = 200,
+    lazy_focus: bool = False,
     pair_column: str = "pair",
     element1_column: str = "element_1",
     element2_column: str = "element_2",
@@ -1035,6 +1546,10 @@ def periodic_curve_gallery(
     """
     Decorate a fixture that returns per-model curve data to persist gallery assets.
 
+    The decorated callable accepts an additional ``n_jobs`` keyword argument, which
+    is not passed to the wrapped callable. Payloads are written for ``n_jobs`` models
+    and figures rendered, one per task, by ``n_jobs`` processes concurrently.
+
     Parameters
     ----------
     curve_dir
@@ -1060,6 +1575,11 @@ def periodic_curve_gallery(
         Matplotlib figsize for focus plots.
     focus_dpi
         DPI for per-element focus images.
+    lazy_focus
+        Whether to skip rendering focus plots, listing the available elements under
+        ``lazy_elements`` in the manifest instead. Focus plots can then be rendered
+        when viewed from the curve payloads with `cached_curve_gallery_figure`.
+        Default is ``False``.
     pair_column, element1_column, element2_column, distance_column, energy_column
         Column names describing the curve data.
     pair_separator
@@ -1091,238 +1611,39 @@ def periodic_curve_gallery(
     if scalar_columns:
         default_scalars.update(scalar_columns)
 
-    def _sorted_pair(frame: pd.DataFrame) -> pd.DataFrame:
-        """
-        Return distance-sorted samples with duplicate distances removed.
-
-        Parameters
-        ----------
-        frame
-            Dataframe containing at least the ``distance`` column.
-
-        Returns
-        -------
-        pd.DataFrame
-            Frame sorted by distance with only unique distance entries.
-        """
-        return frame.sort_values(distance_column).drop_duplicates(distance_column)
-
-    def _plot_curve(ax, pair_frame: pd.DataFrame) -> bool:
-        """
-        Plot a distance-energy curve on the supplied axes.
-
-        Parameters
-        ----------
-        ax
-            Matplotlib axes the curve is plotted onto.
-        pair_frame
-            Dataframe containing the curve samples.
-
-        Returns
-        -------
-        bool
-            ``True`` when data was plotted, otherwise ``False``.
-        """
-        if pair_frame.empty or energy_column not in pair_frame:
-            return False
-        ordered = _sorted_pair(pair_frame)
-        if ordered.empty:
-            return False
-        x = ordered[distance_column].to_numpy()
-        y = ordered[energy_column].to_numpy()
-        if x.size == 0:
-            return False
-        shift = y[-1]
-        y_shifted = y - shift
-        ax.plot(x, y_shifted, linewidth=1, color="tab:blue", zorder=1)
-        ax.axhline(0, color="lightgray", linewidth=0.6, zorder=0)
-        ax.set_facecolor("white")
-        ax.set_xlim(*x_range)
-        ax.set_ylim(*y_range)
-        ax.set_xticks(x_ticks)
-        ax.set_yticks(y_ticks)
-        ax.tick_params(labelsize=7, length=2, pad=1)
-        return True
-
-    def _write_curve_payloads(model_name: str, frame: pd.DataFrame) -> None:
-        """
-        Serialise per-pair JSON payloads for the Dash callbacks.
-
-        Parameters
-        ----------
-        model_name
-            Name of the model associated with ``frame``.
-        frame
-            Dataframe containing all pair samples for the model.
-        """
-        model_curve_dir = curve_dir / model_name
-        model_curve_dir.mkdir(parents=True, exist_ok=True)
-        for pair, group in frame.groupby(pair_column):
-            ordered = _sorted_pair(group)
-            payload: dict[str, Any] = {"pair": str(pair)}
-            for key, column in default_scalars.items():
-                if column in ordered:
-                    payload[key] = ordered[column].iloc[0]
-            for key, column in default_series.items():
-                if column in ordered:
-                    payload[key] = ordered[column].tolist()
-            with (model_curve_dir / f"{pair}.json").open("w", encoding="utf8") as fh:
-                json.dump(payload, fh)
-
-    def _render_overview(model_name: str, frame: pd.DataFrame) -> bool:
+    payload_options = {
+        "pair_column": pair_column,
+        "distance_column": distance_column,
+        "series_columns": default_series,
+        "scalar_columns": default_scalars,
+    }
+    axes_options = {
+        "x_ticks": x_ticks,
+        "y_ticks": y_ticks,
+        "x_range": x_range,
+        "y_range": y_range,
+    }
+    render_focus = bool(focus_title_template and focus_formats)
+
+    def _available_elements(frame: pd.DataFrame) -> list[str]:
         """
-        Render the homonuclear overview grid for ``model_name``.
+        Get the elements present in any pair of a model.
 
         Parameters
         ----------
-        model_name
-            Name of the model whose overview is drawn.
         frame
             Dataframe containing all pair data for the model.
 
         Returns
         -------
-        bool
-            ``True`` when at least one curve was plotted.
-        """
-
-        def plot_cell(ax, element: str) -> bool:
-            """
-            Plot a single homonuclear curve in the periodic-table grid.
-
-            Parameters
-            ----------
-            ax
-                Matplotlib axes for the subplot.
-            element
-                Chemical symbol identifying the homonuclear pair.
-
-            Returns
-            -------
-            bool
-                ``True`` if data existed for the element.
-            """
-            pair_label = f"{element}{pair_separator}{element}"
-            pair_frame = frame[frame[pair_column] == pair_label]
-            rendered = _plot_curve(ax, pair_frame)
-            if rendered:
-                depth = float(
-                    pair_frame[energy_column].min()
-                    if energy_column in pair_frame
-                    else 0.0
-                )
-                ax.text(
-                    0.02,
-                    0.95,
-                    f"{element}\n{depth:.2f} eV",
-                    transform=ax.transAxes,
-                    ha="left",
-                    va="top",
-                    fontsize=8,
-                    fontweight="bold",
-                )
-            return rendered
-
-        render_periodic_table_grid(
-            title=overview_title.format(model=model_name),
-            filename_stem=periodic_dir / model_name / "overview",
-            plot_cell=plot_cell,
-            figsize=overview_figsize,
-            formats=overview_formats,
-            suptitle_kwargs=overview_suptitle,
-        )
-        return True
-
-    def _render_focus(
-        model_name: str,
-        frame: pd.DataFrame,
-        element: str,
-        output_path: Path,
-    ) -> bool:
-        """
-        Render per-element heteronuclear plots for a selected ``element``.
-
-        Parameters
-        ----------
-        model_name
-            Model identifier used in titles.
-        frame
-            Dataframe containing all pairs for the model.
-        element
-            Element symbol to highlight.
-        output_path
-            Destination path for the rendered figure.
-
-        Returns
-        -------
-        bool
-            ``True`` if any curve was drawn.
+        list[str]
+            Sorted element symbols.
         """
-        import matplotlib.pyplot as plt
-
-        pair_groups: dict[str, pd.DataFrame] = {}
-        for pair, group in frame.groupby(pair_column):
-            try:
-                first, second = str(pair).split(pair_separator)
-            except ValueError:
-                continue
-            if element not in {first, second}:
-                continue
-            other = second if first == element else first
-            pair_groups[other] = _sorted_pair(group)
-
-        if not pair_groups:
-            return False
-
-        fig, axes = plt.subplots(
-            PERIODIC_TABLE_ROWS,
-            PERIODIC_TABLE_COLS,
-            figsize=focus_figsize,
-            constrained_layout=True,
-        )
-        axes = axes.reshape(PERIODIC_TABLE_ROWS, PERIODIC_TABLE_COLS)
-        for ax in axes.ravel():
-            ax.axis("off")
-
-        has_data = False
-        for other, (row, col) in PERIODIC_TABLE_POSITIONS.items():
-            pair_frame = pair_groups.get(other)
-            if pair_frame is None or pair_frame.empty:
-                continue
-            ax = axes[row, col]
-            ax.axis("on")
-            rendered = _plot_curve(ax, pair_frame)
-            if not rendered:
-                ax.axis("off")
-                continue
-            shift = float(
-                pair_frame[energy_column].to_numpy()[-1]
-                if energy_column in pair_frame and not pair_frame.empty
-                else 0.0
-            )
-            ax.set_title(
-                f"{element}-{other}, shift: {shift:.4f}",
-                fontsize=8,
-            )
-            if other == element:
-                for spine in ax.spines.values():
-                    spine.set_edgecolor("crimson")
-                    spine.set_linewidth(2)
-            has_data = True
-
-        if not has_data:
-            plt.close(fig)
-            return False
-
-        if focus_title_template:
-            fig.suptitle(
-                focus_title_template.format(element=element, model=model_name),
-                fontsize=22,
-                fontweight="bold",
-            )
-        fig.savefig(output_path, format=output_path.suffix.lstrip("."), dpi=focus_dpi)
-        plt.close(fig)
-        return True
+        elements: set[str] = set()
+        for column in (element1_column, element2_column):
+            if column in frame:
+                elements |= {str(e) for e in frame[column].dropna().astype(str) if e}
+        return sorted(elements)
 
     def periodic_curve_gallery_decorator(func: Callable) -> Callable:
         """
@@ -1340,7 +1661,7 @@ def periodic_curve_gallery(
         """
 
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args, n_jobs: int = 1, **kwargs):
             """
             Execute the wrapped callable and persist curve/plot assets.
 
@@ -1348,6 +1669,9 @@ def periodic_curve_gallery(
             ----------
             *args
                 Positional arguments forwarded to ``func``.
+            n_jobs
+                Number of processes used to write payloads and render figures.
+                Default is 1.
             **kwargs
                 Keyword arguments forwarded to ``func``.
 
@@ -1367,54 +1691,104 @@ def periodic_curve_gallery(
             if periodic_dir:
                 periodic_dir.mkdir(parents=True, exist_ok=True)
 
-            for model_name, frame in model_frames.items():
-                if frame is None or frame.empty:
-                    continue
-                _write_curve_payloads(model_name, frame)
-
-                # Skip image/manifest generation when no formats are requested or
-                # when no periodic_dir is supplied.
-                if not periodic_dir or (
-                    not overview_formats
-                    and not (focus_title_template and focus_formats)
-                ):
-                    continue
+            frames = {
+                model_name: frame
+                for model_name, frame in model_frames.items()
+                if frame is not None and not frame.empty
+            }
+            parallel_map(
+                _write_curve_payloads_item,
+                [
+                    (frame, curve_dir / model_name, payload_options)
+                    for model_name, frame in frames.items()
+                ],
+                n_jobs=min(n_jobs, len(frames)),
+            )
 
-                model_periodic_dir = periodic_dir / model_name
-                model_periodic_dir.mkdir(parents=True, exist_ok=True)
-                elements_dir = model_periodic_dir / "elements"
-                elements_dir.mkdir(parents=True, exist_ok=True)
+            # Skip image/manifest generation when no formats are requested or
+            # when no periodic_dir is supplied.
+            if not periodic_dir or (not overview_formats and not render_focus):
+                return model_frames
 
+            # Each figure is rendered by a separate task from the written payloads
+            manifests: dict[str, dict[str, Any]] = {}
+            tasks = []
+            for model_name in frames:
                 manifest: dict[str, Any] = {"elements": {}}
+                manifests[model_name] = manifest
+                model_periodic_dir = periodic_dir / model_name
+                (model_periodic_dir / "elements").mkdir(parents=True, exist_ok=True)
+
                 if overview_formats:
-                    overview_rendered = _render_overview(model_name, frame)
-                    if overview_rendered:
-                        manifest["overview"] = f"overview.{overview_formats[0]}"
-
-                if focus_title_template and focus_formats:
-                    available_elements: set[str] = set()
-                    if element1_column in frame:
-                        available_elements |= {
-                            str(e)
-                            for e in frame[element1_column].dropna().astype(str)
-                            if e
-                        }
-                    if element2_column in frame:
-                        available_elements |= {
-                            str(e)
-                            for e in frame[element2_column].dropna().astype(str)
-                            if e
-                        }
-                    available_elements = sorted(available_elements)
-                    extension = focus_formats[0]
-                    for element in available_elements:
-                        output_path = elements_dir / f"{element}.{extension}"
-                        if _render_focus(model_name, frame, element, output_path):
-                            manifest["elements"][element] = (
-                                f"elements/{element}.{extension}"
-                            )
-
-                manifest_path = model_periodic_dir / "manifest.json"
+                    options = {
+                        "title": (overview_title or "").format(model=model_name),
+                        "formats": overview_formats,
+                        "figsize": overview_figsize,
+                        "dpi": None,
+                        "suptitle_kwargs": overview_suptitle,
+                        **axes_options,
+                    }
+                    tasks.append(
+                        (
+                            (manifest, "overview", f"overview.{overview_formats[0]}"),
+                            (
+                                curve_dir / model_name,
+                                None,
+                                model_periodic_dir / "overview",
+                                pair_separator,
+                                options,
+                            ),
+                        )
+                    )
+
+                if not render_focus:
+                    continue
+                elements = _available_elements(frames[model_name])
+                if lazy_focus:
+                    manifest["lazy_elements"] = elements
+                    continue
+                extension = focus_formats[0]
+                for element in elements:
+                    options = {
+                        "title": focus_title_template.format(
+                            element=element, model=model_name
+                        ),
+                        "formats": (extension,),
+                        "figsize": focus_figsize,
+                        "dpi": focus_dpi,
+                        "suptitle_kwargs": {"fontsize": 22, "fontweight": "bold"},
+                        **axes_options,
+                    }
+                    tasks.append(
+                        (
+                            (
+                                manifest["elements"],
+                                element,
+                                f"elements/{element}.{extension}",
+                            ),
+                            (
+                                curve_dir / model_name,
+                                element,
+                                model_periodic_dir / "elements" / element,
+                                pair_separator,
+                                options,
+                            ),
+                        )
+                    )
+
+            rendered = parallel_map(
+                _render_curve_gallery_item,
+                [task for _, task in tasks],
+                n_jobs=min(n_jobs, len(tasks)),
+            )
+            for ((entries, key, relative_path), _), written in zip(
+                tasks, rendered, strict=True
+            ):
+                if written:
+                    entries[key] = relative_path
+
+            for model_name, manifest in manifests.items():
+                manifest_path = periodic_dir / model_name / "manifest.json"
                 with manifest_path.open("w", encoding="utf8") as fh:
                     json.dump(manifest, fh, indent=2)
 
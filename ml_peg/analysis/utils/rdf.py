@@ -0,0 +1,270 @@
+"""Streaming partial radial distribution functions for trajectory analysis."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from math import pi
+
+from ase import Atoms
+from ase.data import atomic_numbers
+from ase.geometry.rdf import VolumeNotDefined, check_cell_and_r_max
+from ase.neighborlist import neighbor_list
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ml_peg.calcs.utils.parallel import parallel_map
+
+ElementPair = tuple[str, str]
+
+
+class PartialRDF:
+    """
+    Accumulate partial radial distribution functions over frames.
+
+    Histograms are accumulated one frame at a time, so trajectories of any length can
+    be analysed in bounded memory. For each pair of elements, only distances between
+    atoms of those elements within `rmax` are found, using a periodic KD-tree for
+    orthorhombic cells, or a cell list otherwise. Results match
+    `ase.geometry.rdf.get_rdf` averaged over the same frames.
+
+    Parameters
+    ----------
+    pairs
+        Pairs of element symbols to compute partial RDFs for, e.g. ``[("Cl", "C")]``.
+    rmax
+        Maximum distance, in Å.
+    nbins
+        Number of bins between 0 and `rmax`.
+    """
+
+    def __init__(self, pairs: Sequence[ElementPair], rmax: float, nbins: int) -> None:
+        """
+        Initialise accumulator.
+
+        Parameters
+        ----------
+        pairs
+            Pairs of element symbols to compute partial RDFs for.
+        rmax
+            Maximum distance, in Å.
+        nbins
+            Number of bins between 0 and `rmax`.
+        """
+        self.pairs = [tuple(pair) for pair in pairs]
+        self.rmax = rmax
+        self.nbins = nbins
+        self.bin_edges = np.linspace(0.0, rmax, nbins + 1)
+        # Histograms normalised by the number density of each frame
+        self.histograms = np.zeros((len(self.pairs), nbins))
+        self.n_frames = 0
+
+    @property
+    def r(self) -> np.ndarray:
+        """
+        Get the centre of each bin.
+
+        Returns
+        -------
+        np.ndarray
+            Distances at the centre of each bin, in Å.
+        """
+        return 0.5 * (self.bin_edges[:-1] + self.bin_edges[1:])
+
+    def _pair_distances(
+        self, atoms: Atoms, indices: dict[str, np.ndarray], pair: ElementPair
+    ) -> np.ndarray:
+        """
+        Get distances within `rmax` between atoms of a pair of elements.
+
+        Parameters
+        ----------
+        atoms
+            Structure of the frame.
+        indices
+            Indices of atoms of each element.
+        pair
+            Pair of element symbols.
+
+        Returns
+        -------
+        np.ndarray
+            Distances from each atom of the first element to each atom of the second,
+            including both orderings if the elements are the same.
+        """
+        cell = atoms.cell.array
+        lengths = np.diag(cell)
+        if atoms.pbc.all() and np.allclose(cell, np.diag(lengths)):
+            trees = []
+            for element in pair:
+                positions = atoms.positions[indices[element]] % lengths
+                # Rounding may wrap positions to exactly the box length
+                positions = np.where(
+                    positions >= lengths, positions - lengths, positions
+                )
+                trees.append(cKDTree(positions, boxsize=lengths))
+            distances = trees[0].sparse_distance_matrix(
+                trees[1], self.rmax, output_type="ndarray"
+            )
+            return distances["v"]
+
+        # Cell list restricted to atoms of the pair
+        subset = atoms[np.union1d(indices[pair[0]], indices[pair[1]])]
+        i, j, d = neighbor_list("ijd", subset, self.rmax)
+        symbols = np.array(subset.get_chemical_symbols())
+        return d[(symbols[i] == pair[0]) & (symbols[j] == pair[1])]
+
+    def add(self, atoms: Atoms) -> None:
+        """
+        Add the distances in a frame to the histograms.
+
+        Parameters
+        ----------
+        atoms
+            Structure of the frame.
+        """
+        volume = atoms.cell.volume
+        if volume < 1.0e-10:
+            raise VolumeNotDefined
+        check_cell_and_r_max(atoms, self.rmax)
+
+        dr = self.rmax / self.nbins
+        elements = {element for pair in self.pairs for element in pair}
+        indices = {
+            element: np.flatnonzero(atoms.numbers == atomic_numbers[element])
+            for element in elements
+        }
+        for k, pair in enumerate(self.pairs):
+            n_centres, n_neighbours = (len(indices[element]) for element in pair)
+            if not n_centres or not n_neighbours:
+                continue
+            distances = self._pair_distances(atoms, indices, pair)
+            # Bins include their upper edge, and coincident atoms are excluded
+            bins = np.ceil(distances / dr).astype(int)
+            counts = np.bincount(bins, minlength=self.nbins + 1)[1 : self.nbins + 1]
+            self.histograms[k] += counts * volume / (n_centres * n_neighbours)
+        self.n_frames += 1
+
+    def merge(self, other: PartialRDF) -> None:
+        """
+        Add histograms accumulated separately, e.g. over another part of a trajectory.
+
+        Parameters
+        ----------
+        other
+            Accumulator with the same pairs and bins.
+        """
+        if other.pairs != self.pairs or not np.array_equal(
+            other.bin_edges, self.bin_edges
+        ):
+            raise ValueError("Cannot merge RDFs with different pairs or bins")
+        self.histograms += other.histograms
+        self.n_frames += other.n_frames
+
+    def get_rdfs(self) -> dict[ElementPair, np.ndarray]:
+        """
+        Get the partial RDFs averaged over all frames added.
+
+        Returns
+        -------
+        dict[ElementPair, np.ndarray]
+            Partial g(r) for each pair of elements.
+        """
+        dr = self.rmax / self.nbins
+        edges = self.bin_edges[:-1]
+        shell_volumes = 4.0 * pi * dr * (edges**2 + edges * dr + dr**2 / 3.0)
+        rdfs = self.histograms / (max(self.n_frames, 1) * shell_volumes)
+        return dict(zip(self.pairs, rdfs, strict=True))
+
+
+def _chunks(images: Iterable[Atoms], chunk_size: int) -> Iterator[list[Atoms]]:
+    """
+    Split frames into lists, reading them lazily.
+
+    Parameters
+    ----------
+    images
+        Frames to split.
+    chunk_size
+        Number of frames in each list.
+
+    Yields
+    ------
+    list[Atoms]
+        Consecutive frames.
+    """
+    iterator = iter(images)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _accumulate_chunk(images: list[Atoms], template: PartialRDF) -> PartialRDF:
+    """
+    Accumulate histograms over a list of frames.
+
+    Parameters
+    ----------
+    images
+        Frames to add.
+    template
+        Accumulator defining the pairs and bins.
+
+    Returns
+    -------
+    PartialRDF
+        Accumulator containing only `images`.
+    """
+    rdf = PartialRDF(template.pairs, template.rmax, template.nbins)
+    for atoms in images:
+        rdf.add(atoms)
+    return rdf
+
+
+def compute_partial_rdfs(
+    images: Iterable[Atoms],
+    pairs: Sequence[ElementPair],
+    rmax: float,
+    nbins: int,
+    n_jobs: int = 1,
+    chunk_size: int = 100,
+    desc: str | None = None,
+) -> tuple[np.ndarray, dict[ElementPair, np.ndarray]]:
+    """
+    Compute partial RDFs averaged over frames in a single pass.
+
+    Frames are read lazily in chunks of `chunk_size`, so a streaming source such as
+    `ase.io.iread` or `BinaryTrajectoryReader` keeps memory bounded.
+
+    Parameters
+    ----------
+    images
+        Frames to average over.
+    pairs
+        Pairs of element symbols to compute partial RDFs for, e.g. ``[("Cl", "C")]``.
+    rmax
+        Maximum distance, in Å.
+    nbins
+        Number of bins between 0 and `rmax`.
+    n_jobs
+        Number of processes to accumulate chunks over. Default is 1.
+    chunk_size
+        Number of frames in each chunk. Default is 100.
+    desc
+        Description for the progress bar, which counts chunks. Default is `None`.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[ElementPair, np.ndarray]]
+        Distances at the centre of each bin, and partial g(r) for each pair.
+    """
+    rdf = PartialRDF(pairs, rmax, nbins)
+    for chunk_rdf in parallel_map(
+        _accumulate_chunk,
+        _chunks(images, chunk_size),
+        init_worker=PartialRDF,
+        init_args=(pairs, rmax, nbins),
+        n_jobs=n_jobs,
+        desc=desc,
+    ):
+        rdf.merge(chunk_rdf)
+    return rdf.r, rdf.get_rdfs()
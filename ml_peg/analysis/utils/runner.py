@@ -0,0 +1,215 @@
+"""Run analysis modules concurrently, scheduling the slowest first."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import json
+from pathlib import Path
+import re
+import subprocess
+import sys
+import time
+
+from ml_peg.app import APP_ROOT
+
+# Durations of previous runs of each analysis module, in seconds
+DURATIONS_PATH = APP_ROOT / "data" / ".analysis_durations.json"
+
+# Outputs of other analysis modules read by a module, e.g.
+# APP_ROOT / "data" / "bulk_crystal" / "phonons"
+DATA_PATTERN = re.compile(r'APP_ROOT\s*/\s*"data"\s*/\s*"([^"]+)"\s*/\s*"([^"]+)"')
+
+
+def get_test_id(path: Path) -> str:
+    """
+    Get the identifier of an analysis module.
+
+    Parameters
+    ----------
+    path
+        Path to analysis module, ``[category]/[test]/analyse_[test].py``.
+
+    Returns
+    -------
+    str
+        Identifier of the form ``[category]/[test]``.
+    """
+    return f"{path.parent.parent.name}/{path.parent.name}"
+
+
+def get_dependencies(paths: Sequence[Path]) -> dict[str, set[str]]:
+    """
+    Find analysis modules that read the app data written by other modules.
+
+    Parameters
+    ----------
+    paths
+        Paths to analysis modules.
+
+    Returns
+    -------
+    dict[str, set[str]]
+        Identifiers of the modules each module depends on, out of those in `paths`.
+    """
+    test_ids = {get_test_id(path) for path in paths}
+    dependencies = {}
+    for path in paths:
+        test_id = get_test_id(path)
+        dependencies[test_id] = {
+            f"{category}/{test}"
+            for category, test in DATA_PATTERN.findall(path.read_text(encoding="utf8"))
+        } & (test_ids - {test_id})
+    return dependencies
+
+
+def load_durations(path: Path = DURATIONS_PATH) -> dict[str, float]:
+    """
+    Load the durations of previous analysis runs.
+
+    Parameters
+    ----------
+    path
+        Path to JSON file of durations. Default is `DURATIONS_PATH`.
+
+    Returns
+    -------
+    dict[str, float]
+        Duration of each analysis module, in seconds.
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf8") as file:
+        return json.load(file)
+
+
+def save_durations(durations: dict[str, float], path: Path = DURATIONS_PATH) -> None:
+    """
+    Save the durations of analysis runs, keeping those of modules not run.
+
+    Parameters
+    ----------
+    durations
+        Duration of each analysis module run, in seconds.
+    path
+        Path to JSON file of durations. Default is `DURATIONS_PATH`.
+    """
+    durations = load_durations(path) | durations
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(durations, file, indent=2, sort_keys=True)
+
+
+def run_module(path: Path, pytest_args: Sequence[str]) -> tuple[int, float, str]:
+    """
+    Run an analysis module with pytest in a separate process.
+
+    Parameters
+    ----------
+    path
+        Path to analysis module.
+    pytest_args
+        Additional arguments to pass to pytest.
+
+    Returns
+    -------
+    tuple[int, float, str]
+        Exit code of pytest, wall time in seconds, and combined output.
+    """
+    start = time.perf_counter()
+    # Disable the pytest cache, which would otherwise be written by every process
+    process = subprocess.run(
+        [sys.executable, "-m", "pytest", str(path), "-p", "no:cacheprovider"]
+        + list(pytest_args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        check=False,
+    )
+    return process.returncode, time.perf_counter() - start, process.stdout
+
+
+def run_analysis_parallel(
+    paths: Sequence[Path],
+    pytest_args: Sequence[str] = (),
+    n_jobs: int = 1,
+    verbose: bool = True,
+    durations_path: Path = DURATIONS_PATH,
+) -> int:
+    """
+    Run analysis modules concurrently, each with pytest in its own process.
+
+    Modules with the longest recorded durations are started first, with modules that
+    have not been run before treated as the slowest, so the total time approaches that
+    of the slowest module. Modules that read the app data written by another module
+    are started once that module has finished. Each module only writes to its own
+    ``app/data/[category]/[test]`` directory, so modules cannot interfere.
+
+    Parameters
+    ----------
+    paths
+        Paths to analysis modules.
+    pytest_args
+        Additional arguments to pass to pytest. Default is ``()``.
+    n_jobs
+        Number of modules to run concurrently. Default is 1.
+    verbose
+        Whether to print the output of every module, rather than only those that
+        fail. Default is `True`.
+    durations_path
+        Path to JSON file of durations, which is updated with the durations of this
+        run. Default is `DURATIONS_PATH`.
+
+    Returns
+    -------
+    int
+        Zero if all modules passed, otherwise the first non-zero pytest exit code.
+    """
+    paths = {get_test_id(Path(path)): Path(path) for path in paths}
+    dependencies = get_dependencies(list(paths.values()))
+    previous = load_durations(durations_path)
+
+    pending = set(paths)
+    finished: set[str] = set()
+    running: dict[Future, str] = {}
+    durations: dict[str, float] = {}
+    exit_code = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        while pending or running:
+            ready = [
+                test_id
+                for test_id in sorted(pending)
+                if dependencies[test_id] <= finished
+            ]
+            if not ready and not running:
+                # Cyclic dependencies cannot be satisfied, so run in any order
+                ready = sorted(pending)
+            ready.sort(
+                key=lambda test_id: previous.get(test_id, float("inf")), reverse=True
+            )
+            for test_id in ready[: max(1, n_jobs) - len(running)]:
+                pending.remove(test_id)
+                future = executor.submit(run_module, paths[test_id], pytest_args)
+                running[future] = test_id
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                test_id = running.pop(future)
+                code, duration, output = future.result()
+                finished.add(test_id)
+                durations[test_id] = duration
+                # No tests collected, e.g. due to filtering, is not a failure
+                failed = code not in (0, 5)
+                if failed and not exit_code:
+                    exit_code = code
+                if verbose or failed:
+                    print(output)
+                status = "FAILED" if failed else "passed"
+                print(
+                    f"[{len(finished)}/{len(paths)}] {test_id} {status} in "
+                    f"{duration:.1f} s"
+                )
+
+    save_durations(durations, durations_path)
+    return exit_code
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import hashlib
+import json
+import os
 from pathlib import Path
+import tempfile
 from typing import Any
 
-from ase.io import read, write
 from matplotlib import cm
 from matplotlib.colors import Colormap
 import numpy as np
@@ -181,6 +184,62 @@ def rmse(ref: list, prediction: list) -> float:
 DENSITY_GRID_SIZE = 80
 DENSITY_MAX_POINTS_PER_CELL = 5
 DENSITY_SAMPLE_SEED = 0
+# Directory within each benchmark's app data storing structures for density plots,
+# and the index file within each trajectory directory listing their ids
+DENSITY_STRUCTURES_DIRNAME = "density_structures"
+DENSITY_TRAJ_INDEX = "index.json"
+
+
+@dataclass(frozen=True)
+class DensityGridSample:
+    """
+    Points sampled from a density grid, with the membership of each occupied cell.
+
+    Cell memberships are stored in compressed sparse row (CSR) form: the source
+    indices of points in occupied cell ``c`` are
+    ``members[offsets[c]:offsets[c + 1]]``.
+    """
+
+    indices: np.ndarray
+    """Source indices of sampled points, in plotting order."""
+    density: np.ndarray
+    """Number of points in the cell of each sampled point."""
+    cells: np.ndarray
+    """Occupied cell of each sampled point, indexing `cell_ids` and `offsets`."""
+    cell_ids: np.ndarray
+    """Linear grid index (``x_bin * grid_size + y_bin``) of each occupied cell."""
+    offsets: np.ndarray
+    """Start of each occupied cell in `members`, followed by the number of points."""
+    members: np.ndarray
+    """Source indices of all binned points, grouped by cell in ascending order."""
+
+    def __len__(self) -> int:
+        """
+        Get the number of sampled points.
+
+        Returns
+        -------
+        int
+            Number of sampled points.
+        """
+        return len(self.indices)
+
+    def get_members(self, point: int) -> np.ndarray:
+        """
+        Get the source indices of all points in the same cell as a sampled point.
+
+        Parameters
+        ----------
+        point
+            Position of the sampled point in `indices`.
+
+        Returns
+        -------
+        np.ndarray
+            Source indices in the cell of the sampled point.
+        """
+        cell = self.cells[point]
+        return self.members[self.offsets[cell] : self.offsets[cell + 1]]
 
 
 def sample_density_grid(
@@ -190,12 +249,15 @@ def sample_density_grid(
     grid_size: int = DENSITY_GRID_SIZE,
     max_points_per_cell: int = DENSITY_MAX_POINTS_PER_CELL,
     seed: int = DENSITY_SAMPLE_SEED,
-) -> tuple[list[int], list[int], list[list[int]]]:
+) -> DensityGridSample:
     """
     Sample indices from a density grid, returning density and cell memberships.
 
     This is the shared implementation used by ``plot_density_scatter`` so the
-    sampling order stays consistent across density-driven artifacts.
+    sampling order stays consistent across density-driven artifacts. Points are
+    binned and sampled with array operations on linear cell indices, so memory and
+    time scale with the number of points rather than with the square of the number
+    of points per cell.
 
     Parameters
     ----------
@@ -213,16 +275,31 @@ def sample_density_grid(
 
     Returns
     -------
-    tuple[list[int], list[int], list[list[int]]]
-        ``sampled_indices``: original indices kept in plotting order.
-        ``sampled_density``: density value per sampled index.
-        ``sampled_mapping``: list of source indices for each sampled point.
+    DensityGridSample
+        Sampled indices ordered by cell, their densities, and the members of each
+        occupied cell.
     """
     ref_arr = np.asarray(ref_vals, dtype=float)
     pred_arr = np.asarray(pred_vals, dtype=float)
 
-    if ref_arr.size == 0 or pred_arr.size == 0:
-        return [], [], []
+    # Missing values (None or NaN) are not binned or sampled
+    valid = (
+        np.flatnonzero(np.isfinite(ref_arr) & np.isfinite(pred_arr))
+        if ref_arr.size and pred_arr.size
+        else np.empty(0, dtype=np.intp)
+    )
+    if valid.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return DensityGridSample(
+            indices=empty,
+            density=empty,
+            cells=empty,
+            cell_ids=empty,
+            offsets=np.zeros(1, dtype=np.intp),
+            members=empty,
+        )
+    ref_arr = ref_arr[valid]
+    pred_arr = pred_arr[valid]
 
     delta_x = ref_arr.max() - ref_arr.min()
     delta_y = pred_arr.max() - pred_arr.min()
@@ -230,29 +307,35 @@ def sample_density_grid(
 
     norm_x = np.clip((ref_arr - ref_arr.min()) / max(delta_x, eps), 0.0, 0.999999)
     norm_y = np.clip((pred_arr - pred_arr.min()) / max(delta_y, eps), 0.0, 0.999999)
-    bins_x = (norm_x * grid_size).astype(int)
-    bins_y = (norm_y * grid_size).astype(int)
-
-    cell_points: dict[tuple[int, int], list[int]] = defaultdict(list)
-    for idx, (cx, cy) in enumerate(zip(bins_x, bins_y, strict=True)):
-        cell_points[(int(cx), int(cy))].append(idx)
-
+    bins_x = (norm_x * grid_size).astype(np.intp)
+    bins_y = (norm_y * grid_size).astype(np.intp)
+    point_cells = bins_x * grid_size + bins_y
+
+    # Group points by cell, keeping source order within each cell
+    members = np.argsort(point_cells, kind="stable")
+    grid_counts = np.bincount(point_cells, minlength=grid_size * grid_size)
+    cell_ids = np.flatnonzero(grid_counts)
+    counts = grid_counts[cell_ids]
+    offsets = np.zeros(len(cell_ids) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    starts = offsets[:-1]
+
+    # Shuffle points within each cell and keep the first of each, which samples
+    # uniformly without replacement
     rng = np.random.default_rng(seed)
-    sampled_indices: list[int] = []
-    sampled_density: list[int] = []
-    sampled_mapping: list[list[int]] = []
-    for indices in cell_points.values():
-        if len(indices) > max_points_per_cell:
-            chosen = rng.choice(indices, size=max_points_per_cell, replace=False)
-        else:
-            chosen = indices
-        density = len(indices)
-        for idx in chosen:
-            sampled_indices.append(int(idx))
-            sampled_density.append(density)
-            sampled_mapping.append(indices)
-
-    return sampled_indices, sampled_density, sampled_mapping
+    shuffled = np.argsort(point_cells + rng.random(len(point_cells)))
+    rank = np.arange(len(shuffled)) - np.repeat(starts, counts)
+    keep = rank < max_points_per_cell
+    cells = np.repeat(np.arange(len(cell_ids), dtype=np.intp), counts)[keep]
+
+    return DensityGridSample(
+        indices=valid[shuffled[keep]],
+        density=counts[cells],
+        cells=cells,
+        cell_ids=cell_ids,
+        offsets=offsets,
+        members=valid[members],
+    )
 
 
 def build_density_inputs(
@@ -304,6 +387,61 @@ def build_density_inputs(
     return inputs
 
 
+def store_structure(path: Path, store_dir: Path) -> str:
+    """
+    Copy a structure file into a content-addressed store, if not already stored.
+
+    Parameters
+    ----------
+    path
+        Structure file to store.
+    store_dir
+        Directory of stored structures.
+
+    Returns
+    -------
+    str
+        Identifier of the structure, which is its filename within `store_dir`.
+    """
+    data = path.read_bytes()
+    struct_id = f"{hashlib.sha256(data).hexdigest()[:16]}{path.suffix}"
+    stored_path = store_dir / struct_id
+    if not stored_path.exists():
+        with tempfile.NamedTemporaryFile(
+            dir=store_dir, prefix=f".{struct_id}.", delete=False
+        ) as file:
+            file.write(data)
+        os.replace(file.name, stored_path)
+    return struct_id
+
+
+def prune_structure_store(store_dir: Path) -> None:
+    """
+    Remove stored structures that are not listed in any density index.
+
+    Indices are found anywhere within the parent of `store_dir`, which contains the
+    directory of each model.
+
+    Parameters
+    ----------
+    store_dir
+        Directory of stored structures.
+    """
+    referenced: set[str] = set()
+    for index_path in store_dir.parent.rglob(DENSITY_TRAJ_INDEX):
+        try:
+            with open(index_path, encoding="utf8") as file:
+                cells = json.load(file).get("cells", [])
+        except (OSError, ValueError, AttributeError):
+            continue
+        for cell in cells:
+            referenced.update(cell)
+
+    for stored_path in store_dir.iterdir():
+        if not stored_path.name.startswith(".") and stored_path.name not in referenced:
+            stored_path.unlink()
+
+
 def write_density_trajectories(
     *,
     labels_list: list[str],
@@ -312,12 +450,19 @@ def write_density_trajectories(
     struct_dir: Path,
     traj_dir: Path,
     struct_filename_builder: Callable[[str], str],
+    store_dir: Path | None = None,
     grid_size: int = DENSITY_GRID_SIZE,
     max_points_per_cell: int = DENSITY_MAX_POINTS_PER_CELL,
     seed: int = DENSITY_SAMPLE_SEED,
 ) -> None:
     """
-    Write one extxyz trajectory per sampled density point for WEAS display.
+    Write the structures in the cell of each sampled density point for WEAS display.
+
+    Each structure is copied once into a content-addressed store shared by all
+    models, and ``traj_dir/index.json`` lists the structure ids in each occupied
+    cell (``"cells"``) and the cell of each sampled point (``"points"``), so
+    structures shared by points or models are not duplicated. Stored structures no
+    longer listed in any index are then removed.
 
     Parameters
     ----------
@@ -330,9 +475,12 @@ def write_density_trajectories(
     struct_dir
         Directory containing per-system structure files.
     traj_dir
-        Output directory for sampled density trajectories.
+        Output directory for the index of sampled density points.
     struct_filename_builder
         Function to convert each label into the source structure filename.
+    store_dir
+        Directory of stored structures. Default is `DENSITY_STRUCTURES_DIRNAME`
+        within the parent of the model directory containing `traj_dir`.
     grid_size
         Number of bins per axis. Must match ``@plot_density_scatter``.
     max_points_per_cell
@@ -340,7 +488,7 @@ def write_density_trajectories(
     seed
         RNG seed for deterministic sampling.
     """
-    _, _, sampled_mapping = sample_density_grid(
+    sample = sample_density_grid(
         ref_vals,
         pred_vals,
         grid_size=grid_size,
@@ -348,15 +496,33 @@ def write_density_trajectories(
         seed=seed,
     )
 
+    if store_dir is None:
+        store_dir = traj_dir.parent.parent / DENSITY_STRUCTURES_DIRNAME
+    store_dir.mkdir(parents=True, exist_ok=True)
     traj_dir.mkdir(parents=True, exist_ok=True)
 
-    for point_idx, source_indices in enumerate(sampled_mapping):
-        frames = []
-        for source_idx in source_indices:
-            label = labels_list[source_idx]
-            struct_path = struct_dir / struct_filename_builder(label)
-            frames.append(read(struct_path))
-        write(traj_dir / f"{point_idx}.extxyz", frames)
+    # Remove trajectories written per sampled point by previous versions
+    for old_traj in traj_dir.glob("*.extxyz"):
+        old_traj.unlink()
+
+    # Only cells containing sampled points are listed, renumbered in order
+    sampled_cells, point_cells = np.unique(sample.cells, return_inverse=True)
+    cells = [
+        [
+            store_structure(
+                struct_dir / struct_filename_builder(labels_list[source_idx]),
+                store_dir,
+            )
+            for source_idx in sample.members[
+                sample.offsets[cell] : sample.offsets[cell + 1]
+            ]
+        ]
+        for cell in sampled_cells
+    ]
+
+    with open(traj_dir / DENSITY_TRAJ_INDEX, "w", encoding="utf8") as file:
+        json.dump({"cells": cells, "points": point_cells.tolist()}, file)
+    prune_structure_store(store_dir)
 
 
 def calc_metric_scores(
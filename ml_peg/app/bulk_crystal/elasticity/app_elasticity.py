@@ -11,7 +11,7 @@ from dash.html import Div
 from ml_peg.app import APP_ROOT
 from ml_peg.app.base_app import BaseApp
 from ml_peg.app.utils.build_callbacks import plot_from_table_cell, struct_from_scatter
-from ml_peg.app.utils.load import read_density_plot_for_model
+from ml_peg.app.utils.load import collect_traj_assets, read_density_plot_for_model
 from ml_peg.models.get_models import get_model_names
 from ml_peg.models.models import current_models
 
@@ -68,24 +68,26 @@ class ElasticityApp(BaseApp):
         )
 
         # Structure visualization: density scatter (traj mode) and violin (struct mode)
-        for model in MODELS:
+        density_trajs = {
+            prop: collect_traj_assets(
+                data_path=DATA_PATH,
+                assets_prefix="/assets/bulk_crystal/elasticity",
+                models=MODELS,
+                traj_dirname=traj_subdir,
+            )
             for prop, traj_subdir in [
                 ("bulk", "density_bulk"),
                 ("shear", "density_shear"),
-            ]:
-                traj_dir = DATA_PATH / model / traj_subdir
-                if not traj_dir.exists():
+            ]
+        }
+        for model in MODELS:
+            for prop, struct_trajs in density_trajs.items():
+                if model not in struct_trajs:
                     continue
-                traj_files = sorted(
-                    traj_dir.glob("*.extxyz"), key=lambda p: int(p.stem)
-                )
                 struct_from_scatter(
                     scatter_id=f"{BENCHMARK_NAME}-{model}-{prop}-figure",
                     struct_id=f"{BENCHMARK_NAME}-struct-placeholder",
-                    structs=[
-                        f"/assets/bulk_crystal/elasticity/{model}/{traj_subdir}/{p.name}"
-                        for p in traj_files
-                    ],
+                    structs=struct_trajs[model],
                     mode="traj",
                 )
 
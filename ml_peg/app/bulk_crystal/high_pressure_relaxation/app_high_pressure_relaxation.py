@@ -53,8 +53,8 @@ class HighPressureRelaxationApp(BaseApp):
             cell_to_plot=density_plots,
         )
 
-        vol_trajs: dict[tuple[str, str], list[str]] = {}
-        energy_trajs: dict[tuple[str, str], list[str]] = {}
+        vol_trajs: dict[tuple[str, str], list[list[str]]] = {}
+        energy_trajs: dict[tuple[str, str], list[list[str]]] = {}
         for p_label in PRESSURE_LABELS:
             vol_per_p = collect_traj_assets(
                 data_path=DATA_PATH,
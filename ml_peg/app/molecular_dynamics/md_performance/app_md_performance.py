@@ -0,0 +1,52 @@
+"""Run MD performance app."""
+
+from __future__ import annotations
+
+from dash import Dash
+
+from ml_peg.app import APP_ROOT
+from ml_peg.app.base_app import BaseApp
+from ml_peg.models.get_models import get_model_names
+from ml_peg.models.models import current_models
+
+MODELS = get_model_names(current_models)
+BENCHMARK_NAME = "MD Performance"
+DOCS_URL = "https://ddmms.github.io/ml-peg/user_guide/benchmarks/molecular_dynamics.html#md-performance"
+DATA_PATH = APP_ROOT / "data" / "molecular_dynamics" / "md_performance"
+
+
+class MDPerformanceApp(BaseApp):
+    """MD performance benchmark app layout and callbacks."""
+
+    def register_callbacks(self) -> None:
+        """Register callbacks to app."""
+
+
+def get_app() -> MDPerformanceApp:
+    """
+    Get MD performance benchmark app layout and callback registration.
+
+    Returns
+    -------
+    MDPerformanceApp
+        Benchmark layout and callback registration.
+    """
+    return MDPerformanceApp(
+        name=BENCHMARK_NAME,
+        description=(
+            "Throughput of molecular dynamics benchmarks, aggregated over water "
+            "density, liquid densities and BMIMCl simulations. Timings depend on the "
+            "hardware used to run each model."
+        ),
+        docs_url=DOCS_URL,
+        table_path=DATA_PATH / "md_performance_metrics_table.json",
+        extra_components=[],
+    )
+
+
+if __name__ == "__main__":
+    full_app = Dash(__name__, assets_folder=DATA_PATH.parent.parent)
+    benchmark_app = get_app()
+    full_app.layout = benchmark_app.layout
+    benchmark_app.register_callbacks()
+    full_app.run(port=8064, debug=True)
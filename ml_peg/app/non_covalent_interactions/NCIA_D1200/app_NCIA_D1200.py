@@ -44,7 +44,6 @@ class NCIAD1200App(BaseApp):
             assets_prefix="/assets/non_covalent_interactions/NCIA_D1200",
             models=MODELS,
             traj_dirname="density_traj",
-            suffix=".extxyz",
         )
         for model in struct_trajs:
             struct_from_scatter(
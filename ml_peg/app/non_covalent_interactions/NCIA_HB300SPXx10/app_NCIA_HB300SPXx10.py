@@ -47,7 +47,6 @@ class NCIANHB300SPXx10App(BaseApp):
             assets_prefix="/assets/non_covalent_interactions/NCIA_HB300SPXx10",
             models=MODELS,
             traj_dirname="density_traj",
-            suffix=".extxyz",
         )
         for model in struct_trajs:
             struct_from_scatter(
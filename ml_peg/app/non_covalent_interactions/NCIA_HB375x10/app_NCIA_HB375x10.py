@@ -47,7 +47,6 @@ class NCIANHB375x10App(BaseApp):
             assets_prefix="/assets/non_covalent_interactions/NCIA_HB375x10",
             models=MODELS,
             traj_dirname="density_traj",
-            suffix=".extxyz",
         )
         for model in struct_trajs:
             struct_from_scatter(
@@ -47,7 +47,6 @@ class NCIAR739x5App(BaseApp):
             assets_prefix="/assets/non_covalent_interactions/NCIA_R739x5",
             models=MODELS,
             traj_dirname="density_traj",
-            suffix=".extxyz",
         )
         for model in struct_trajs:
             struct_from_scatter(
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import base64
 from collections.abc import Callable
-import io
-import json
 import math
 from pathlib import Path
 from typing import Literal
@@ -15,14 +13,10 @@ from dash.dcc import Graph
 from dash.development.base_component import Component
 from dash.exceptions import PreventUpdate
 from dash.html import Div, Iframe
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 
-from ml_peg.analysis.utils.decorators import (
-    PERIODIC_TABLE_COLS,
-    PERIODIC_TABLE_POSITIONS,
-    PERIODIC_TABLE_ROWS,
-)
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME
+from ml_peg.analysis.utils.decorators import cached_curve_gallery_figure
 from ml_peg.app.utils.weas import generate_weas_html
 
 
@@ -184,7 +178,7 @@ def plot_from_scatter(
 def struct_from_scatter(
     scatter_id: str,
     struct_id: str,
-    structs: str | list[str],
+    structs: str | list[str] | list[list[str]],
     mode: Literal["struct", "traj"] = "struct",
 ) -> None:
     """
@@ -198,6 +192,8 @@ def struct_from_scatter(
         ID for Dash plot placeholder Div where structures will be visualised.
     structs
         List of structure filenames in same order as scatter data to be visualised.
+        Each entry may instead be a list of filenames, which are loaded together
+        as a trajectory.
     mode
         Whether to display a single structure ("struct"), or trajectory from an initial
         image ("traj"). Default is "struct".
@@ -403,9 +399,10 @@ def register_image_gallery_callbacks(
     manifest_dir: str | Path,
     curve_dir: str | Path,
     overview_label: str = "All",
+    cache_dir: str | Path | None = None,
 ) -> None:
     """
-    Register callbacks to display pre-rendered images stored per model.
+    Register callbacks to display periodic-table images of curves for each model.
 
     Parameters
     ----------
@@ -418,12 +415,20 @@ def register_image_gallery_callbacks(
     manifest_dir
         Directory containing per-model ``manifest.json`` files.
     curve_dir
-        Directory of per-model curve JSON payloads. Element selections are rendered on
-        the fly from these payloads instead of relying on pre-generated element images.
+        Directory of per-model curve JSON payloads. Images are rendered on the fly
+        from these payloads when first viewed, instead of relying on pre-generated
+        images.
     overview_label
         Dropdown label representing the overview image. Default is ``"All"``.
+    cache_dir
+        Directory to store rendered images in, so each is only rendered again if its
+        curves change. Default is ``CACHE_DIR_NAME / "gallery"`` alongside
+        `curve_dir`.
     """
     curve_base = Path(curve_dir) if curve_dir else None
+    cache_base = (
+        Path(cache_dir) if cache_dir else curve_base.parent / CACHE_DIR_NAME / "gallery"
+    )
 
     def _data_url(path: Path) -> tuple[str, float, float]:
         """
@@ -477,35 +482,6 @@ def register_image_gallery_callbacks(
         encoded = base64.b64encode(path.read_bytes()).decode()
         return f"data:{mime};base64,{encoded}", width, height
 
-    def _data_url_from_bytes(
-        data: bytes, mime: str = "image/png"
-    ) -> tuple[str, float, float]:
-        """
-        Build a data URL from raw bytes and infer image dimensions.
-
-        Parameters
-        ----------
-        data
-            Raw image bytes.
-        mime
-            MIME type string for the encoded image.
-
-        Returns
-        -------
-        tuple[str, float, float]
-            Data URL string and inferred image width/height (falls back to 1.0).
-        """
-        width, height = 1.0, 1.0
-        try:
-            from PIL import Image
-
-            with Image.open(io.BytesIO(data)) as im:
-                width, height = float(im.width), float(im.height)
-        except Exception:
-            pass
-        encoded = base64.b64encode(data).decode()
-        return f"data:{mime};base64,{encoded}", width, height
-
     def _image_figure(src: str, width: float, height: float) -> go.Figure:
         """
         Build a Plotly figure that displays the supplied image.
@@ -595,12 +571,9 @@ def register_image_gallery_callbacks(
         element_opts: list[str] = []
         model_curve_dir = curve_base / model_name
         if model_curve_dir.exists():
+            # Payloads are named after their pair, so need not be read
             for curve_file in model_curve_dir.glob("*.json"):
-                try:
-                    payload = json.loads(curve_file.read_text())
-                except Exception:
-                    continue
-                pair = payload.get("pair") or curve_file.stem
+                pair = curve_file.stem
                 try:
                     first, second = pair.split("-")
                 except ValueError:
@@ -637,109 +610,25 @@ def register_image_gallery_callbacks(
         if not model_name:
             raise PreventUpdate
 
-        model_curve_dir = curve_base / model_name
-        if not model_curve_dir.exists():
-            raise PreventUpdate
-
-        curves: dict[str, dict] = {}
-        for curve_file in model_curve_dir.glob("*.json"):
-            try:
-                payload = json.loads(curve_file.read_text())
-            except Exception:
-                continue
-            pair = payload.get("pair") or curve_file.stem
-            curves[pair] = payload
-
-        if not curves:
-            raise PreventUpdate
-
-        # Decide which pairs to render: overview -> homonuclear only, otherwise
-        # all pairs involving the selected element.
         selected_element = None if element_value == overview_label else element_value
-        filtered: dict[str, dict] = {}
-        for pair, payload in curves.items():
-            try:
-                first, second = pair.split("-")
-            except ValueError:
-                first = second = pair
-            if selected_element is None:
-                if first == second:
-                    filtered[pair] = payload
-            else:
-                if selected_element in (first, second):
-                    filtered[pair] = payload
-
-        if not filtered:
-            raise PreventUpdate
-
-        import matplotlib as mpl
-
-        # Ensure a non-interactive backend for server-side rendering
-        try:
-            mpl.use("Agg")
-        except Exception:
-            pass
-
-        fig, axes = plt.subplots(
-            PERIODIC_TABLE_ROWS,
-            PERIODIC_TABLE_COLS,
-            figsize=(30, 15),
-            constrained_layout=True,
-        )
-        axes = axes.reshape(PERIODIC_TABLE_ROWS, PERIODIC_TABLE_COLS)
-        for ax in axes.ravel():
-            ax.axis("off")
-
-        has_data = False
-        for pair, payload in filtered.items():
-            first, second = pair.split("-") if "-" in pair else (pair, pair)
-            other = second if selected_element == first else first
-            pos = PERIODIC_TABLE_POSITIONS.get(other)
-            if pos is None:
-                continue
-            x_vals = payload.get("distance") or []
-            y_vals = payload.get("energy") or []
-            if not x_vals or not y_vals:
-                continue
-            try:
-                x = [float(v) for v in x_vals]
-                y = [float(v) for v in y_vals]
-            except Exception:
-                continue
-
-            shift = y[-1]
-            y_shifted = [yy - shift for yy in y]
-            row, col = pos
-            ax = axes[row, col]
-            ax.axis("on")
-            ax.plot(x, y_shifted, linewidth=1, zorder=1)
-            ax.axhline(0, color="grey", linewidth=0.5, zorder=0)
-            ax.set_title(f"{first}-{second}, shift: {shift:.4f}", fontsize=8)
-            ax.set_xticks([0, 2, 4, 6])
-            ax.set_yticks([-20, -10, 0, 10, 20])
-            ax.set_xlim(0, 6)
-            ax.set_ylim(-20, 20)
-            if selected_element and (first == second == selected_element):
-                for spine in ax.spines.values():
-                    spine.set_edgecolor("crimson")
-                    spine.set_linewidth(2)
-            has_data = True
-
-        if not has_data:
-            plt.close(fig)
-            raise PreventUpdate
-
         title = (
             f"Heteronuclear diatomics for {selected_element}: {model_name}"
             if selected_element
             else f"Homonuclear diatomics: {model_name}"
         )
-        fig.suptitle(title, fontsize=32, fontweight="bold")
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=200)
-        plt.close(fig)
-        src, width, height = _data_url_from_bytes(buf.getvalue(), mime="image/png")
-        return _image_figure(src, width, height)
+        path = cached_curve_gallery_figure(
+            curve_base / model_name,
+            cache_base / model_name,
+            element=selected_element,
+            title=title,
+            figsize=(30, 15),
+            dpi=200,
+            suptitle_kwargs={"fontsize": 32, "fontweight": "bold"},
+            style="app",
+        )
+        if path is None:
+            raise PreventUpdate
+        return _image_figure(*_data_url(path))
 
 
 def scatter_and_assets_from_table(
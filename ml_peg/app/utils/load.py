@@ -11,7 +11,12 @@ from dash.dash_table import DataTable
 from dash.dcc import Graph
 from plotly.io import read_json
 
-from ml_peg.analysis.utils.utils import calc_metric_scores, get_table_style
+from ml_peg.analysis.utils.utils import (
+    DENSITY_STRUCTURES_DIRNAME,
+    DENSITY_TRAJ_INDEX,
+    calc_metric_scores,
+    get_table_style,
+)
 from ml_peg.app.utils.utils import (
     build_level_of_theory_warnings,
     calculate_column_widths,
@@ -344,10 +349,10 @@ def collect_traj_assets(
     assets_prefix: str,
     models: list[str],
     traj_dirname: str = "density_traj",
-    suffix: str = ".extxyz",
-) -> dict[str, list[str]]:
+    store_dirname: str = DENSITY_STRUCTURES_DIRNAME,
+) -> dict[str, list[list[str]]]:
     """
-    Collect trajectory asset paths for each model.
+    Collect the structure asset paths of each sampled density point for each model.
 
     Parameters
     ----------
@@ -358,27 +363,32 @@ def collect_traj_assets(
     models
         Ordered list of model names to include.
     traj_dirname
-        Subdirectory name containing trajectories (default: ``"density_traj"``).
-    suffix
-        File suffix to match (default: ``".extxyz"``).
+        Subdirectory name containing the index of sampled density points (default:
+        ``"density_traj"``).
+    store_dirname
+        Directory within `data_path` containing stored structures (default:
+        `DENSITY_STRUCTURES_DIRNAME`).
 
     Returns
     -------
-    dict[str, list[str]]
-        Mapping of model name to list of asset paths.
+    dict[str, list[list[str]]]
+        Mapping of model name to the asset paths of the structures in the density
+        cell of each sampled point.
     """
     assets_base = assets_prefix.rstrip("/")
-    struct_trajs: dict[str, list[str]] = {}
+    struct_trajs: dict[str, list[list[str]]] = {}
 
     for model in models:
-        traj_dir = data_path / model / traj_dirname
-        traj_files = sorted(
-            traj_dir.glob(f"*{suffix}"), key=lambda path: int(path.stem)
-        )
-        if traj_files:
-            struct_trajs[model] = [
-                f"{assets_base}/{model}/{traj_dirname}/{traj_file.name}"
-                for traj_file in traj_files
-            ]
+        index_path = data_path / model / traj_dirname / DENSITY_TRAJ_INDEX
+        if not index_path.exists():
+            continue
+        with open(index_path, encoding="utf8") as file:
+            index = json.load(file)
+        cells = [
+            [f"{assets_base}/{store_dirname}/{struct_id}" for struct_id in cell]
+            for cell in index["cells"]
+        ]
+        if index["points"]:
+            struct_trajs[model] = [cells[cell] for cell in index["points"]]
 
     return struct_trajs
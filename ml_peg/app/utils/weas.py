@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Literal
 
 
 def generate_weas_html(
-    filename: str | Path,
+    filename: str | Path | list[str],
     mode: Literal["struct", "traj"] = "struct",
     index: int = 0,
 ) -> str:
@@ -17,7 +18,8 @@ def generate_weas_html(
     Parameters
     ----------
     filename
-        Path of structure file.
+        Path of structure file, or list of paths of structure files in the same
+        format, which are fetched when viewed and loaded as a single set of frames.
     mode
         Whether viewing a single structure (or set of structures) ("struct"), or
         if different views of the a trajectory are being selected ("traj").
@@ -31,6 +33,12 @@ def generate_weas_html(
     str
         HTML for WEAS to visualise structure.
     """
+    filenames = (
+        [str(name) for name in filename]
+        if isinstance(filename, list)
+        else [str(filename)]
+    )
+
     if mode == "struct":
         frame = 0
         atoms_txt = f"atoms[{index}" if index else "atoms"
@@ -73,27 +81,35 @@ def generate_weas_html(
         }};
         const editor = new WEAS({{ domElement, viewerConfig: {{ _modelStyle: 1 }}, guiConfig}});
 
-        let structureData;
-        const filename = "{str(filename)}";
+        const filenames = {json.dumps(filenames)};
+        const filename = filenames[0];
         const title = document.getElementById("weas-title");
         if (title) {{
             const basename = filename.split(/[/\\\\]/).pop() || filename;
-            title.textContent = `Viewing: ${{basename}}`;
-            title.title = basename;
+            const label = filenames.length > 1 ? `${{filenames.length}} structures` : basename;
+            title.textContent = `Viewing: ${{label}}`;
+            title.title = label;
+        }}
+        console.log("filenames: ", filenames);
+        const structureData = await Promise.all(filenames.map(fetchFile));
+
+        // Structures from multiple files are combined into a single set of frames
+        function parseAll(parser) {{
+            if (structureData.length === 1) {{
+                return parser(structureData[0]);
+            }}
+            return structureData.flatMap((data) => parser(data));
         }}
-        console.log("filename: ", filename);
-        structureData = await fetchFile(filename);
-        console.log("structureData: ", structureData);
 
         if (filename.endsWith(".xyz") || filename.endsWith(".extxyz")) {{
 
-            const atoms = parseXYZ(structureData);
+            const atoms = parseAll(parseXYZ);
             editor.avr.atoms = {atoms_txt};
             editor.avr.modelStyle = 1;
 
         }} else if (filename.endsWith(".cif")) {{
 
-            const atoms = parseCIF(structureData);
+            const atoms = parseAll(parseCIF);
             editor.avr.atoms = {atoms_txt};
             editor.avr.showBondedAtoms = true;
             editor.avr.colorType = "VESTA";
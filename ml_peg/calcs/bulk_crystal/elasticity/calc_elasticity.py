@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from copy import deepcopy
+import io
 from pathlib import Path
+from queue import Queue
 from typing import Any
 
 from ase.calculators.calculator import Calculator
 from ase.io import write as ase_write
 from matcalc._base import PropCalc
 from matcalc._elasticity import ElasticityCalc
+from matcalc._relaxation import RelaxCalc
+from matcalc.backend import run_pes_calc
 from matcalc.benchmark import Benchmark
 from matcalc.units import eVA3ToGPa
+from matcalc.utils import to_pmg_structure
 import numpy as np
+from pymatgen.core.elasticity import DeformedStructureSet, Strain
 from pymatgen.core.structure import Structure
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
@@ -54,6 +63,163 @@ def get_crystal_system(struct: Structure) -> str:
     return crystal_system
 
 
+class BatchedElasticityCalc(ElasticityCalc):
+    """
+    Elasticity calculator that evaluates deformed structures concurrently.
+
+    All deformed structures of a material share the same number of atoms, so once the
+    equilibrium structure has been relaxed, the (up to 24) strained structures are
+    independent. These are dispatched together to a pool of workers, each using its own
+    copy of the calculator, rather than one after another.
+
+    Parameters
+    ----------
+    calculator
+        ASE calculator used to evaluate structures.
+    max_workers
+        Maximum number of deformed structures to evaluate concurrently. Default is 1,
+        which reproduces the serial matcalc behaviour.
+    **kwargs
+        Additional keyword arguments passed to ``ElasticityCalc``.
+    """
+
+    def __init__(
+        self, calculator: Calculator, *, max_workers: int = 1, **kwargs: Any
+    ) -> None:
+        """
+        Initialise the batched elasticity calculator.
+
+        Parameters
+        ----------
+        calculator
+            ASE calculator used to evaluate structures.
+        max_workers
+            Maximum number of deformed structures to evaluate concurrently. Default is
+            1, which reproduces the serial matcalc behaviour.
+        **kwargs
+            Additional keyword arguments passed to ``ElasticityCalc``.
+        """
+        super().__init__(calculator, **kwargs)
+        self.max_workers = max_workers
+        self._worker_calcs = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get state for pickling, excluding copies of the calculator for workers.
+
+        Returns
+        -------
+        dict[str, Any]
+            State of the calculator.
+        """
+        state = self.__dict__.copy()
+        state["_worker_calcs"] = []
+        return state
+
+    def _get_stress(self, structure: Structure, calcs: Queue) -> np.ndarray:
+        """
+        Get the stress of a deformed structure, relaxing ions if requested.
+
+        Parameters
+        ----------
+        structure
+            Deformed structure to evaluate.
+        calcs
+            Queue of calculators, one of which is used exclusively by this worker until
+            the structure has been evaluated.
+
+        Returns
+        -------
+        np.ndarray
+            Stress of the (relaxed) deformed structure.
+        """
+        calc = calcs.get()
+        try:
+            if self.relax_deformed_structures:
+                relax_calc = RelaxCalc(
+                    calc, fmax=self.fmax, **(self.relax_calc_kwargs or {})
+                )
+                relax_calc.relax_cell = False
+                structure = relax_calc.calc(structure)["final_structure"]
+            return run_pes_calc(structure, calc).stress
+        finally:
+            calcs.put(calc)
+
+    def calc(self, structure: Structure | dict[str, Any]) -> dict[str, Any]:
+        """
+        Calculate the elastic tensor and moduli of a structure.
+
+        Parameters
+        ----------
+        structure
+            Structure, or dictionary containing structure, to evaluate.
+
+        Returns
+        -------
+        dict[str, Any]
+            Elastic tensor, moduli and (relaxed) structure, as for ``ElasticityCalc``.
+        """
+        if self.max_workers <= 1:
+            return super().calc(structure)
+
+        result = PropCalc.calc(self, structure)
+        structure_in = result["final_structure"]
+
+        if self.relax_structure:
+            relax_calc = RelaxCalc(
+                self.calculator, fmax=self.fmax, **(self.relax_calc_kwargs or {})
+            )
+            result |= relax_calc.calc(structure_in)
+            structure_in = result["final_structure"]
+
+        deformed_structure_set = DeformedStructureSet(
+            to_pmg_structure(structure_in),
+            self.norm_strains,
+            self.shear_strains,
+            self.symmetry,
+        )
+        # Calculators may hold state between calls, such as neighbour lists, so each
+        # worker uses its own copy, which is reused for subsequent materials
+        while len(self._worker_calcs) < self.max_workers:
+            self._worker_calcs.append(deepcopy(self.calculator))
+        calcs = Queue()
+        for calc in self._worker_calcs:
+            calcs.put(calc)
+
+        # matcalc redirects stdout during each relaxation, which is not thread-safe,
+        # so ensure the original stream is restored once all workers have finished
+        with (
+            contextlib.redirect_stdout(io.StringIO()),
+            ThreadPoolExecutor(max_workers=self.max_workers) as executor,
+        ):
+            stresses = list(
+                executor.map(
+                    lambda deformed: self._get_stress(deformed, calcs),
+                    deformed_structure_set,
+                )
+            )
+
+        strains = [
+            Strain.from_deformation(deformation)
+            for deformation in deformed_structure_set.deformations
+        ]
+        sim = run_pes_calc(structure_in, self.calculator)
+        elastic_tensor, residuals_sum = self._elastic_tensor_from_strains(
+            strains,
+            stresses,
+            eq_stress=sim.stress if self.use_equilibrium else None,
+        )
+        factor = 1 if not self.units_GPa else 1 / elastic_tensor.GPa_to_eV_A3
+        return result | {
+            "elastic_tensor": elastic_tensor * factor,
+            "shear_modulus_vrh": elastic_tensor.g_vrh * factor,
+            "bulk_modulus_vrh": elastic_tensor.k_vrh * factor,
+            "youngs_modulus": elastic_tensor.y_mod,
+            "residuals_sum": residuals_sum * factor,
+            "structure": structure_in,
+        }
+
+
 class CustomElasticityBenchmark(Benchmark):
     """
     Extend the matcalc Benchmark to output full elastic tensors.
@@ -123,7 +289,7 @@ class CustomElasticityBenchmark(Benchmark):
             Configured property calculation object.
         """
         kwargs.setdefault("fmax", 0.05)
-        return ElasticityCalc(calculator, **kwargs)
+        return BatchedElasticityCalc(calculator, **kwargs)
 
     def process_result(self, result: dict | None, model_name: str) -> dict:  # noqa: SS05
         """
@@ -175,6 +341,7 @@ def run_elasticity_benchmark(
     use_checkpoint: bool = True,
     n_materials: int | None = None,
     fmax: float = 0.05,
+    batch_size: int = 1,
 ) -> None:
     """
     Run the elasticity benchmark and write results to CSV.
@@ -188,7 +355,8 @@ def run_elasticity_benchmark(
     out_dir
         Directory to write per-model outputs.
     n_jobs
-        Number of parallel workers for the benchmark.
+        Number of parallel workers for the benchmark, each processing a different
+        material.
     norm_strains
         Normal strains to apply.
     shear_strains
@@ -203,6 +371,9 @@ def run_elasticity_benchmark(
         Number of materials to sample. None means all materials.
     fmax
         Force threshold for structural relaxations.
+    batch_size
+        Number of deformed structures of each material to evaluate concurrently.
+        Default is 1, which evaluates each deformation in turn.
     """
     benchmark = CustomElasticityBenchmark(
         n_samples=n_materials,
@@ -214,6 +385,7 @@ def run_elasticity_benchmark(
         shear_strains=shear_strains,
         benchmark_name="mp-pbe-elasticity-2025.3.json.gz",
         properties=("bulk_modulus_vrh", "shear_modulus_vrh", "elastic_tensor"),
+        max_workers=batch_size,
     )
 
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -268,7 +440,7 @@ def run_elasticity_benchmark(
 
 @pytest.mark.very_slow
 @pytest.mark.parametrize("mlip", MODELS.items())
-def test_elasticity(mlip: tuple[str, Any]) -> None:
+def test_elasticity(mlip: tuple[str, Any], n_jobs: int, batch_size: int) -> None:
     """
     Run the elasticity benchmark for a single model.
 
@@ -276,6 +448,10 @@ def test_elasticity(mlip: tuple[str, Any]) -> None:
     ----------
     mlip
         Model entry containing name and object capable of providing a calculator.
+    n_jobs
+        Number of materials to process in parallel.
+    batch_size
+        Number of deformed structures of each material to evaluate concurrently.
     """
     model_name, model = mlip
     calc = model.get_calculator(precision="low")
@@ -283,4 +459,6 @@ def test_elasticity(mlip: tuple[str, Any]) -> None:
         calc=calc,
         model_name=model_name,
         out_dir=OUT_PATH / model_name,
+        n_jobs=n_jobs,
+        batch_size=batch_size,
     )
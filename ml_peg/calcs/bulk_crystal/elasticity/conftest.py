@@ -0,0 +1,35 @@
+"""Obtain the batch_size input argument."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """
+    Add pytest option.
+
+    Parameters
+    ----------
+    parser
+        Parser to use.
+    """
+    parser.addoption("--batch-size", action="store", default=1, type=int)
+
+
+@pytest.fixture
+def batch_size(request):
+    """
+    Get batch_size argument.
+
+    Parameters
+    ----------
+    request
+        Request.
+
+    Returns
+    -------
+    option
+        Requested command line argument.
+    """
+    return request.config.getoption("--batch-size")
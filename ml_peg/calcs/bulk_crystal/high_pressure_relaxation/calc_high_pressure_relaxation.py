@@ -15,12 +15,18 @@ from ase.constraints import FixSymmetry
 from ase.io import write as ase_write
 from ase.units import GPa
 from janus_core.calculations.geom_opt import GeomOpt
+import numpy as np
 import pandas as pd
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.io.ase import AseAtomsAdaptor
 import pytest
 from tqdm import tqdm
 
+from ml_peg.calcs.utils.results_table import (
+    ID_COLUMN,
+    STRUCTURE_COLUMN,
+    write_results_table,
+)
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
 
@@ -239,6 +245,16 @@ def test_high_pressure_relaxation(mlip: tuple[str, Any], pressure_idx: int) -> N
     structures = load_structures(pressure_label)
 
     results = []
+    # Results of all structures, written as a table for analysis
+    table = {
+        ID_COLUMN: [],
+        "converged": [],
+        "ref_volume_per_atom": [],
+        "ref_energy_per_atom": [],
+        "pred_volume_per_atom": [],
+        "pred_energy_per_atom": [],
+        STRUCTURE_COLUMN: [],
+    }
     for struct_data in tqdm(
         structures, desc=f"{model_name} @ {pressure_gpa} GPa", leave=False
     ):
@@ -265,6 +281,20 @@ def test_high_pressure_relaxation(mlip: tuple[str, Any], pressure_idx: int) -> N
         else:
             pred_volume = None
 
+        table[ID_COLUMN].append(mat_id)
+        table["converged"].append(bool(converged))
+        table["ref_volume_per_atom"].append(struct_data["ref_volume_per_atom"])
+        table["ref_energy_per_atom"].append(struct_data["ref_energy_per_atom"])
+        table["pred_volume_per_atom"].append(
+            np.nan if relaxed_atoms is None else pred_volume
+        )
+        table["pred_energy_per_atom"].append(
+            np.nan if relaxed_atoms is None else enthalpy_per_atom
+        )
+        table[STRUCTURE_COLUMN].append(
+            "" if relaxed_atoms is None else f"{pressure_label}/{mat_id}.xyz"
+        )
+
         results.append(
             {
                 "mat_id": mat_id,
@@ -290,3 +320,5 @@ def test_high_pressure_relaxation(mlip: tuple[str, Any], pressure_idx: int) -> N
             frame = r["relaxed_atoms"]
             frame.calc = None
             ase_write(structs_dir / f"{r['mat_id']}.xyz", frame)
+
+    write_results_table(out_dir / f"results_{pressure_label}.npz", table)
@@ -0,0 +1,363 @@
+"""Run calculations for phonon dispersion benchmark."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import json
+from pathlib import Path
+import pickle
+from queue import Queue
+from typing import Any
+import warnings
+
+from ase import Atoms
+from ase.calculators.calculator import Calculator
+from ase.constraints import FixSymmetry
+from ase.filters import FrechetCellFilter
+from ase.optimize import FIRE
+import numpy as np
+import phonopy
+from phonopy import Phonopy
+from phonopy.structure.atoms import PhonopyAtoms
+import pytest
+from tqdm import tqdm
+
+from ml_peg.calcs.utils.utils import download_s3_data
+from ml_peg.models.get_models import load_models
+from ml_peg.models.models import current_models
+
+MODELS = load_models(current_models)
+
+OUT_PATH = Path(__file__).parent / "outputs"
+REF_PATH = OUT_PATH / "DFT"
+
+# Finite displacement settings
+DISPLACEMENT_DISTANCE = 0.01  # Å
+
+# Relaxation settings for the unit cell before displacements are generated
+FMAX = 1e-3  # eV/Å
+MAX_STEPS = 1000
+
+# Post-processing settings. Changing these only requires the cached force sets.
+BAND_NPOINTS = 101
+MESH = 100.0  # Length used by phonopy to determine the sampling mesh
+TEMPERATURES = [0, 75, 150, 300, 600]  # K
+
+# Number of displaced supercells of a material to evaluate at once
+BATCH_SIZE = 8
+
+
+def get_input_files() -> dict[str, Path]:
+    """
+    Get phonopy input files for each reference material.
+
+    Returns
+    -------
+    dict[str, Path]
+        Paths to phonopy YAML files, indexed by Materials Project ID.
+    """
+    data_path = (
+        download_s3_data(
+            filename="phonons.zip",
+            key="inputs/bulk_crystal/phonons/phonons.zip",
+        )
+        / "phonons"
+    )
+    input_files = {
+        path.name.split(".")[0]: path for path in data_path.glob("mp-*.yaml*")
+    }
+    return dict(sorted(input_files.items(), key=lambda item: int(item[0][3:])))
+
+
+def phonopy_to_ase(struct: PhonopyAtoms) -> Atoms:
+    """
+    Convert phonopy atoms to ASE atoms.
+
+    Parameters
+    ----------
+    struct
+        Phonopy structure to convert.
+
+    Returns
+    -------
+    Atoms
+        Equivalent periodic ASE structure.
+    """
+    return Atoms(
+        symbols=struct.symbols,
+        cell=struct.cell,
+        scaled_positions=struct.scaled_positions,
+        pbc=True,
+    )
+
+
+def ase_to_phonopy(atoms: Atoms) -> PhonopyAtoms:
+    """
+    Convert ASE atoms to phonopy atoms.
+
+    Parameters
+    ----------
+    atoms
+        ASE structure to convert.
+
+    Returns
+    -------
+    PhonopyAtoms
+        Equivalent phonopy structure.
+    """
+    return PhonopyAtoms(
+        symbols=atoms.get_chemical_symbols(),
+        cell=atoms.cell.array,
+        scaled_positions=atoms.get_scaled_positions(),
+    )
+
+
+def relax_unitcell(atoms: Atoms, calc: Calculator) -> Atoms:
+    """
+    Relax atomic positions and cell, preserving the crystal symmetry.
+
+    Parameters
+    ----------
+    atoms
+        Unit cell to relax.
+    calc
+        Calculator to relax structure with.
+
+    Returns
+    -------
+    Atoms
+        Relaxed unit cell.
+    """
+    atoms = atoms.copy()
+    atoms.calc = calc
+    atoms.set_constraint(FixSymmetry(atoms))
+    opt = FIRE(FrechetCellFilter(atoms), logfile=None)
+    opt.run(fmax=FMAX, steps=MAX_STEPS)
+    atoms.set_constraint()
+    atoms.calc = None
+    return atoms
+
+
+def get_forces(
+    supercells: list[Atoms],
+    calc: Calculator,
+    n_workers: int = 1,
+    batch_size: int = BATCH_SIZE,
+) -> np.ndarray:
+    """
+    Evaluate forces on displaced supercells in batches.
+
+    All displaced supercells of a material have the same number of atoms. Each batch is
+    evaluated concurrently by ``n_workers`` workers, each with its own copy of the
+    calculator, which bounds the number of structures in flight at once.
+
+    Parameters
+    ----------
+    supercells
+        Displaced supercells to evaluate.
+    calc
+        Calculator to evaluate forces with.
+    n_workers
+        Number of supercells to evaluate concurrently. Default is 1.
+    batch_size
+        Number of supercells to submit together. Default is `BATCH_SIZE`.
+
+    Returns
+    -------
+    np.ndarray
+        Forces on each supercell, with shape ``(n_supercells, n_atoms, 3)``.
+    """
+    if n_workers <= 1:
+        forces = []
+        for supercell in supercells:
+            supercell.calc = calc
+            forces.append(supercell.get_forces())
+        return np.array(forces)
+
+    calcs = Queue()
+    for _ in range(n_workers):
+        calcs.put(deepcopy(calc))
+
+    def _get_forces(supercell: Atoms) -> np.ndarray:
+        """
+        Evaluate forces on a single supercell with an unused calculator.
+
+        Parameters
+        ----------
+        supercell
+            Displaced supercell to evaluate.
+
+        Returns
+        -------
+        np.ndarray
+            Forces on the supercell.
+        """
+        worker_calc = calcs.get()
+        try:
+            supercell.calc = worker_calc
+            return supercell.get_forces()
+        finally:
+            supercell.calc = None
+            calcs.put(worker_calc)
+
+    forces = []
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for start in range(0, len(supercells), batch_size):
+            batch = supercells[start : start + batch_size]
+            forces.extend(executor.map(_get_forces, batch))
+    return np.array(forces)
+
+
+def get_model_phonons(
+    input_file: Path,
+    calc: Calculator,
+    force_sets_file: Path,
+    n_workers: int = 1,
+) -> Phonopy:
+    """
+    Calculate force constants with a model, reusing cached force sets if available.
+
+    Parameters
+    ----------
+    input_file
+        Phonopy YAML file defining the unit cell, supercell and primitive matrices.
+    calc
+        Calculator to evaluate structures with.
+    force_sets_file
+        Phonopy YAML file to cache the relaxed unit cell, displacements and forces.
+    n_workers
+        Number of displaced supercells to evaluate concurrently. Default is 1.
+
+    Returns
+    -------
+    Phonopy
+        Phonopy object with force constants produced.
+    """
+    if force_sets_file.exists():
+        return phonopy.load(force_sets_file)
+
+    ref_phonon = phonopy.load(input_file, produce_fc=False)
+    unitcell = relax_unitcell(phonopy_to_ase(ref_phonon.unitcell), calc)
+
+    phonon = Phonopy(
+        ase_to_phonopy(unitcell),
+        supercell_matrix=ref_phonon.supercell_matrix,
+        primitive_matrix=ref_phonon.primitive_matrix,
+    )
+    phonon.nac_params = ref_phonon.nac_params
+    phonon.generate_displacements(distance=DISPLACEMENT_DISTANCE)
+
+    supercells = [
+        phonopy_to_ase(supercell) for supercell in phonon.supercells_with_displacements
+    ]
+    phonon.forces = get_forces(supercells, calc, n_workers=n_workers)
+
+    force_sets_file.parent.mkdir(parents=True, exist_ok=True)
+    phonon.save(filename=force_sets_file, settings={"force_sets": True})
+    phonon.produce_force_constants()
+    return phonon
+
+
+def write_phonon_outputs(phonon: Phonopy, out_dir: Path, mp_id: str) -> None:
+    """
+    Write band structure, density of states and thermal properties.
+
+    Parameters
+    ----------
+    phonon
+        Phonopy object with force constants produced.
+    out_dir
+        Directory to write outputs to.
+    mp_id
+        Materials Project ID, used to name output files.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    phonon.auto_band_structure(npoints=BAND_NPOINTS)
+    band_structure = phonon.get_band_structure_dict()
+    with open(out_dir / f"{mp_id}_band_structure.npz", "wb") as file:
+        pickle.dump(
+            {
+                "qpoints": band_structure["qpoints"],
+                "distances": band_structure["distances"],
+                "frequencies": band_structure["frequencies"],
+            },
+            file,
+        )
+    with open(out_dir / f"{mp_id}_labels.json", "w", encoding="utf8") as file:
+        json.dump(list(phonon.band_structure.labels), file)
+    with open(out_dir / f"{mp_id}_connections.json", "w", encoding="utf8") as file:
+        json.dump([bool(conn) for conn in phonon.band_structure.path_connections], file)
+
+    phonon.run_mesh(MESH)
+    phonon.run_total_dos()
+    dos = phonon.get_total_dos_dict()
+    with open(out_dir / f"{mp_id}_dos.npz", "wb") as file:
+        pickle.dump(
+            {
+                "frequency_points": dos["frequency_points"],
+                "total_dos": dos["total_dos"],
+            },
+            file,
+        )
+
+    phonon.run_thermal_properties(temperatures=TEMPERATURES)
+    thermal_properties: dict[str, Any] = phonon.get_thermal_properties_dict()
+    with open(
+        out_dir / f"{mp_id}_thermal_properties.json", "w", encoding="utf8"
+    ) as file:
+        json.dump(
+            {key: np.asarray(val).tolist() for key, val in thermal_properties.items()},
+            file,
+        )
+
+
+@pytest.mark.slow
+def test_phonons_reference() -> None:
+    """Write reference outputs from DFT force sets in the input files."""
+    for mp_id, input_file in tqdm(get_input_files().items(), desc="DFT"):
+        if (REF_PATH / f"{mp_id}_thermal_properties.json").exists():
+            continue
+        phonon = phonopy.load(input_file, produce_fc=False)
+        if phonon.dataset is None:
+            continue
+        try:
+            phonon.produce_force_constants()
+        except RuntimeError:
+            # Displacements without reference forces
+            continue
+        write_phonon_outputs(phonon, REF_PATH, mp_id)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mlip", MODELS.items())
+def test_phonons(mlip: tuple[str, Any], n_jobs: int) -> None:
+    """
+    Run phonon calculations for a single model.
+
+    Parameters
+    ----------
+    mlip
+        Name of model use and model to get calculator.
+    n_jobs
+        Number of displaced supercells to evaluate concurrently.
+    """
+    model_name, model = mlip
+    calc = model.get_calculator(precision="high")
+
+    out_dir = OUT_PATH / model_name
+    for mp_id, input_file in tqdm(get_input_files().items(), desc=model_name):
+        try:
+            phonon = get_model_phonons(
+                input_file,
+                calc,
+                force_sets_file=out_dir / "force_sets" / f"{mp_id}.yaml",
+                n_workers=n_jobs,
+            )
+        except (RuntimeError, ValueError) as err:
+            # Raised by phonopy if symmetry cannot be found or the relaxed structure
+            # is invalid, e.g. with overlapping atoms
+            warnings.warn(f"Skipping {mp_id}: {err}", stacklevel=1)
+            continue
+        write_phonon_outputs(phonon, out_dir, mp_id)
@@ -10,9 +10,10 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any
+import warnings
 
 from ase import units
-from ase.io import write
+from ase.calculators.mixing import SumCalculator
 from ase.md.langevin import Langevin
 from ase.md.velocitydistribution import MaxwellBoltzmannDistribution
 from ase.optimize import LBFGS
@@ -20,6 +21,17 @@ import molify
 import pytest
 from tqdm import tqdm
 
+from ml_peg.calcs.molecular.utils.bmimcl_utils import BOND_CUTOFF
+from ml_peg.calcs.utils.md_monitors import (
+    MDInstabilityError,
+    MinDistanceMonitor,
+    NaNForcesMonitor,
+    TemperatureMonitor,
+    attach_monitors,
+    write_failure,
+)
+from ml_peg.calcs.utils.md_performance import PerformanceRecorder
+from ml_peg.calcs.utils.trajectory import BinaryTrajectoryWriter
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
 
@@ -35,6 +47,12 @@ TIMESTEP = 0.5  # fs
 FRICTION = 0.01
 N_ION_PAIRS = 10
 DENSITY = 1052  # kg/m³ at 353.15 K
+TRAJ_STRIDE = 1  # Steps between saved frames
+
+# Checks to stop failed runs early
+MONITOR_INTERVAL = 10  # Steps between checks
+BOND_PATIENCE = 10  # Consecutive checks a Cl-C bond must persist for
+MAX_TEMPERATURE = 2 * TEMPERATURE
 
 
 @pytest.mark.parametrize("mlip", MODELS.items())
@@ -72,11 +90,43 @@ def test_bmimcl_md(mlip: tuple[str, Any]) -> None:
 
     write_dir = OUT_PATH / model_name
     write_dir.mkdir(parents=True, exist_ok=True)
-    traj_file = write_dir / "md.xyz"
-
-    if traj_file.exists():
-        traj_file.unlink()
-
-    for _ in tqdm(range(STEPS), desc=f"{model_name} MD"):
-        dyn.run(1)
-        write(traj_file, box, append=True)
+    traj_file = write_dir / "md.btraj"
+    failure_file = write_dir / "failure.json"
+    failure_file.unlink(missing_ok=True)
+    performance_file = write_dir / "md.perf.jsonl"
+    performance_file.unlink(missing_ok=True)
+
+    monitors = [
+        NaNForcesMonitor(),
+        MinDistanceMonitor(
+            BOND_CUTOFF,
+            elements=("Cl", "C"),
+            patience=BOND_PATIENCE,
+            classification="bond_formation",
+        ),
+        TemperatureMonitor(MAX_TEMPERATURE),
+    ]
+    attach_monitors(dyn, monitors, interval=MONITOR_INTERVAL)
+
+    performance = PerformanceRecorder(len(box), TIMESTEP * units.fs)
+    with (
+        BinaryTrajectoryWriter(traj_file, box, stride=TRAJ_STRIDE) as traj,
+        tqdm(total=STEPS, desc=f"{model_name} MD") as progress,
+        performance.measure(calc, dyn) as (local_calc, dispersion_calc),
+    ):
+        box.calc = (
+            local_calc
+            if dispersion_calc is None
+            else SumCalculator([local_calc, dispersion_calc])
+        )
+        traj.attach(dyn)
+        dyn.attach(progress.update, interval=1)
+        try:
+            dyn.run(STEPS)
+        except MDInstabilityError as error:
+            write_failure(failure_file, error)
+            warnings.warn(
+                f"{model_name} MD stopped: {error} at step {error.step}", stacklevel=1
+            )
+
+    performance.write(performance_file)
@@ -0,0 +1,7 @@
+"""Shared definitions for the BMIMCl RDF benchmark calculations and analysis."""
+
+from __future__ import annotations
+
+# Any Cl-C closer than this, in Å, indicates a bond which should not be there. Used
+# both to stop simulations early and to score the RDF.
+BOND_CUTOFF = 2.5
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from copy import copy
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from ase import units
+from ase.calculators.calculator import Calculator
 from ase.io import read, write
 import numpy as np
 import pytest
 
+from ml_peg.calcs.utils.parallel import parallel_map
 from ml_peg.calcs.utils.utils import download_s3_data
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
@@ -24,8 +27,79 @@ OUT_PATH = Path(__file__).parent / "outputs"
 EV_TO_KJ_PER_MOL = units.mol / units.kJ
 
 
+def get_calculator(model: Any) -> Calculator:
+    """
+    Load a model's calculator, including D3 corrections.
+
+    Parameters
+    ----------
+    model
+        Model to get calculator for.
+
+    Returns
+    -------
+    Calculator
+        Loaded calculator with D3 corrections added.
+    """
+    calc = model.get_calculator(precision="high")
+
+    # Add D3 calculator for this test
+    return model.add_d3_calculator(calc)
+
+
+def run_system(
+    system: str, calc: Calculator, lattice_energy_dir: Path, write_dir: Path
+) -> None:
+    """
+    Calculate energies of the solid and molecule of an X23 system.
+
+    Parameters
+    ----------
+    system
+        Name of the system.
+    calc
+        Calculator to evaluate the solid and molecule.
+    lattice_energy_dir
+        Path to X23 data.
+    write_dir
+        Directory to write output structures to.
+    """
+    molecule_path = lattice_energy_dir / system / "POSCAR_molecule"
+    solid_path = lattice_energy_dir / system / "POSCAR_solid"
+    ref_path = lattice_energy_dir / system / "lattice_energy_DMC"
+    num_molecules_path = lattice_energy_dir / system / "nmol"
+
+    molecule = read(molecule_path, index=0, format="vasp")
+    molecule.calc = calc
+    # Set default charge and spin
+    molecule.info.setdefault("charge", 0)
+    molecule.info.setdefault("spin", 1)
+    molecule.get_potential_energy()
+
+    solid = read(solid_path, index=0, format="vasp")
+    solid.calc = copy(calc)
+    # Set default charge and spin
+    solid.info.setdefault("charge", 0)
+    solid.info.setdefault("spin", 1)
+    solid.get_potential_energy()
+
+    ref = np.loadtxt(ref_path)[0]
+    num_molecules = np.loadtxt(num_molecules_path)
+
+    solid.info["ref"] = ref
+    solid.info["num_molecules"] = num_molecules
+    solid.info["system"] = system
+    molecule.info["ref"] = ref
+    molecule.info["num_molecules"] = num_molecules
+    molecule.info["system"] = system
+
+    # Write output structures
+    write_dir.mkdir(parents=True, exist_ok=True)
+    write(write_dir / f"{system}.xyz", [solid, molecule])
+
+
 @pytest.mark.parametrize("mlip", MODELS.items())
-def test_lattice_energy(mlip: tuple[str, Any]) -> None:
+def test_lattice_energy(mlip: tuple[str, Any], n_jobs: int) -> None:
     """
     Run X23 lattice energy test.
 
@@ -33,12 +107,10 @@ def test_lattice_energy(mlip: tuple[str, Any]) -> None:
     ----------
     mlip
         Name of model use and model to get calculator.
+    n_jobs
+        Number of systems to evaluate in parallel.
     """
     model_name, model = mlip
-    calc = model.get_calculator(precision="high")
-
-    # Add D3 calculator for this test
-    calc = model.add_d3_calculator(calc)
 
     # download X23 dataset
     lattice_energy_dir = (
@@ -52,37 +124,15 @@ def test_lattice_energy(mlip: tuple[str, Any]) -> None:
     with open(lattice_energy_dir / "list") as f:
         systems = f.read().splitlines()
 
-    for system in systems:
-        molecule_path = lattice_energy_dir / system / "POSCAR_molecule"
-        solid_path = lattice_energy_dir / system / "POSCAR_solid"
-        ref_path = lattice_energy_dir / system / "lattice_energy_DMC"
-        num_molecules_path = lattice_energy_dir / system / "nmol"
-
-        molecule = read(molecule_path, index=0, format="vasp")
-        molecule.calc = calc
-        # Set default charge and spin
-        molecule.info.setdefault("charge", 0)
-        molecule.info.setdefault("spin", 1)
-        molecule.get_potential_energy()
-
-        solid = read(solid_path, index=0, format="vasp")
-        solid.calc = copy(calc)
-        # Set default charge and spin
-        solid.info.setdefault("charge", 0)
-        solid.info.setdefault("spin", 1)
-        solid.get_potential_energy()
-
-        ref = np.loadtxt(ref_path)[0]
-        num_molecules = np.loadtxt(num_molecules_path)
-
-        solid.info["ref"] = ref
-        solid.info["num_molecules"] = num_molecules
-        solid.info["system"] = system
-        molecule.info["ref"] = ref
-        molecule.info["num_molecules"] = num_molecules
-        molecule.info["system"] = system
-
-        # Write output structures
-        write_dir = OUT_PATH / model_name
-        write_dir.mkdir(parents=True, exist_ok=True)
-        write(write_dir / f"{system}.xyz", [solid, molecule])
+    parallel_map(
+        partial(
+            run_system,
+            lattice_energy_dir=lattice_energy_dir,
+            write_dir=OUT_PATH / model_name,
+        ),
+        systems,
+        init_worker=get_calculator,
+        init_args=(model,),
+        n_jobs=n_jobs,
+        desc=model_name,
+    )
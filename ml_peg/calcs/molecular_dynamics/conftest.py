@@ -0,0 +1,67 @@
+"""Obtain the density_tolerance and respa_interval input arguments."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """
+    Add pytest options.
+
+    Parameters
+    ----------
+    parser
+        Parser to use.
+    """
+    parser.addoption(
+        "--density-tolerance",
+        action="store",
+        default=None,
+        type=float,
+        help="Stop NPT runs once the standard error of the density (g/cm^3) is below "
+        "this value.",
+    )
+    parser.addoption(
+        "--respa-interval",
+        action="store",
+        default=1,
+        type=int,
+        help="Number of MD steps between evaluations of dispersion corrections.",
+    )
+
+
+@pytest.fixture
+def density_tolerance(request):
+    """
+    Get density_tolerance argument.
+
+    Parameters
+    ----------
+    request
+        Request.
+
+    Returns
+    -------
+    option
+        Requested command line argument.
+    """
+    return request.config.getoption("--density-tolerance")
+
+
+@pytest.fixture
+def respa_interval(request):
+    """
+    Get respa_interval argument.
+
+    Parameters
+    ----------
+    request
+        Request.
+
+    Returns
+    -------
+    option
+        Requested command line argument.
+    """
+    return request.config.getoption("--respa-interval")
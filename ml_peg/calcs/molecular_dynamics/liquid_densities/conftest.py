@@ -1,9 +1,11 @@
-"""Obtain the system_id input argument."""
+"""Obtain the system indices input argument."""
 
 from __future__ import annotations
 
 import pytest
 
+from ml_peg.calcs.molecular_dynamics.utils.npt_utils import parse_ids
+
 
 def pytest_addoption(parser):
     """
@@ -14,13 +16,18 @@ def pytest_addoption(parser):
     parser
         Parser to use.
     """
-    parser.addoption("--system-id", action="store", default=0, type=int)
+    parser.addoption(
+        "--system-id",
+        action="store",
+        default="0",
+        help="System indices to run together, e.g. 0,2-4.",
+    )
 
 
 @pytest.fixture
-def system_id(request):
+def system_ids(request) -> list[int]:
     """
-    Get system_id argument.
+    Get system indices argument.
 
     Parameters
     ----------
@@ -29,7 +36,7 @@ def system_id(request):
 
     Returns
     -------
-    option
-        Requested command line argument.
+    list[int]
+        Requested system indices.
     """
-    return request.config.getoption("--system-id")
+    return parse_ids(request.config.getoption("--system-id"))
@@ -0,0 +1,730 @@
+"""Shared utilities for NPT density benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import logging
+from pathlib import Path
+from queue import Queue
+import time
+
+from ase import Atoms, units
+from ase.calculators.calculator import Calculator, PropertyNotImplementedError
+from ase.calculators.mixing import SumCalculator
+from ase.io import Trajectory
+import numpy as np
+
+from ml_peg.calcs.molecular_dynamics.utils.respa import (
+    RESPACalculator,
+    RESPAIsotropicMTKNPT,
+)
+from ml_peg.calcs.utils.md_checkpoint import load_checkpoint, save_checkpoint
+from ml_peg.calcs.utils.md_monitors import (
+    DensityMonitor,
+    EnergyDriftMonitor,
+    MDInstabilityError,
+    MDMonitor,
+    MinDistanceMonitor,
+    NaNForcesMonitor,
+    TemperatureMonitor,
+    attach_monitors,
+    read_failure,
+    write_failure,
+)
+from ml_peg.calcs.utils.md_performance import PerformanceRecorder
+
+AU_TO_G_CM3 = 1e24 / units.mol
+NUM_MD_STEPS = 1000_000
+TIMESTEP = 1 * units.fs
+LOG_INTERVAL = 100
+ATM = 1.01325 * units.bar
+
+# Time between density samples used to check convergence
+SAMPLE_INTERVAL_PS = LOG_INTERVAL * TIMESTEP / (1000 * units.fs)
+MIN_PRODUCTION_PS = 100
+CHECK_INTERVAL_PS = 10
+
+# Limits beyond which a simulation is considered to have failed
+MIN_DISTANCE = 0.5  # Å
+MAX_TEMPERATURE_FACTOR = 2.0
+MAX_ENERGY_DRIFT = 0.1  # eV/atom
+
+
+def parse_ids(ids: str | int) -> list[int]:
+    """
+    Parse system indices from a command line argument.
+
+    Parameters
+    ----------
+    ids
+        Comma-separated indices or inclusive ranges, e.g. "0,3,5-8".
+
+    Returns
+    -------
+    list[int]
+        Parsed indices.
+    """
+    parsed = []
+    for item in str(ids).split(","):
+        start, _, end = item.strip().partition("-")
+        parsed.extend(range(int(start), int(end or start) + 1))
+    return parsed
+
+
+def get_density_g_cm3(atoms: Atoms):
+    """
+    Get the density of the system in g/cm^3.
+
+    Parameters
+    ----------
+    atoms
+        ASE.Atoms object of the periodic system.
+
+    Returns
+    -------
+    float
+        Density in g/cm^3.
+    """
+    mass = atoms.get_masses().sum()
+    volume = atoms.get_volume()
+    return AU_TO_G_CM3 * mass / volume
+
+
+def get_md_logger(log_file: Path) -> logging.Logger:
+    """
+    Get logger writing MD progress to a file.
+
+    Parameters
+    ----------
+    log_file
+        File to append log messages to.
+
+    Returns
+    -------
+    logging.Logger
+        Logger for the simulation.
+    """
+    logger = logging.getLogger(f"ml_peg.md.{Path(log_file).resolve()}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+    handler = logging.FileHandler(log_file, mode="a")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def log_md(dyn, start_time, logger: logging.Logger | None = None):
+    """
+    Log molecular dynamics simulation.
+
+    Parameters
+    ----------
+    dyn
+        ASE molecular dynamics object.
+    start_time
+        Real time of the simulation start, in seconds.
+    logger
+        Logger to write to. Default is the root logger.
+    """
+    logger = logging.getLogger() if logger is None else logger
+    current_time = time.time() - start_time
+    energy = dyn.atoms.get_potential_energy()
+    density = get_density_g_cm3(dyn.atoms)
+    temperature = dyn.atoms.get_temperature()
+    t = dyn.get_time() / (1000 * units.fs)
+    logger.info(
+        f"""t: {t:>8.3f} ps\
+            Walltime: {current_time:>10.3f} s\
+            T: {temperature:.1f} K\
+            Epot: {energy:.2f} eV\
+            density: {density:.3f} g/cm^3\
+        """
+    )
+
+
+def get_default_monitors(temperature: float) -> list[MDMonitor]:
+    """
+    Get checks used to stop failed NPT simulations.
+
+    Parameters
+    ----------
+    temperature
+        Target temperature of the simulation, in K.
+
+    Returns
+    -------
+    list[MDMonitor]
+        Checks for non-finite forces, overlapping atoms, temperature excursions,
+        density collapse and drift in the conserved energy.
+    """
+    return [
+        NaNForcesMonitor(),
+        MinDistanceMonitor(MIN_DISTANCE),
+        TemperatureMonitor(MAX_TEMPERATURE_FACTOR * temperature),
+        DensityMonitor(),
+        EnergyDriftMonitor(MAX_ENERGY_DRIFT),
+    ]
+
+
+def read_log_densities(log_file: Path) -> list[float]:
+    """
+    Read densities logged by `log_md`.
+
+    Parameters
+    ----------
+    log_file
+        Path to the log file.
+
+    Returns
+    -------
+    list[float]
+        Densities in g/cm^3, in the order logged.
+    """
+    densities = []
+    if not Path(log_file).exists():
+        return densities
+    with open(log_file) as lines:
+        for line in lines:
+            items = line.strip().split()
+            if len(items) == 15 and items[0] == "t:":
+                densities.append(float(items[13]))
+    return densities
+
+
+def statistical_inefficiency(series: np.ndarray) -> float:
+    """
+    Estimate the statistical inefficiency of a time series.
+
+    The integrated autocorrelation is summed until the normalised autocorrelation
+    function first drops to zero.
+
+    Parameters
+    ----------
+    series
+        Correlated time series.
+
+    Returns
+    -------
+    float
+        Statistical inefficiency, the number of samples per independent sample.
+    """
+    series = np.asarray(series, dtype=float)
+    n_samples = len(series)
+    fluctuations = series - series.mean()
+    variance = fluctuations.dot(fluctuations) / n_samples
+    if n_samples < 3 or variance <= 0:
+        return 1.0
+
+    spectrum = np.fft.rfft(fluctuations, 2 * n_samples)
+    autocorr = np.fft.irfft(spectrum * np.conj(spectrum))[:n_samples]
+    autocorr /= variance * np.arange(n_samples, 0, -1)
+
+    lags = np.arange(1, n_samples)
+    non_positive = np.flatnonzero(autocorr[1:] <= 0)
+    cutoff = non_positive[0] if non_positive.size else n_samples - 1
+    weights = 1 - lags[:cutoff] / n_samples
+    return max(1.0, 1.0 + 2.0 * float(np.sum(autocorr[1 : cutoff + 1] * weights)))
+
+
+def detect_equilibration(
+    series: np.ndarray, n_candidates: int = 50
+) -> tuple[int, float, float]:
+    """
+    Detect the end of equilibration by maximising the number of independent samples.
+
+    Parameters
+    ----------
+    series
+        Correlated time series.
+    n_candidates
+        Number of candidate equilibration times, spaced over the first half of the
+        series. Default is 50.
+
+    Returns
+    -------
+    tuple[int, float, float]
+        Index of the first production sample, statistical inefficiency of the
+        production samples, and effective number of independent production samples.
+    """
+    series = np.asarray(series, dtype=float)
+    n_samples = len(series)
+    candidates = np.unique(
+        np.linspace(0, n_samples // 2, n_candidates, dtype=int, endpoint=False)
+    )
+    best = (0, 1.0, 0.0)
+    for start in candidates:
+        inefficiency = statistical_inefficiency(series[start:])
+        n_effective = (n_samples - start) / inefficiency
+        if n_effective > best[2]:
+            best = (int(start), inefficiency, n_effective)
+    return best
+
+
+class DensityConvergenceMonitor:
+    """
+    Monitor the density of an NPT simulation to stop once it has converged.
+
+    Densities are sampled every `LOG_INTERVAL` steps. Periodically, the end of
+    equilibration is detected, and the standard error of the mean production density is
+    estimated accounting for correlation between samples. The simulation is converged
+    once this is below `tolerance`, with at least `min_production_ps` of production.
+
+    Parameters
+    ----------
+    tolerance
+        Maximum standard error of the mean production density, in g/cm^3.
+    min_production_ps
+        Minimum duration of production after equilibration, in ps. Default is
+        `MIN_PRODUCTION_PS`.
+    check_interval_ps
+        Time between convergence checks, in ps. Default is `CHECK_INTERVAL_PS`.
+    """
+
+    def __init__(
+        self,
+        tolerance: float,
+        min_production_ps: float = MIN_PRODUCTION_PS,
+        check_interval_ps: float = CHECK_INTERVAL_PS,
+    ) -> None:
+        """
+        Initialise monitor.
+
+        Parameters
+        ----------
+        tolerance
+            Maximum standard error of the mean production density, in g/cm^3.
+        min_production_ps
+            Minimum duration of production after equilibration, in ps. Default is
+            `MIN_PRODUCTION_PS`.
+        check_interval_ps
+            Time between convergence checks, in ps. Default is `CHECK_INTERVAL_PS`.
+        """
+        self.tolerance = tolerance
+        self.min_production_ps = min_production_ps
+        self.check_interval = max(1, round(check_interval_ps / SAMPLE_INTERVAL_PS))
+        self.densities: list[float] = []
+        self.diagnostics: dict[str, float | bool] = {}
+
+    def check(self) -> bool:
+        """
+        Check whether the sampled density has converged.
+
+        Returns
+        -------
+        bool
+            Whether the density has converged.
+        """
+        densities = np.array(self.densities)
+        start, inefficiency, n_effective = detect_equilibration(densities)
+        production = densities[start:]
+        sem = float(production.std() / np.sqrt(n_effective)) if n_effective else np.inf
+        production_ps = (len(production) - 1) * SAMPLE_INTERVAL_PS
+
+        converged = bool(
+            production_ps >= self.min_production_ps and sem < self.tolerance
+        )
+        self.diagnostics = {
+            "converged": converged,
+            "time_ps": (len(densities) - 1) * SAMPLE_INTERVAL_PS,
+            "equilibration_ps": start * SAMPLE_INTERVAL_PS,
+            "production_ps": production_ps,
+            "density": float(production.mean()),
+            "sem": sem,
+            "statistical_inefficiency": inefficiency,
+            "tolerance": self.tolerance,
+        }
+        return converged
+
+    def __call__(self, atoms: Atoms) -> bool:
+        """
+        Sample the density, checking convergence periodically.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+
+        Returns
+        -------
+        bool
+            Whether the density has converged.
+        """
+        self.densities.append(get_density_g_cm3(atoms))
+        if len(self.densities) % self.check_interval:
+            return False
+        return self.check()
+
+
+class NPTSimulation:
+    """
+    NPT simulation using the isotropic MTK barostat, which can be run in chunks.
+
+    The full state of the simulation, including thermostat and barostat variables, is
+    checkpointed with every frame, so an interrupted simulation resumes exactly where it
+    stopped. Trajectories without a checkpoint resume from their last frame.
+    Simulations that fail a check are stopped, and the failure is recorded in a JSON
+    file alongside the trajectory, so they are not resumed. The throughput of each
+    session is appended to a JSON Lines file alongside the trajectory when closed.
+
+    Parameters
+    ----------
+    atoms
+        ASE Atoms of the system.
+    output_fname
+        File name to save the trajectory to.
+    temperature
+        Temperature to perform MD at.
+    log_file
+        File to log progress to. Default is `output_fname` with a ".log" suffix.
+    num_steps
+        Total number of MD steps. Default is `NUM_MD_STEPS`.
+    convergence
+        Monitor to stop the simulation once the density has converged. Default is
+        `None`, which always runs `num_steps` steps.
+    monitors
+        Checks run every `LOG_INTERVAL` steps to stop failed simulations. Default is
+        `None`, which uses `get_default_monitors`.
+    respa_interval
+        Number of steps between evaluations of dispersion corrections, which are
+        applied as impulses using `RESPAIsotropicMTKNPT`. The conserved energy is also
+        logged if greater than 1. Default is 1.
+    """
+
+    def __init__(
+        self,
+        atoms: Atoms,
+        output_fname: Path,
+        temperature: float,
+        log_file: Path | None = None,
+        num_steps: int = NUM_MD_STEPS,
+        convergence: DensityConvergenceMonitor | None = None,
+        monitors: Sequence[MDMonitor] | None = None,
+        respa_interval: int = 1,
+    ) -> None:
+        """
+        Initialise simulation.
+
+        Parameters
+        ----------
+        atoms
+            ASE Atoms of the system.
+        output_fname
+            File name to save the trajectory to.
+        temperature
+            Temperature to perform MD at.
+        log_file
+            File to log progress to. Default is `output_fname` with a ".log" suffix.
+        num_steps
+            Total number of MD steps. Default is `NUM_MD_STEPS`.
+        convergence
+            Monitor to stop the simulation once the density has converged. Default is
+            `None`, which always runs `num_steps` steps.
+        monitors
+            Checks run every `LOG_INTERVAL` steps to stop failed simulations. Default
+            is `None`, which uses `get_default_monitors`.
+        respa_interval
+            Number of steps between evaluations of dispersion corrections, which are
+            applied as impulses using `RESPAIsotropicMTKNPT`. The conserved energy is
+            also logged if greater than 1. Default is 1.
+        """
+        self.output_fname = Path(output_fname)
+        self.temperature = temperature
+        self.num_steps = num_steps
+        self.convergence = convergence
+        self.respa_interval = respa_interval
+        # Conserved energy per atom at the start of the simulation
+        self.energy_reference = None
+        self.failure_fname = self.output_fname.with_suffix(".failure.json")
+        self.checkpoint_fname = self.output_fname.with_suffix(".ckpt.npz")
+        self.performance_fname = self.output_fname.with_suffix(".perf.jsonl")
+        self.failure = read_failure(self.failure_fname)
+        self.stopped = self.failure is not None
+        log_file = (
+            self.output_fname.with_suffix(".log") if log_file is None else log_file
+        )
+        self.logger = get_md_logger(log_file)
+
+        self.n_frames = 0
+        has_checkpoint = self.checkpoint_fname.exists()
+        if not has_checkpoint and self.output_fname.exists():
+            try:
+                traj = Trajectory(self.output_fname)
+                atoms = traj[-1]
+                self.n_frames = len(traj)
+            except Exception as e:
+                print(e)
+
+        # Set default charge and spin
+        atoms.info.setdefault("charge", 0)
+        atoms.info.setdefault("spin", 1)
+        self.atoms = atoms
+
+        self.dyn = RESPAIsotropicMTKNPT(
+            atoms=atoms,
+            timestep=TIMESTEP,
+            temperature_K=temperature,
+            pressure_au=ATM,
+            tdamp=50 * units.fs,
+            pdamp=500 * units.fs,
+            interval=respa_interval,
+        )
+        self.performance = PerformanceRecorder(
+            len(atoms), TIMESTEP, respa_interval=respa_interval, n_workers=1
+        )
+        self._timed_calcs = None
+        self.monitors = (
+            get_default_monitors(temperature) if monitors is None else monitors
+        )
+
+        # Frames written after the checkpoint, which are not written again
+        self._n_skip = 0
+        if has_checkpoint:
+            metadata, arrays = load_checkpoint(self.checkpoint_fname, self.dyn)
+            self.n_frames = metadata["n_frames"]
+            atoms.info.update(metadata["info"])
+            self.energy_reference = metadata.get("energy_reference")
+            if len(metadata["monitors"]) == len(self.monitors):
+                for monitor, state in zip(
+                    self.monitors, metadata["monitors"], strict=True
+                ):
+                    vars(monitor).update(state)
+            if self.output_fname.exists():
+                with Trajectory(self.output_fname) as traj:
+                    self._n_skip = max(0, len(traj) - self.n_frames)
+        else:
+            self.dyn.nsteps = max(0, self.n_frames - 1) * LOG_INTERVAL
+
+        # Check for failures first, so failed frames are not written
+        if self.monitors:
+            attach_monitors(self.dyn, self.monitors, interval=LOG_INTERVAL)
+
+        if convergence is not None:
+            if has_checkpoint and "densities" in arrays:
+                convergence.densities = arrays["densities"].tolist()
+            elif self.n_frames:
+                # Densities sampled before the restart, as logged
+                convergence.densities = read_log_densities(log_file)[: self.n_frames]
+                self.stopped |= atoms.info.get("density_convergence", {}).get(
+                    "converged", False
+                )
+            # Check convergence before writing, so the final frame includes diagnostics
+            self.dyn.attach(self._check_convergence, interval=LOG_INTERVAL)
+
+        self.trajectory = Trajectory(self.output_fname, "a", atoms)
+        self.start_time = time.time()
+        self.dyn.attach(self._write_frame, interval=LOG_INTERVAL)
+
+    @property
+    def done(self) -> bool:
+        """
+        Check whether the simulation has finished.
+
+        Returns
+        -------
+        bool
+            Whether all steps have been run.
+        """
+        return self.stopped or self.dyn.nsteps >= self.num_steps
+
+    def _check_convergence(self) -> None:
+        """Sample the density, and stop the simulation if it has converged."""
+        if self.convergence(self.atoms):
+            self.stopped = True
+            diagnostics = self.convergence.diagnostics
+            self.logger.info(
+                f"Stopping: density converged to {diagnostics['density']:.4f} "
+                f"+/- {diagnostics['sem']:.4f} g/cm^3 after "
+                f"{diagnostics['time_ps']:.1f} ps"
+            )
+        if self.convergence.diagnostics:
+            self.atoms.info["density_convergence"] = self.convergence.diagnostics
+
+    def _log_conserved_energy(self) -> None:
+        """Log the conserved energy and its drift, to check the integration."""
+        try:
+            energy = self.dyn.get_conserved_energy() / len(self.atoms)
+        except PropertyNotImplementedError:
+            return
+        if self.energy_reference is None:
+            self.energy_reference = energy
+        t = self.dyn.get_time() / (1000 * units.fs)
+        drift = 1000 * (energy - self.energy_reference)
+        self.logger.info(
+            f"Conserved energy: t: {t:.3f} ps Econs: {energy:.6f} eV/atom "
+            f"drift: {drift:.3f} meV/atom"
+        )
+
+    def _write_frame(self) -> None:
+        """Write the current frame and log, then checkpoint the simulation."""
+        if self._n_skip:
+            self._n_skip -= 1
+        else:
+            self.trajectory.write()
+            log_md(self.dyn, self.start_time, logger=self.logger)
+            if self.respa_interval > 1:
+                self._log_conserved_energy()
+        self.n_frames += 1
+
+        info = {}
+        if "density_convergence" in self.atoms.info:
+            info["density_convergence"] = self.atoms.info["density_convergence"]
+        save_checkpoint(
+            self.checkpoint_fname,
+            self.dyn,
+            metadata={
+                "n_frames": self.n_frames,
+                "info": info,
+                "monitors": [vars(monitor) for monitor in self.monitors],
+                "energy_reference": self.energy_reference,
+            },
+            arrays=(
+                {"densities": self.convergence.densities}
+                if self.convergence is not None
+                else None
+            ),
+        )
+
+    def run(self, calc: Calculator, steps: int | None = None) -> None:
+        """
+        Advance the simulation.
+
+        Parameters
+        ----------
+        calc
+            ASE Calculator.
+        steps
+            Maximum number of steps to run. Default is all remaining steps.
+        """
+        remaining = self.num_steps - self.dyn.nsteps
+        steps = remaining if steps is None else min(steps, remaining)
+        if steps <= 0 or self.stopped:
+            return
+        with self.performance.measure(calc, self.dyn) as timed_calcs:
+            # The same timed calculators are used by each call, so the calculator is
+            # only built once, and results of the last step are not recalculated
+            if timed_calcs != self._timed_calcs:
+                self._timed_calcs = timed_calcs
+                local_calc, dispersion_calc = timed_calcs
+                if dispersion_calc is None:
+                    self.atoms.calc = local_calc
+                elif self.respa_interval > 1:
+                    # Dispersion corrections are applied separately on the outer step
+                    self.atoms.calc = RESPACalculator(local_calc, dispersion_calc)
+                else:
+                    self.atoms.calc = SumCalculator([local_calc, dispersion_calc])
+            try:
+                for _ in self.dyn.irun(steps=steps):
+                    if self.stopped:
+                        break
+            except MDInstabilityError as error:
+                self.stopped = True
+                self.failure = error.to_dict()
+                write_failure(self.failure_fname, error)
+                self.logger.info(f"Stopping: {error} at step {error.step}")
+
+    def close(self) -> None:
+        """Close trajectory and log files, and record the throughput."""
+        self.performance.write(self.performance_fname)
+        self.trajectory.close()
+        for handler in self.logger.handlers:
+            handler.close()
+        self.logger.handlers.clear()
+
+
+def run_npt_simulations(
+    simulations: list[NPTSimulation],
+    calc: Calculator,
+    n_workers: int = 1,
+    chunk_steps: int = LOG_INTERVAL,
+) -> None:
+    """
+    Run independent NPT simulations concurrently, in chunks, until all have finished.
+
+    Each round advances every unfinished simulation by `chunk_steps`, with up to
+    `n_workers` simulations run on separate threads, each using its own copy of the
+    calculator. Steps are not synchronised or batched across simulations, so every
+    step of each simulation is a separate evaluation of the model. Each simulation
+    keeps its own thermostat and barostat state and writes its own trajectory and log,
+    so outputs match those of running it alone.
+
+    Parameters
+    ----------
+    simulations
+        Simulations to run.
+    calc
+        ASE Calculator.
+    n_workers
+        Number of simulations to advance concurrently. Default is 1.
+    chunk_steps
+        Number of steps to advance each simulation by per round. Default is
+        `LOG_INTERVAL`.
+    """
+    n_workers = max(1, min(n_workers, len(simulations)))
+    for simulation in simulations:
+        simulation.performance.metadata["n_workers"] = n_workers
+    calcs = Queue()
+    calcs.put(calc)
+    for _ in range(n_workers - 1):
+        calcs.put(deepcopy(calc))
+
+    def _advance(simulation: NPTSimulation) -> None:
+        """
+        Advance a single simulation with an unused calculator.
+
+        Parameters
+        ----------
+        simulation
+            Simulation to advance.
+        """
+        worker_calc = calcs.get()
+        try:
+            simulation.run(worker_calc, steps=chunk_steps)
+        finally:
+            calcs.put(worker_calc)
+
+    try:
+        if len(simulations) == 1:
+            simulations[0].run(calc)
+            return
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            while active := [sim for sim in simulations if not sim.done]:
+                # Raise any errors from this round
+                list(executor.map(_advance, active))
+    finally:
+        for simulation in simulations:
+            simulation.close()
+
+
+def run_npt(atoms, calc, output_fname, temperature, density_tolerance=None):
+    """
+    Run NPT molecular dynamics using the isotropic MTK barostat.
+
+    Parameters
+    ----------
+    atoms
+        ASE Atoms of the system.
+    calc
+        ASE Calculator.
+    output_fname
+        File name to save the trajectory to.
+    temperature
+        Temperature to perform MD at.
+    density_tolerance
+        If set, stop once the standard error of the mean density, in g/cm^3, is below
+        this value. Default is `None`.
+    """
+    convergence = (
+        DensityConvergenceMonitor(density_tolerance)
+        if density_tolerance is not None
+        else None
+    )
+    run_npt_simulations(
+        [NPTSimulation(atoms, output_fname, temperature, convergence=convergence)],
+        calc,
+    )
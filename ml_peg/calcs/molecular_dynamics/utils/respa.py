@@ -0,0 +1,178 @@
+"""Multiple-time-step (RESPA) integration with dispersion on the outer time step."""
+
+from __future__ import annotations
+
+from ase import Atoms
+from ase.calculators.calculator import Calculator, all_changes
+from ase.md.nose_hoover_chain import IsotropicMTKNPT
+import numpy as np
+
+
+class RESPACalculator(Calculator):
+    """
+    Calculator separating fast (short-range) and slow (long-range) contributions.
+
+    The energy is the sum of both contributions, but forces and stress include only
+    the fast contribution. The slow forces and stress are applied separately by
+    `RESPAIsotropicMTKNPT`.
+
+    Parameters
+    ----------
+    fast_calc
+        Calculator for the short-range contribution, e.g. an MLIP.
+    slow_calc
+        Calculator for the long-range contribution, e.g. a D3 correction.
+    """
+
+    implemented_properties = ["energy", "free_energy", "forces", "stress"]
+
+    def __init__(self, fast_calc: Calculator, slow_calc: Calculator) -> None:
+        """
+        Initialise calculator.
+
+        Parameters
+        ----------
+        fast_calc
+            Calculator for the short-range contribution, e.g. an MLIP.
+        slow_calc
+            Calculator for the long-range contribution, e.g. a D3 correction.
+        """
+        super().__init__()
+        self.fast_calc = fast_calc
+        self.slow_calc = slow_calc
+
+    def calculate(
+        self,
+        atoms: Atoms | None = None,
+        properties: list[str] | None = None,
+        system_changes: list[str] = all_changes,
+    ) -> None:
+        """
+        Calculate the requested properties.
+
+        Parameters
+        ----------
+        atoms
+            Structure to calculate properties of.
+        properties
+            Properties to calculate. Default is `None`, which calculates the energy.
+        system_changes
+            Changes since the last calculation. Default is all changes.
+        """
+        properties = ["energy"] if properties is None else properties
+        super().calculate(atoms, properties, system_changes)
+
+        if "energy" in properties or "free_energy" in properties:
+            energy = self.fast_calc.get_potential_energy(
+                atoms
+            ) + self.slow_calc.get_potential_energy(atoms)
+            self.results["energy"] = energy
+            self.results["free_energy"] = energy
+        if "forces" in properties:
+            self.results["forces"] = self.fast_calc.get_forces(atoms)
+        if "stress" in properties:
+            self.results["stress"] = self.fast_calc.get_stress(atoms)
+
+
+class RESPAIsotropicMTKNPT(IsotropicMTKNPT):
+    """
+    Isotropic MTK NPT dynamics with slow forces applied on an outer time step.
+
+    If the atoms' calculator is a `RESPACalculator`, its fast contribution is
+    evaluated every step, and its slow contribution only every `interval` steps. The
+    slow forces and pressure are applied as impulses scaled by `interval` (the
+    Verlet-I/r-RESPA scheme), which is equivalent to a reversible outer time step of
+    ``interval * timestep``. For other calculators, this is identical to
+    `IsotropicMTKNPT`.
+
+    Parameters
+    ----------
+    *args
+        Arguments passed to `IsotropicMTKNPT`.
+    interval
+        Number of inner time steps per outer time step. Default is 1.
+    **kwargs
+        Keyword arguments passed to `IsotropicMTKNPT`.
+    """
+
+    def __init__(self, *args, interval: int = 1, **kwargs) -> None:
+        """
+        Initialise dynamics.
+
+        Parameters
+        ----------
+        *args
+            Arguments passed to `IsotropicMTKNPT`.
+        interval
+            Number of inner time steps per outer time step. Default is 1.
+        **kwargs
+            Keyword arguments passed to `IsotropicMTKNPT`.
+        """
+        super().__init__(*args, **kwargs)
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.interval = interval
+        # Step index of the current positions, which is updated mid-step
+        self._position_step = self.nsteps
+
+    def step(self) -> None:
+        """Advance the dynamics by a single inner time step."""
+        self._position_step = self.nsteps
+        super().step()
+
+    def _integrate_q(self, delta: float) -> None:
+        """
+        Update positions, tracking the step index of the new positions.
+
+        Parameters
+        ----------
+        delta
+            Time to integrate over.
+        """
+        super()._integrate_q(delta)
+        self._position_step += 1
+
+    def _get_slow_calc(self) -> Calculator | None:
+        """
+        Get the calculator for slow contributions, if evaluated at this step.
+
+        Returns
+        -------
+        Calculator | None
+            Calculator for slow contributions, or `None` if these are not applied at
+            the current positions.
+        """
+        if self._position_step % self.interval:
+            return None
+        return getattr(self.atoms.calc, "slow_calc", None)
+
+    def _get_forces(self) -> np.ndarray:
+        """
+        Get forces, including slow impulses on outer steps.
+
+        Returns
+        -------
+        np.ndarray
+            Forces on each atom.
+        """
+        forces = super()._get_forces()
+        slow_calc = self._get_slow_calc()
+        if slow_calc is not None:
+            forces = forces + self.interval * slow_calc.get_forces(self.atoms)
+        return forces
+
+    def _get_pressure(self) -> float:
+        """
+        Get pressure, including slow impulses on outer steps.
+
+        Returns
+        -------
+        float
+            Instantaneous pressure.
+        """
+        pressure = super()._get_pressure()
+        slow_calc = self._get_slow_calc()
+        if slow_calc is not None:
+            stress = slow_calc.get_stress(self.atoms)
+            pressure = pressure - self.interval * np.sum(stress[:3]) / 3
+        return pressure
@@ -1,9 +1,11 @@
-"""Obtain the system_id input argument."""
+"""Obtain the temperature indices input argument."""
 
 from __future__ import annotations
 
 import pytest
 
+from ml_peg.calcs.molecular_dynamics.utils.npt_utils import parse_ids
+
 
 def pytest_addoption(parser):
     """
@@ -14,13 +16,18 @@ def pytest_addoption(parser):
     parser
         Parser to use.
     """
-    parser.addoption("--temperature-idx", action="store", default=0, type=int)
+    parser.addoption(
+        "--temperature-idx",
+        action="store",
+        default="0",
+        help="Temperature indices to run together, e.g. 0,2-3.",
+    )
 
 
 @pytest.fixture
-def temperature_idx(request):
+def temperature_ids(request) -> list[int]:
     """
-    Get temperature index argument.
+    Get temperature indices argument.
 
     Parameters
     ----------
@@ -29,7 +36,7 @@ def temperature_idx(request):
 
     Returns
     -------
-    option
-        Requested command line argument.
+    list[int]
+        Requested temperature indices.
     """
-    return request.config.getoption("--temperature-idx")
+    return parse_ids(request.config.getoption("--temperature-idx"))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import cache
 from pathlib import Path
 
 from ase import Atoms
+from ase.calculators.calculator import Calculator
 from ase.io import read
 from janus_core.calculations.geom_opt import GeomOpt
 from janus_core.calculations.neb import NEB
@@ -19,60 +22,88 @@ DATA_PATH = Path(__file__).parent / "data"
 OUT_PATH = Path(__file__).parent / "outputs"
 
 
-@pytest.fixture(scope="module")
-def relaxed_structs() -> dict[str, Atoms]:
+@cache
+def get_calculator(model_name: str) -> Calculator:
     """
-    Run geometry optimisation on all structures.
+    Load the calculator for a model, reusing it for all structures.
+
+    Parameters
+    ----------
+    model_name
+        Name of model to load calculator for.
 
     Returns
     -------
-    dict[str, Atoms]
-        Relaxed structures indexed by structure name and model name.
+    Calculator
+        Loaded ASE calculator.
     """
-    structs = ("LiFePO4_start_bc.cif", "LiFePO4_end_b.cif", "LiFePO4_end_c.cif")
-    relaxed_structs = {}
-
-    for model_name, calc in MODELS.items():
-        for struct_name in structs:
-            struct = read(DATA_PATH / struct_name)
-            struct.calc = calc.get_calculator(precision="high")
-            # Set default charge and spin
-            struct.info.setdefault("charge", 0)
-            struct.info.setdefault("spin", 1)
-
-            geomopt = GeomOpt(
-                struct=struct,
-                write_results=True,
-                file_prefix=OUT_PATH / f"{struct_name}-{model_name}",
-                filter_class=None,
-            )
-            geomopt.run()
-            relaxed_structs[f"{struct_name}-{model_name}"] = geomopt.struct
-    return relaxed_structs
+    return MODELS[model_name].get_calculator(precision="high")
 
 
-@pytest.mark.slow
-@pytest.mark.parametrize("model_name", MODELS)
-def test_li_diffusion_b(relaxed_structs: dict[str, Atoms], model_name: str) -> None:
+@cache
+def get_relaxed_struct(struct_name: str, model_name: str) -> Atoms:
     """
-    Run calculations required for lithium diffusion along path B.
+    Run geometry optimisation on a structure with a single model.
+
+    Results are cached, so each end point is only relaxed once per model, and only
+    for models whose NEB is requested.
+
+    Parameters
+    ----------
+    struct_name
+        Name of structure file to relax.
+    model_name
+        Name of model to use.
+
+    Returns
+    -------
+    Atoms
+        Relaxed structure, with the model's calculator attached.
+    """
+    struct = read(DATA_PATH / struct_name)
+    struct.calc = get_calculator(model_name)
+    # Set default charge and spin
+    struct.info.setdefault("charge", 0)
+    struct.info.setdefault("spin", 1)
+
+    geomopt = GeomOpt(
+        struct=struct,
+        write_results=True,
+        file_prefix=OUT_PATH / f"{struct_name}-{model_name}",
+        filter_class=None,
+    )
+    geomopt.run()
+    return geomopt.struct
+
+
+def run_li_diffusion_neb(
+    model_name: str, final_struct_name: str, path: str, parallel: bool = False
+) -> None:
+    """
+    Run NEB for lithium diffusion from the shared start structure.
 
     Parameters
     ----------
-    relaxed_structs
-        Relaxed input structures, indexed by structure name and model name.
     model_name
         Name of model to use.
+    final_struct_name
+        Name of structure file for the end of the path.
+    path
+        Label of diffusion path, used to name output files.
+    parallel
+        Whether to evaluate intermediate images concurrently. Each image is given its
+        own copy of the calculator if so. Default is False.
     """
     neb = NEB(
-        init_struct=relaxed_structs[f"LiFePO4_start_bc.cif-{model_name}"],
-        final_struct=relaxed_structs[f"LiFePO4_end_b.cif-{model_name}"],
+        init_struct=get_relaxed_struct("LiFePO4_start_bc.cif", model_name),
+        final_struct=get_relaxed_struct(final_struct_name, model_name),
         n_images=11,
         interpolator="pymatgen",
         minimize=True,
         plot_band=True,
         write_band=True,
-        file_prefix=OUT_PATH / f"li_diffusion_b-{model_name}",
+        file_prefix=OUT_PATH / f"li_diffusion_{path}-{model_name}",
+        neb_kwargs={"parallel": parallel},
     )
     # Set default charge and spin for all images
     neb.interpolate()
@@ -80,36 +111,41 @@ def test_li_diffusion_b(relaxed_structs: dict[str, Atoms], model_name: str) -> N
     for image in neb.images:
         image.info.setdefault("charge", 0)
         image.info.setdefault("spin", 1)
+    if parallel:
+        for image in neb.images[1:-1]:
+            image.calc = deepcopy(image.calc)
     neb.run()
 
 
 @pytest.mark.slow
 @pytest.mark.parametrize("model_name", MODELS)
-def test_li_diffusion_c(relaxed_structs: dict[str, Atoms], model_name: str) -> None:
+def test_li_diffusion_b(model_name: str, n_jobs: int) -> None:
+    """
+    Run calculations required for lithium diffusion along path B.
+
+    Parameters
+    ----------
+    model_name
+        Name of model to use.
+    n_jobs
+        Number of parallel workers. If greater than 1, NEB images are evaluated
+        concurrently.
+    """
+    run_li_diffusion_neb(model_name, "LiFePO4_end_b.cif", "b", parallel=n_jobs > 1)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("model_name", MODELS)
+def test_li_diffusion_c(model_name: str, n_jobs: int) -> None:
     """
     Run calculations required for lithium diffusion along path C.
 
     Parameters
     ----------
-    relaxed_structs
-        Relaxed input structures, indexed by structure name and model name.
     model_name
         Name of model to use.
+    n_jobs
+        Number of parallel workers. If greater than 1, NEB images are evaluated
+        concurrently.
     """
-    neb = NEB(
-        init_struct=relaxed_structs[f"LiFePO4_start_bc.cif-{model_name}"],
-        final_struct=relaxed_structs[f"LiFePO4_end_c.cif-{model_name}"],
-        n_images=11,
-        interpolator="pymatgen",
-        minimize=True,
-        plot_band=True,
-        write_band=True,
-        file_prefix=OUT_PATH / f"li_diffusion_c-{model_name}",
-    )
-    # Set default charge and spin for all images
-    neb.interpolate()
-    neb.interpolator = None
-    for image in neb.images:
-        image.info.setdefault("charge", 0)
-        image.info.setdefault("spin", 1)
-    neb.run()
+    run_li_diffusion_neb(model_name, "LiFePO4_end_c.cif", "c", parallel=n_jobs > 1)
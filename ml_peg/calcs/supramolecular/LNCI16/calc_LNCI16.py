@@ -12,6 +12,10 @@ from mlipx.abc import NodeWithCalculator
 from tqdm import tqdm
 import zntrack
 
+from ml_peg.calcs.supramolecular.utils.interface_utils import (
+    InterfaceTruncation,
+    uses_total_charge,
+)
 from ml_peg.calcs.utils.utils import chdir, download_s3_data
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
@@ -78,6 +82,7 @@ class LNCI16Benchmark(zntrack.Node):
 
     model: NodeWithCalculator = zntrack.deps()
     model_name: str = zntrack.params()
+    receptive_field: float | None = zntrack.params(None)
 
     @staticmethod
     def read_charge_file(filepath: Path) -> float:
@@ -155,7 +160,11 @@ class LNCI16Benchmark(zntrack.Node):
         }
 
     @staticmethod
-    def interaction_energy(frags: dict[str, Atoms], calc: Calculator) -> float:
+    def interaction_energy(
+        frags: dict[str, Atoms],
+        calc: Calculator,
+        truncation: InterfaceTruncation | None = None,
+    ) -> float:
         """
         Calculate interaction energy from fragments.
 
@@ -165,12 +174,20 @@ class LNCI16Benchmark(zntrack.Node):
             Dictionary containing 'complex', 'host', and 'guest' fragments.
         calc : Calculator
             ASE calculator for energy calculations.
+        truncation : InterfaceTruncation | None
+            If set, only evaluate local contributions from atoms near the host-guest
+            interface. Default is `None`.
 
         Returns
         -------
         float
             Interaction energy in eV.
         """
+        if truncation is not None:
+            return truncation.interaction_energy(
+                frags["complex"], frags["host"], frags["guest"], calc
+            )
+
         # Use copies to avoid potential caching issues between fragments
         complex_copy = frags["complex"].copy()
         host_copy = frags["host"].copy()
@@ -186,7 +203,10 @@ class LNCI16Benchmark(zntrack.Node):
 
     @staticmethod
     def benchmark_lnci16(
-        calc: Calculator, model_name: str, base_dir: Path
+        calc: Calculator,
+        model_name: str,
+        base_dir: Path,
+        truncation: InterfaceTruncation | None = None,
     ) -> list[Atoms]:
         """
         Benchmark LNCI16 dataset.
@@ -199,6 +219,9 @@ class LNCI16Benchmark(zntrack.Node):
             Name of the model being benchmarked.
         base_dir : Path
             Base directory containing LNCI16 data.
+        truncation : InterfaceTruncation | None
+            If set, only evaluate local contributions from atoms near the host-guest
+            interface. Default is `None`.
 
         Returns
         -------
@@ -208,10 +231,7 @@ class LNCI16Benchmark(zntrack.Node):
         print(f"Benchmarking LNCI16 with {model_name}...")
 
         # Check if calculator supports charges
-        supports_charges = any(
-            hasattr(calc, attr) for attr in ["set_charge", "charge", "total_charge_key"]
-        )
-        if supports_charges:
+        if uses_total_charge(calc):
             print(f"  Calculator {model_name} supports charge handling")
         else:
             print(f"  Calculator {model_name} may not support charge handling")
@@ -233,7 +253,7 @@ class LNCI16Benchmark(zntrack.Node):
                 )
 
             # Compute interaction energy
-            e_int_model = LNCI16Benchmark.interaction_energy(frags, calc)
+            e_int_model = LNCI16Benchmark.interaction_energy(frags, calc, truncation)
 
             # Reference energy in kcal/mol, convert to eV
             e_int_ref_kcal = LNCI16_REFERENCE_ENERGIES[system_name]
@@ -270,8 +290,14 @@ class LNCI16Benchmark(zntrack.Node):
             / "LNCI16_data/benchmark-LNCI16-main"
         )
 
+        truncation = (
+            InterfaceTruncation(self.receptive_field) if self.receptive_field else None
+        )
+
         # Run benchmark
-        complex_atoms = self.benchmark_lnci16(calc, self.model_name, data_dir)
+        complex_atoms = self.benchmark_lnci16(
+            calc, self.model_name, data_dir, truncation
+        )
 
         # Write output structures
         write_dir = OUT_PATH / self.model_name
@@ -288,7 +314,7 @@ class LNCI16Benchmark(zntrack.Node):
             write(system_file, atoms_copy, format="extxyz")
 
 
-def build_project(repro: bool = False) -> None:
+def build_project(repro: bool = False, receptive_field: float | None = None) -> None:
     """
     Build mlipx project.
 
@@ -296,6 +322,9 @@ def build_project(repro: bool = False) -> None:
     ----------
     repro
         Whether to call dvc repro -f after building.
+    receptive_field
+        Receptive field of the models, in Å. If set, interaction energies are
+        calculated from atoms near the interface only. Default is `None`.
     """
     project = mlipx.Project()
     benchmark_node_dict = {}
@@ -305,6 +334,7 @@ def build_project(repro: bool = False) -> None:
             benchmark = LNCI16Benchmark(
                 model=model,
                 model_name=model_name,
+                receptive_field=receptive_field,
             )
             benchmark_node_dict[model_name] = benchmark
 
@@ -315,6 +345,13 @@ def build_project(repro: bool = False) -> None:
         project.build()
 
 
-def test_lnci16():
-    """Run LNCI16 benchmark via pytest."""
-    build_project(repro=True)
+def test_lnci16(receptive_field: float | None) -> None:
+    """
+    Run LNCI16 benchmark via pytest.
+
+    Parameters
+    ----------
+    receptive_field
+        Receptive field of the models, in Å, to truncate interaction energies.
+    """
+    build_project(repro=True, receptive_field=receptive_field)
@@ -30,13 +30,14 @@ class PLA15Benchmark(zntrack.Node):
 
     model: NodeWithCalculator = zntrack.deps()
     model_name: str = zntrack.params()
+    receptive_field: float | None = zntrack.params(None)
 
     def run(self):
         """Run PLA15 benchmark calculations."""
         run_benchmark(self, "PLA15", OUT_PATH)
 
 
-def build_project(repro: bool = False) -> None:
+def build_project(repro: bool = False, receptive_field: float | None = None) -> None:
     """
     Build mlipx project.
 
@@ -44,6 +45,9 @@ def build_project(repro: bool = False) -> None:
     ----------
     repro
         Whether to call dvc repro -f after building.
+    receptive_field
+        Receptive field of the models, in Å. If set, interaction energies are
+        calculated from atoms near the interface only. Default is `None`.
     """
     project = mlipx.Project()
     benchmark_node_dict = {}
@@ -53,6 +57,7 @@ def build_project(repro: bool = False) -> None:
             benchmark = PLA15Benchmark(
                 model=model,
                 model_name=model_name,
+                receptive_field=receptive_field,
             )
             benchmark_node_dict[model_name] = benchmark
 
@@ -63,6 +68,13 @@ def build_project(repro: bool = False) -> None:
         project.build()
 
 
-def test_pla15():
-    """Run PLA15 benchmark via pytest."""
-    build_project(repro=True)
+def test_pla15(receptive_field: float | None) -> None:
+    """
+    Run PLA15 benchmark via pytest.
+
+    Parameters
+    ----------
+    receptive_field
+        Receptive field of the models, in Å, to truncate interaction energies.
+    """
+    build_project(repro=True, receptive_field=receptive_field)
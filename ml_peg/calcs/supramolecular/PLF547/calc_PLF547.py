@@ -23,13 +23,14 @@ class PLF547Benchmark(zntrack.Node):
 
     model: NodeWithCalculator = zntrack.deps()
     model_name: str = zntrack.params()
+    receptive_field: float | None = zntrack.params(None)
 
     def run(self):
         """Run new benchmark."""
         run_benchmark(self, "PLF547", OUT_PATH)
 
 
-def build_project(repro: bool = False) -> None:
+def build_project(repro: bool = False, receptive_field: float | None = None) -> None:
     """
     Build mlipx project.
 
@@ -37,6 +38,9 @@ def build_project(repro: bool = False) -> None:
     ----------
     repro
         Whether to call dvc repro -f after building.
+    receptive_field
+        Receptive field of the models, in Å. If set, interaction energies are
+        calculated from atoms near the interface only. Default is `None`.
     """
     project = mlipx.Project()
     benchmark_node_dict = {}
@@ -46,6 +50,7 @@ def build_project(repro: bool = False) -> None:
             benchmark = PLF547Benchmark(
                 model=model,
                 model_name=model_name,
+                receptive_field=receptive_field,
             )
             benchmark_node_dict[model_name] = benchmark
 
@@ -56,6 +61,13 @@ def build_project(repro: bool = False) -> None:
         project.build()
 
 
-def test_plf547():
-    """Run PLF547 conformation energies benchmark via pytest."""
-    build_project(repro=True)
+def test_plf547(receptive_field: float | None) -> None:
+    """
+    Run PLF547 conformation energies benchmark via pytest.
+
+    Parameters
+    ----------
+    receptive_field
+        Receptive field of the models, in Å, to truncate interaction energies.
+    """
+    build_project(repro=True, receptive_field=receptive_field)
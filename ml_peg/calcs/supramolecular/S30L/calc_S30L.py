@@ -13,6 +13,7 @@ from mlipx.abc import NodeWithCalculator
 from tqdm import tqdm
 import zntrack
 
+from ml_peg.calcs.supramolecular.utils.interface_utils import InterfaceTruncation
 from ml_peg.calcs.utils.utils import chdir, download_s3_data
 from ml_peg.models.get_models import load_models
 from ml_peg.models.models import current_models
@@ -38,6 +39,7 @@ class S30LBenchmark(zntrack.Node):
 
     model: NodeWithCalculator = zntrack.deps()
     model_name: str = zntrack.params()
+    receptive_field: float | None = zntrack.params(None)
 
     @staticmethod
     def read_charge(folder: Path) -> int:
@@ -117,7 +119,11 @@ class S30LBenchmark(zntrack.Node):
         }
 
     @staticmethod
-    def interaction_energy(frags: dict[str, Atoms], calc: Calculator) -> float:
+    def interaction_energy(
+        frags: dict[str, Atoms],
+        calc: Calculator,
+        truncation: InterfaceTruncation | None = None,
+    ) -> float:
         """
         Calculate interaction energy from fragments.
 
@@ -127,12 +133,20 @@ class S30LBenchmark(zntrack.Node):
             Dictionary containing 'host', 'guest', and 'complex' fragments.
         calc : Calculator
             ASE calculator for energy calculations.
+        truncation : InterfaceTruncation | None
+            If set, only evaluate local contributions from atoms near the host-guest
+            interface. Default is `None`.
 
         Returns
         -------
         float
             Interaction energy in eV.
         """
+        if truncation is not None:
+            return truncation.interaction_energy(
+                frags["complex"], frags["host"], frags["guest"], calc
+            )
+
         frags["complex"].calc = calc
         e_complex = frags["complex"].get_potential_energy()
         frags["host"].calc = calc
@@ -166,7 +180,11 @@ class S30LBenchmark(zntrack.Node):
         return refs
 
     def benchmark_s30l(
-        self, calc: Calculator, model_name: str, base_dir: Path
+        self,
+        calc: Calculator,
+        model_name: str,
+        base_dir: Path,
+        truncation: InterfaceTruncation | None = None,
     ) -> list[Atoms]:
         """
         Benchmark S30L dataset.
@@ -179,6 +197,9 @@ class S30LBenchmark(zntrack.Node):
             Name of the model being benchmarked.
         base_dir : Path
             Base directory containing S30L data.
+        truncation : InterfaceTruncation | None
+            If set, only evaluate local contributions from atoms near the host-guest
+            interface. Default is `None`.
 
         Returns
         -------
@@ -201,7 +222,7 @@ class S30LBenchmark(zntrack.Node):
                 guest_atoms = fragments["guest"]
 
                 # Compute interaction energy
-                e_int_model = self.interaction_energy(fragments, calc)
+                e_int_model = self.interaction_energy(fragments, calc, truncation)
 
                 # Reference energy in eV
                 e_int_ref = refs[idx]
@@ -239,8 +260,12 @@ class S30LBenchmark(zntrack.Node):
             / "S30L/s30l_test_set"
         )
 
+        truncation = (
+            InterfaceTruncation(self.receptive_field) if self.receptive_field else None
+        )
+
         # Run benchmark
-        complex_atoms = self.benchmark_s30l(calc, self.model_name, base_dir)
+        complex_atoms = self.benchmark_s30l(calc, self.model_name, base_dir, truncation)
 
         # Write output structures
         write_dir = OUT_PATH / self.model_name
@@ -255,7 +280,7 @@ class S30LBenchmark(zntrack.Node):
             write(system_file, atoms_copy, format="extxyz")
 
 
-def build_project(repro: bool = False) -> None:
+def build_project(repro: bool = False, receptive_field: float | None = None) -> None:
     """
     Build mlipx project.
 
@@ -263,6 +288,9 @@ def build_project(repro: bool = False) -> None:
     ----------
     repro
         Whether to call dvc repro -f after building.
+    receptive_field
+        Receptive field of the models, in Å. If set, interaction energies are
+        calculated from atoms near the interface only. Default is `None`.
     """
     project = mlipx.Project()
     benchmark_node_dict = {}
@@ -272,6 +300,7 @@ def build_project(repro: bool = False) -> None:
             benchmark = S30LBenchmark(
                 model=model,
                 model_name=model_name,
+                receptive_field=receptive_field,
             )
             benchmark_node_dict[model_name] = benchmark
 
@@ -282,6 +311,13 @@ def build_project(repro: bool = False) -> None:
         project.build()
 
 
-def test_s30l():
-    """Run S30L benchmark via pytest."""
-    build_project(repro=True)
+def test_s30l(receptive_field: float | None) -> None:
+    """
+    Run S30L benchmark via pytest.
+
+    Parameters
+    ----------
+    receptive_field
+        Receptive field of the models, in Å, to truncate interaction energies.
+    """
+    build_project(repro=True, receptive_field=receptive_field)
@@ -0,0 +1,35 @@
+"""Obtain the receptive_field input argument."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """
+    Add pytest option.
+
+    Parameters
+    ----------
+    parser
+        Parser to use.
+    """
+    parser.addoption("--receptive-field", action="store", default=None, type=float)
+
+
+@pytest.fixture
+def receptive_field(request):
+    """
+    Get receptive_field argument.
+
+    Parameters
+    ----------
+    request
+        Request.
+
+    Returns
+    -------
+    option
+        Requested command line argument.
+    """
+    return request.config.getoption("--receptive-field")
@@ -0,0 +1,360 @@
+"""Interface-truncated interaction energies for large supramolecular complexes."""
+
+from __future__ import annotations
+
+import warnings
+
+from ase import Atoms
+from ase.calculators.calculator import Calculator, PropertyNotImplementedError
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ml_peg.calcs.utils.utils import split_dispersion
+
+# Tolerance on agreement between truncated and full interaction energies, in eV
+DEFAULT_TOLERANCE = 1e-3
+# Attributes of calculators that read the total charge of a structure
+CHARGE_ATTRS = ("set_charge", "charge", "total_charge_key")
+
+
+def uses_total_charge(calc: Calculator) -> bool:
+    """
+    Check whether a calculator may use the total charge of a structure.
+
+    Parameters
+    ----------
+    calc
+        ASE calculator to check.
+
+    Returns
+    -------
+    bool
+        Whether the calculator has any attribute used to handle charges.
+    """
+    return any(hasattr(calc, attr) for attr in CHARGE_ATTRS)
+
+
+def get_energy(atoms: Atoms, calc: Calculator) -> float:
+    """
+    Get the potential energy of a copy of a structure.
+
+    Parameters
+    ----------
+    atoms
+        Structure to evaluate.
+    calc
+        ASE calculator for energy calculations.
+
+    Returns
+    -------
+    float
+        Potential energy in eV.
+    """
+    atoms = atoms.copy()
+    atoms.calc = calc
+    return atoms.get_potential_energy()
+
+
+def get_energies(atoms: Atoms, calc: Calculator) -> tuple[float, np.ndarray | None]:
+    """
+    Get the potential energy and per-atom energies of a copy of a structure.
+
+    The structure is only evaluated once, with per-atom energies calculated if the
+    calculator supports them.
+
+    Parameters
+    ----------
+    atoms
+        Structure to evaluate.
+    calc
+        ASE calculator for energy calculations.
+
+    Returns
+    -------
+    tuple[float, np.ndarray | None]
+        Potential energy in eV, and per-atom energies in eV, or ``None`` if these are
+        not available.
+    """
+    atoms = atoms.copy()
+    atoms.calc = calc
+    if "energies" in getattr(calc, "implemented_properties", ()):
+        try:
+            energies = atoms.get_potential_energies()
+        except PropertyNotImplementedError:
+            pass
+        else:
+            # Use the total energy if calculated at the same time
+            energy = calc.results.get("energy")
+            return float(energies.sum() if energy is None else energy), energies
+    return atoms.get_potential_energy(), None
+
+
+def get_interaction_energy(
+    complex_atoms: Atoms, receptor: Atoms, ligand: Atoms, calc: Calculator
+) -> float:
+    """
+    Calculate interaction energy from full fragments.
+
+    Parameters
+    ----------
+    complex_atoms
+        Structure of the full complex.
+    receptor
+        Structure of the receptor (protein or host).
+    ligand
+        Structure of the ligand (or guest).
+    calc
+        ASE calculator for energy calculations.
+
+    Returns
+    -------
+    float
+        Interaction energy in eV.
+    """
+    return (
+        get_energy(complex_atoms, calc)
+        - get_energy(receptor, calc)
+        - get_energy(ligand, calc)
+    )
+
+
+def truncate_to_interface(
+    frag_a: Atoms, frag_b: Atoms, cutoff: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get indices of atoms in each fragment within a cutoff of the other fragment.
+
+    Parameters
+    ----------
+    frag_a
+        First fragment.
+    frag_b
+        Second fragment.
+    cutoff
+        Distance in Å from the other fragment within which atoms are kept.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Sorted indices of atoms kept in ``frag_a`` and ``frag_b``.
+    """
+    dist_a, _ = cKDTree(frag_b.positions).query(
+        frag_a.positions, distance_upper_bound=cutoff
+    )
+    dist_b, _ = cKDTree(frag_a.positions).query(
+        frag_b.positions, distance_upper_bound=cutoff
+    )
+    return np.flatnonzero(np.isfinite(dist_a)), np.flatnonzero(np.isfinite(dist_b))
+
+
+def _subset(atoms: Atoms, indices: np.ndarray) -> Atoms:
+    """
+    Get a subset of a structure, keeping its info.
+
+    Parameters
+    ----------
+    atoms
+        Structure to take subset of.
+    indices
+        Indices of atoms to keep.
+
+    Returns
+    -------
+    Atoms
+        Structure containing only the selected atoms.
+    """
+    subset = atoms[indices]
+    subset.info = atoms.info.copy()
+    return subset
+
+
+class InterfaceTruncation:
+    """
+    Calculate interaction energies using only atoms near the interface.
+
+    For a strictly local MLIP with receptive field ``R``, the energy contribution of
+    each atom depends only on atoms within ``R``. Atoms further than ``R`` from the
+    other fragment therefore contribute equally to the complex and the isolated
+    fragment, and cancel exactly. Keeping all atoms within ``2R`` of the other fragment
+    ensures atoms within ``R`` also see their full environment, so the interaction
+    energy is unchanged while the cost scales with the size of the interface.
+
+    Long-range dispersion corrections are always evaluated on the full fragments.
+
+    Parameters
+    ----------
+    receptive_field
+        Receptive field of the MLIP, in Å. Typically the cutoff multiplied by the
+        number of message-passing layers.
+    n_validate
+        Number of systems to also evaluate without truncation. If any disagree by more
+        than `tolerance`, truncation is disabled for all subsequent systems.
+    tolerance
+        Maximum difference in eV between truncated and full interaction energies.
+    """
+
+    def __init__(
+        self,
+        receptive_field: float,
+        n_validate: int = 1,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ) -> None:
+        """
+        Initialise interface truncation settings.
+
+        Parameters
+        ----------
+        receptive_field
+            Receptive field of the MLIP, in Å.
+        n_validate
+            Number of systems to also evaluate without truncation. Default is 1.
+        tolerance
+            Maximum difference in eV between truncated and full interaction energies.
+            Default is `DEFAULT_TOLERANCE`.
+        """
+        self.receptive_field = receptive_field
+        self.n_validate = n_validate
+        self.tolerance = tolerance
+        self.enabled = True
+        self.n_validated = 0
+
+    def get_truncated_interaction_energy(
+        self, receptor: Atoms, ligand: Atoms, calc: Calculator
+    ) -> tuple[float, float | None]:
+        """
+        Calculate the interaction energy of a local calculator from the interface.
+
+        Parameters
+        ----------
+        receptor
+            Structure of the receptor (protein or host).
+        ligand
+            Structure of the ligand (or guest).
+        calc
+            Strictly local ASE calculator.
+
+        Returns
+        -------
+        tuple[float, float | None]
+            Interaction energy in eV, and the largest change in per-atom energy of
+            atoms beyond the receptive field of the other fragment, which is zero for a
+            strictly local model. The latter is ``None`` if per-atom energies are not
+            available.
+        """
+        idx_receptor, idx_ligand = truncate_to_interface(
+            receptor, ligand, 2 * self.receptive_field
+        )
+        receptor_cluster = _subset(receptor, idx_receptor)
+        ligand_cluster = _subset(ligand, idx_ligand)
+        complex_cluster = receptor_cluster + ligand_cluster
+        complex_cluster.info = receptor.info.copy()
+        complex_cluster.info["charge"] = receptor.info.get(
+            "charge", 0
+        ) + ligand.info.get("charge", 0)
+
+        # Each cluster is evaluated once, for both its energy and per-atom energies
+        complex_energy, complex_energies = get_energies(complex_cluster, calc)
+        receptor_energy, receptor_energies = get_energies(receptor_cluster, calc)
+        ligand_energy, ligand_energies = get_energies(ligand_cluster, calc)
+        e_int = complex_energy - receptor_energy - ligand_energy
+
+        # Per-atom energies beyond the receptive field should be unchanged
+        if any(
+            energies is None
+            for energies in (complex_energies, receptor_energies, ligand_energies)
+        ):
+            return e_int, None
+
+        far_receptor, far_ligand = (
+            np.setdiff1d(np.arange(len(frag)), near)
+            for frag, near in zip(
+                (receptor_cluster, ligand_cluster),
+                truncate_to_interface(
+                    receptor_cluster, ligand_cluster, self.receptive_field
+                ),
+                strict=True,
+            )
+        )
+        n_receptor = len(receptor_cluster)
+        residuals = np.concatenate(
+            (
+                complex_energies[far_receptor] - receptor_energies[far_receptor],
+                complex_energies[n_receptor + far_ligand] - ligand_energies[far_ligand],
+            )
+        )
+        locality_error = float(np.abs(residuals).max()) if residuals.size else 0.0
+        return e_int, locality_error
+
+    def interaction_energy(
+        self, complex_atoms: Atoms, receptor: Atoms, ligand: Atoms, calc: Calculator
+    ) -> float:
+        """
+        Calculate interaction energy, truncating local contributions if enabled.
+
+        The first `n_validate` systems are also evaluated without truncation, and
+        truncation is disabled if the results disagree. Truncated clusters keep the
+        charge of the full fragments, which may be wrong if charged groups are removed,
+        so systems with a charged receptor or ligand are not truncated for calculators
+        that use the total charge. Details are stored in ``complex_atoms.info``.
+
+        Parameters
+        ----------
+        complex_atoms
+            Structure of the full complex.
+        receptor
+            Structure of the receptor (protein or host).
+        ligand
+            Structure of the ligand (or guest).
+        calc
+            ASE calculator for energy calculations.
+
+        Returns
+        -------
+        float
+            Interaction energy in eV.
+        """
+        local_calcs, dispersion_calcs = split_dispersion(calc)
+
+        charged = receptor.info.get("charge", 0) or ligand.info.get("charge", 0)
+        if not self.enabled or (
+            charged and any(uses_total_charge(local) for local in local_calcs)
+        ):
+            complex_atoms.info["interface_truncated"] = False
+            return get_interaction_energy(complex_atoms, receptor, ligand, calc)
+
+        e_int = 0.0
+        locality_errors = []
+        for local_calc in local_calcs:
+            e_local, locality_error = self.get_truncated_interaction_energy(
+                receptor, ligand, local_calc
+            )
+            e_int += e_local
+            if locality_error is not None:
+                locality_errors.append(locality_error)
+        for dispersion_calc in dispersion_calcs:
+            e_int += get_interaction_energy(
+                complex_atoms, receptor, ligand, dispersion_calc
+            )
+
+        complex_atoms.info["interface_truncated"] = True
+        if locality_errors:
+            complex_atoms.info["locality_error"] = max(locality_errors)
+
+        if self.n_validated < self.n_validate:
+            self.n_validated += 1
+            e_int_full = get_interaction_energy(complex_atoms, receptor, ligand, calc)
+            complex_atoms.info["truncation_error"] = float(abs(e_int - e_int_full))
+            if abs(e_int - e_int_full) > self.tolerance:
+                warnings.warn(
+                    "Interface-truncated interaction energy differs from the full "
+                    f"calculation by {abs(e_int - e_int_full):.2e} eV (tolerance "
+                    f"{self.tolerance:.2e} eV). Check that the model is strictly local "
+                    f"with a receptive field of at most {self.receptive_field} Å. "
+                    "Disabling interface truncation.",
+                    stacklevel=2,
+                )
+                self.enabled = False
+                complex_atoms.info["interface_truncated"] = False
+                return e_int_full
+
+        return e_int
@@ -12,6 +12,7 @@ import numpy as np
 from tqdm import tqdm
 import zntrack
 
+from ml_peg.calcs.supramolecular.utils.interface_utils import InterfaceTruncation
 from ml_peg.calcs.utils.utils import download_s3_data
 
 KCAL_TO_EV = units.kcal / units.mol
@@ -105,7 +106,11 @@ def parse_references(path: Path) -> dict[str, float]:
     return ref
 
 
-def get_interaction_energy(fragments: dict[str, Atoms], calc: Calculator) -> float:
+def get_interaction_energy(
+    fragments: dict[str, Atoms],
+    calc: Calculator,
+    truncation: InterfaceTruncation | None = None,
+) -> float:
     """
     Calculate interaction energy from fragments.
 
@@ -115,12 +120,20 @@ def get_interaction_energy(fragments: dict[str, Atoms], calc: Calculator) -> flo
         Dictionary containing 'complex', 'protein', and 'ligand' fragments.
     calc
         ASE calculator for energy calculations.
+    truncation
+        If set, only evaluate local contributions from atoms near the protein-ligand
+        interface. Default is `None`.
 
     Returns
     -------
     float
         Interaction energy in eV.
     """
+    if truncation is not None:
+        return truncation.interaction_energy(
+            fragments["complex"], fragments["protein"], fragments["ligand"], calc
+        )
+
     fragments["complex"].calc = calc
     e_complex = fragments["complex"].get_potential_energy()
     fragments["complex"].calc = None
@@ -291,6 +304,12 @@ def run_benchmark(benchmark: zntrack.Node, name: str, out_path: Path) -> None:
     # Add D3 calculator for this test
     calc = benchmark.model.add_d3_calculator(calc)
 
+    truncation = (
+        InterfaceTruncation(benchmark.receptive_field)
+        if benchmark.receptive_field
+        else None
+    )
+
     ref_energies = parse_references(data_dir / "reference_energies.txt")
 
     for label, ref_energy in tqdm(ref_energies.items()):
@@ -301,7 +320,9 @@ def run_benchmark(benchmark: zntrack.Node, name: str, out_path: Path) -> None:
             continue
 
         complex_atoms = fragments["complex"]
-        complex_atoms.info["model_int_energy"] = get_interaction_energy(fragments, calc)
+        complex_atoms.info["model_int_energy"] = get_interaction_energy(
+            fragments, calc, truncation
+        )
         complex_atoms.info["ref_int_energy"] = ref_energy
         complex_atoms.info["model"] = benchmark.model_name
         complex_atoms.info["identifier"] = label
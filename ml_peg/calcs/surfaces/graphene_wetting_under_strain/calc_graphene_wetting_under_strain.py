@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 import ase.io
+from ase.io.extxyz import save_calc_results
 import pytest
 from tqdm import tqdm
 import yaml
@@ -82,8 +83,6 @@ def test_graphene_wetting_energy(mlip: tuple[str, Any]) -> None:
                 structs_dir / f"{orientation}_{strain}.xyz", index=":", format="extxyz"
             )
             write_file = write_dir / f"{orientation}_{strain}.xyz"
-            if write_file.is_file():
-                write_file.unlink(missing_ok=True)
             desc = f"{orientation} orientation with {strain[1:5]}% strain"
             for atoms in tqdm(systems, desc=desc, unit="configurations"):
                 atoms.calc = calc
@@ -94,4 +93,8 @@ def test_graphene_wetting_energy(mlip: tuple[str, Any]) -> None:
                     mlip_potential_energy - graphene_energy - water_energy
                 )
                 atoms.info["mlip_adsorption_energy"] = mlip_adsorption_energy
-                ase.io.write(write_file, atoms, append=True)
+                # Store results before the shared calculator is reused
+                save_calc_results(atoms, calc_prefix="", remove_atoms_calc=True)
+
+            # Write all configurations at once, rather than reopening the file
+            ase.io.write(write_file, systems, format="extxyz")
@@ -0,0 +1,522 @@
+"""Fast reading and writing of extended XYZ files written by ml_peg."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from io import StringIO
+import mmap
+from pathlib import Path
+import re
+
+from ase import Atoms
+from ase.constraints import FixAtoms, FixCartesian
+from ase.io import read, write
+from ase.io.extxyz import (
+    SPECIAL_3_3_KEYS,
+    UNPROCESSED_KEYS,
+    key_val_str_to_dict,
+    output_column_format,
+    parse_properties,
+    save_calc_results,
+    set_calc_and_arrays,
+    voigt_6_to_full_3x3_stress,
+)
+from ase.io.formats import string2index
+import numpy as np
+
+# Properties assumed by ASE if not specified in the comment line
+DEFAULT_PROPERTIES = "species:S:1:pos:R:3"
+
+# Key, optionally followed by a double-quoted or unquoted value, in a comment line
+_COMMENT_ITEM = re.compile(r'\s*([^\s="]+)(?:=(?:"([^"]*)"|([^\s="]+)))?(?=\s|$)')
+# Characters whose handling by ASE is not reproduced by the fast comment parser
+_COMMENT_SPECIAL = re.compile(r"[\\'{}\[\]]")
+# Parts of an array value
+_VALUE_PART = re.compile(r"[^\s,]+")
+_STR_TO_BOOL = {
+    "T": True,
+    "F": False,
+    "true": True,
+    "false": False,
+    "True": True,
+    "False": False,
+    "TRUE": True,
+    "FALSE": False,
+}
+
+
+class _UnsupportedFrameError(ValueError):
+    """Frame uses extended XYZ features not supported by the fast parser."""
+
+
+def _convert_value(key: str, value: str) -> object:
+    """
+    Convert a comment line value to numbers or booleans, as in ASE.
+
+    Parameters
+    ----------
+    key
+        Key of the value.
+    value
+        Value, without quotes.
+
+    Returns
+    -------
+    object
+        Number, boolean, array or string, matching
+        `ase.io.extxyz.key_val_str_to_dict`.
+    """
+    if key.lower() in UNPROCESSED_KEYS:
+        return value
+
+    parts = _VALUE_PART.findall(value)
+    for dtype in (int, float):
+        try:
+            numbers = np.array(parts, dtype=dtype)
+        except (ValueError, OverflowError):
+            continue
+        converted = numbers[0] if len(numbers) == 1 else numbers
+        break
+    else:
+        converted = value
+
+    if key in SPECIAL_3_3_KEYS:
+        if not isinstance(converted, np.ndarray) or converted.shape != (9,):
+            raise _UnsupportedFrameError(f"Invalid 3x3 matrix {key}")
+        converted = converted.reshape((3, 3), order="F")
+
+    if isinstance(converted, str):
+        try:
+            booleans = [_STR_TO_BOOL[part] for part in parts]
+        except KeyError:
+            return converted
+        return booleans[0] if len(booleans) == 1 else booleans
+    return converted
+
+
+def _parse_comment(comment: str) -> dict[str, object]:
+    """
+    Parse a comment line, as with `ase.io.extxyz.key_val_str_to_dict`.
+
+    Comment lines of ``key=value`` pairs, with values optionally in double quotes,
+    are parsed with a regular expression rather than character by character. Other
+    comment lines, e.g. with escaped characters, brackets, empty values or JSON,
+    are parsed by ASE.
+
+    Parameters
+    ----------
+    comment
+        Comment line, without surrounding whitespace.
+
+    Returns
+    -------
+    dict[str, object]
+        Parsed keys and values.
+    """
+    if _COMMENT_SPECIAL.search(comment) or '""' in comment:
+        return key_val_str_to_dict(comment)
+
+    info = {}
+    position = 0
+    while position < len(comment):
+        match = _COMMENT_ITEM.match(comment, position)
+        if match is None:
+            return key_val_str_to_dict(comment)
+        key, quoted, unquoted = match.groups()
+        if quoted is not None:
+            value = quoted
+        elif unquoted is not None:
+            value = unquoted
+        else:
+            # Keys without values are flags
+            value = "T"
+        info[key] = _convert_value(key, value)
+        position = match.end()
+        while position < len(comment) and comment[position].isspace():
+            position += 1
+    return info
+
+
+def _parse_column(tokens: list[str], dtype: np.dtype) -> np.ndarray:
+    """
+    Convert a column of tokens to an array.
+
+    Parameters
+    ----------
+    tokens
+        Values of the column for each atom.
+    dtype
+        Type of the column, as defined by `ase.io.extxyz.parse_properties`.
+
+    Returns
+    -------
+    np.ndarray
+        Values of the column.
+    """
+    if dtype.kind == "b":
+        return np.isin(tokens, ("T", "True"))
+    if dtype.kind == "O":
+        return np.array(tokens, dtype=object)
+    return np.array(tokens, dtype=dtype)
+
+
+def _parse_frame(comment: str, atom_lines: str, natoms: int) -> Atoms:
+    """
+    Parse a frame, converting all atoms at once.
+
+    This follows `ase.io.extxyz` for the comment line, calculator results and
+    constraints, so the structure is identical to that read by ASE.
+
+    Parameters
+    ----------
+    comment
+        Comment line of the frame.
+    atom_lines
+        Lines of the frame describing each atom.
+    natoms
+        Number of atoms in the frame.
+
+    Returns
+    -------
+    Atoms
+        Structure of the frame.
+    """
+    comment = comment.strip()
+    info = _parse_comment(comment) if comment else {}
+
+    pbc = None
+    if "pbc" in info:
+        pbc = info.pop("pbc")
+    elif "Lattice" in info:
+        pbc = [True, True, True]
+
+    cell = None
+    if "Lattice" in info:
+        # Cell is the transpose of the extended XYZ lattice
+        cell = info.pop("Lattice").T
+
+    properties, names, dtype, _ = parse_properties(
+        info.pop("Properties", DEFAULT_PROPERTIES)
+    )
+
+    # Atoms are parsed as a single block, with each column converted at once
+    tokens = atom_lines.split()
+    n_columns = len(dtype.names)
+    if len(tokens) != natoms * n_columns:
+        raise _UnsupportedFrameError("Atom lines do not match properties")
+    columns = {
+        field: _parse_column(tokens[i::n_columns], dtype.fields[field][0])
+        for i, field in enumerate(dtype.names)
+    }
+
+    arrays = {}
+    for name in names:
+        ase_name, cols = properties[name]
+        if cols == 1:
+            arrays[ase_name] = columns[name]
+        else:
+            arrays[ase_name] = np.column_stack(
+                [columns[f"{name}{c}"] for c in range(cols)]
+            )
+
+    numbers = arrays.pop("numbers", None)
+    symbols = arrays.pop("symbols", None)
+    if symbols is not None:
+        symbols = [symbol.capitalize() for symbol in symbols]
+
+    atoms = Atoms(
+        numbers if numbers is not None else symbols,
+        positions=arrays.pop("positions", None),
+        charges=arrays.pop("initial_charges", None),
+        cell=cell,
+        pbc=pbc,
+        info=info,
+    )
+
+    if "move_mask" in arrays:
+        move_mask = arrays.pop("move_mask").astype(bool)
+        if properties["move_mask"][1] == 3:
+            atoms.set_constraint(
+                [FixCartesian(i, mask=~move_mask[i, :]) for i in range(natoms)]
+            )
+        elif properties["move_mask"][1] == 1:
+            atoms.set_constraint(FixAtoms(mask=~move_mask))
+        else:
+            raise _UnsupportedFrameError("Unsupported constraint")
+
+    set_calc_and_arrays(atoms, arrays)
+    return atoms
+
+
+class ExtxyzReader(Sequence):
+    """
+    Random-access reader for extended XYZ files.
+
+    The file is memory-mapped and the start of each frame is indexed when opened,
+    so only the frames accessed are parsed. Each frame is parsed with NumPy in bulk,
+    rather than line by line, giving the same structures as `ase.io.read`. Files or
+    frames using features not supported, such as cell vectors given as ``VEC``
+    lines, are read with ASE instead.
+
+    The memory map is released by `close`, or on leaving a ``with`` block, after
+    which frames can no longer be accessed.
+
+    Parameters
+    ----------
+    path
+        Path to extended XYZ file.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Initialise reader.
+
+        Parameters
+        ----------
+        path
+            Path to extended XYZ file.
+        """
+        self.path = Path(path)
+        self._data: bytes | mmap.mmap = b""
+        # Start of each frame's comment line, end of the frame, and number of atoms
+        self._frames: list[tuple[int, int, int]] = []
+        # Structures read by ASE if the file could not be indexed
+        self._images: list[Atoms] | None = None
+
+        if self.path.stat().st_size:
+            with open(self.path, "rb") as file:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index()
+        except (ValueError, IndexError):
+            self._images = read(self.path, index=":", format="extxyz")
+            self.close()
+
+    def close(self) -> None:
+        """Release the memory map of the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+
+    def __enter__(self) -> ExtxyzReader:
+        """
+        Enter context, returning the reader.
+
+        Returns
+        -------
+        ExtxyzReader
+            This reader.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Close the reader on leaving the context.
+
+        Parameters
+        ----------
+        *exc_info
+            Exception type, value and traceback, if raised within the context.
+        """
+        self.close()
+
+    def _index(self) -> None:
+        """Find the start of each frame, stopping at the first blank line."""
+        newlines = np.flatnonzero(np.frombuffer(self._data, dtype=np.uint8) == 10)
+        line_starts = np.concatenate(([0], newlines + 1))
+        line_ends = np.append(newlines, len(self._data))
+        n_lines = len(line_ends)
+
+        line = 0
+        while line < n_lines:
+            header = self._data[line_starts[line] : line_ends[line]]
+            if not header.strip():
+                break
+            natoms = int(header)
+            end_line = line + natoms + 1
+            if end_line >= n_lines:
+                raise ValueError("File ends before last frame")
+            # Cell vectors given as pseudo-atoms are not supported
+            if end_line + 1 < n_lines and self._data[
+                line_starts[end_line + 1] : line_ends[end_line + 1]
+            ].lstrip().startswith(b"VEC"):
+                raise ValueError("VEC lines are not supported")
+            self._frames.append(
+                (int(line_starts[line + 1]), int(line_ends[end_line]), natoms)
+            )
+            line = end_line + 1
+
+    def get_atoms(self, index: int) -> Atoms:
+        """
+        Get a single frame as an ASE structure.
+
+        Parameters
+        ----------
+        index
+            Index of frame.
+
+        Returns
+        -------
+        Atoms
+            Structure of the frame.
+        """
+        if self._images is not None:
+            return self._images[index]
+        if self._frames and not self._data:
+            raise ValueError(f"Reader for {self.path} is closed")
+
+        start, end, natoms = self._frames[index]
+        text = self._data[start:end].decode()
+        comment, _, atom_lines = text.partition("\n")
+        try:
+            return _parse_frame(comment, atom_lines, natoms)
+        except (_UnsupportedFrameError, ValueError, KeyError, TypeError):
+            return read(StringIO(f"{natoms}\n{text}\n"), index=0, format="extxyz")
+
+    def __len__(self) -> int:
+        """
+        Get number of frames.
+
+        Returns
+        -------
+        int
+            Number of frames in the file.
+        """
+        if self._images is not None:
+            return len(self._images)
+        return len(self._frames)
+
+    def __getitem__(self, index: int | slice) -> Atoms | list[Atoms]:
+        """
+        Get frame(s) as ASE structures.
+
+        Parameters
+        ----------
+        index
+            Index or slice of frames.
+
+        Returns
+        -------
+        Atoms | list[Atoms]
+            Structure, or list of structures if `index` is a slice.
+        """
+        if isinstance(index, slice):
+            return [self.get_atoms(i) for i in range(len(self))[index]]
+        return self.get_atoms(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Atoms]:
+        """
+        Iterate over frames.
+
+        Yields
+        ------
+        Atoms
+            Structure of each frame.
+        """
+        for i in range(len(self)):
+            yield self.get_atoms(i)
+
+
+def read_extxyz(path: Path | str, index: int | slice | str = -1) -> Atoms | list[Atoms]:
+    """
+    Read frames from an extended XYZ file, as with `ase.io.read`.
+
+    Parameters
+    ----------
+    path
+        Path to extended XYZ file.
+    index
+        Index of frame, or slice or string such as ``":"`` for multiple frames.
+        Default is -1, the last frame.
+
+    Returns
+    -------
+    Atoms | list[Atoms]
+        Structure, or list of structures if `index` selects multiple frames.
+    """
+    if isinstance(index, str):
+        index = string2index(index)
+    with ExtxyzReader(path) as reader:
+        return reader[index]
+
+
+def _format_frame(atoms: Atoms) -> str:
+    """
+    Format a frame as extended XYZ, as written by `ase.io.write`.
+
+    This follows `ase.io.extxyz.write_xyz` with its default arguments, but formats
+    all atoms at once.
+
+    Parameters
+    ----------
+    atoms
+        Structure to format.
+
+    Returns
+    -------
+    str
+        Extended XYZ frame, including the trailing newline.
+    """
+    natoms = len(atoms)
+    calculator = atoms.calc
+    atoms = atoms.copy()
+    save_calc_results(atoms, calculator, calc_prefix="")
+    if atoms.info.get("stress", np.array([])).shape == (6,):
+        atoms.info["stress"] = voigt_6_to_full_3x3_stress(atoms.info["stress"])
+
+    # Constraints are written by ASE as a move mask, which is not supported
+    if atoms.constraints:
+        raise _UnsupportedFrameError("Constraints are not supported")
+
+    columns = ["symbols", "positions"] + [
+        key
+        for key in atoms.arrays
+        if key not in ("symbols", "positions", "numbers", "species", "pos")
+    ]
+    arrays = {
+        column: np.array(list(atoms.symbols))
+        if column == "symbols"
+        else atoms.arrays[column]
+        for column in columns
+    }
+
+    comment, n_columns, dtype, fmt = output_column_format(atoms, columns, arrays, True)
+    data = np.zeros(natoms, dtype)
+    for column, ncol in zip(columns, n_columns, strict=True):
+        value = arrays[column]
+        if ncol == 1:
+            data[column] = np.squeeze(value)
+        else:
+            for c in range(ncol):
+                data[column + str(c)] = value[:, c]
+
+    # Format every atom in a single operation, rather than line by line
+    values = tuple(value for row in data.tolist() for value in row)
+    return f"{natoms}\n{comment}\n" + (fmt * natoms) % values
+
+
+def write_extxyz(path: Path | str, images: Atoms | Iterable[Atoms]) -> None:
+    """
+    Write structures as extended XYZ, as with `ase.io.write`.
+
+    Calculator results, ``Atoms.info`` and ``Atoms.arrays`` are written as by ASE,
+    with atoms formatted in bulk. Structures whose arrays cannot be formatted this
+    way are written with ASE instead.
+
+    Parameters
+    ----------
+    path
+        Path to write to.
+    images
+        Structure or structures to write.
+    """
+    if isinstance(images, Atoms):
+        images = [images]
+    images = list(images)
+    try:
+        text = "".join(_format_frame(atoms) for atoms in images)
+    except (ValueError, KeyError, TypeError):
+        write(path, images, format="extxyz")
+        return
+    with open(path, "w", encoding="utf8") as file:
+        file.write(text)
@@ -0,0 +1,181 @@
+"""Checkpoints of the full state of molecular dynamics, to resume runs exactly."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from ase.md.md import MolecularDynamics
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+# Internal integrator variables, e.g. of `IsotropicMTKNPT`, which are not stored on
+# the atoms
+DYN_ATTRS = ("_q", "_p", "_eps", "_p_eps", "_volume0", "_cell0")
+# Nose-Hoover chain thermostat and MTK barostat variables
+CHAIN_ATTRS = {
+    "_thermostat": ("_eta", "_p_eta"),
+    "_barostat": ("_xi", "_p_xi"),
+}
+
+
+def _get_rng_state(dyn: MolecularDynamics) -> dict[str, Any] | None:
+    """
+    Get the state of the random number generator used by dynamics, if any.
+
+    Parameters
+    ----------
+    dyn
+        Dynamics to get random number generator state of.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        State of the random number generator, or `None` if the dynamics are
+        deterministic.
+    """
+    rng = getattr(dyn, "rng", None)
+    if rng is None:
+        return None
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.state
+    # `np.random.RandomState`, or the legacy global `np.random` module
+    state = rng.get_state(legacy=False)
+    state["state"] = {
+        "key": state["state"]["key"].tolist(),
+        "pos": int(state["state"]["pos"]),
+    }
+    return state
+
+
+def _set_rng_state(dyn: MolecularDynamics, state: dict[str, Any] | None) -> None:
+    """
+    Restore the state of the random number generator used by dynamics.
+
+    Parameters
+    ----------
+    dyn
+        Dynamics to restore random number generator state of.
+    state
+        State from `_get_rng_state`.
+    """
+    rng = getattr(dyn, "rng", None)
+    if rng is None or state is None:
+        return
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    else:
+        key = np.array(state["state"]["key"], dtype=np.uint32)
+        rng.set_state(state | {"state": state["state"] | {"key": key}})
+
+
+def save_checkpoint(
+    path: Path | str,
+    dyn: MolecularDynamics,
+    metadata: dict[str, Any] | None = None,
+    arrays: dict[str, np.ndarray] | None = None,
+) -> None:
+    """
+    Save the full state of dynamics, replacing any existing checkpoint atomically.
+
+    The checkpoint includes positions, momenta and cell, internal integrator,
+    thermostat and barostat variables, the state of any random number generator, and
+    the step count, so that a resumed run continues exactly as if uninterrupted.
+
+    Parameters
+    ----------
+    path
+        Path to write checkpoint to.
+    dyn
+        Dynamics to save the state of.
+    metadata
+        JSON-serialisable information to store with the checkpoint. Default is `None`.
+    arrays
+        Additional arrays to store with the checkpoint, such as sampled observables.
+        Default is `None`.
+    """
+    path = Path(path)
+    atoms = dyn.atoms
+    extra = {f"extra.{key}": np.asarray(value) for key, value in (arrays or {}).items()}
+    arrays = extra | {
+        "positions": atoms.positions,
+        "momenta": atoms.get_momenta(),
+        "cell": atoms.cell.array,
+    }
+    for attr in DYN_ATTRS:
+        if hasattr(dyn, attr):
+            arrays[f"dyn.{attr}"] = np.asarray(getattr(dyn, attr))
+    for name, attrs in CHAIN_ATTRS.items():
+        chain = getattr(dyn, name, None)
+        for attr in attrs if chain is not None else ():
+            arrays[f"{name}.{attr}"] = np.asarray(getattr(chain, attr))
+
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "nsteps": dyn.nsteps,
+        "rng": _get_rng_state(dyn),
+        "metadata": metadata or {},
+    }
+
+    # Write to a temporary file first, so an interrupted write never leaves a corrupt
+    # checkpoint
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as file:
+        np.savez(file, header=np.array(json.dumps(header)), **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(file.name, path)
+
+
+def load_checkpoint(
+    path: Path | str, dyn: MolecularDynamics
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """
+    Restore the full state of dynamics from a checkpoint.
+
+    The dynamics must have been created with the same parameters, and with atoms of
+    the same composition, as those that were saved.
+
+    Parameters
+    ----------
+    path
+        Path to checkpoint written by `save_checkpoint`.
+    dyn
+        Dynamics to restore the state of.
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, np.ndarray]]
+        Metadata and additional arrays stored with the checkpoint.
+    """
+    with np.load(path) as checkpoint:
+        header = json.loads(str(checkpoint["header"]))
+        if header["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {header['version']}")
+        arrays = {key: checkpoint[key] for key in checkpoint.files if key != "header"}
+
+    atoms = dyn.atoms
+    if arrays["positions"].shape != atoms.positions.shape:
+        raise ValueError(f"Checkpoint {path} does not match the number of atoms")
+    atoms.set_cell(arrays.pop("cell"), scale_atoms=False)
+    atoms.set_positions(arrays.pop("positions"))
+    atoms.set_momenta(arrays.pop("momenta"))
+
+    extra = {}
+    for key, value in arrays.items():
+        owner, attr = key.split(".", 1)
+        if owner == "extra":
+            extra[attr] = value
+            continue
+        target = dyn if owner == "dyn" else getattr(dyn, owner)
+        # Restore scalars as Python floats, as set by the integrators
+        setattr(target, attr, value.item() if value.ndim == 0 else value.copy())
+
+    _set_rng_state(dyn, header["rng"])
+    dyn.nsteps = header["nsteps"]
+    return header["metadata"], extra
@@ -0,0 +1,434 @@
+"""Monitors to detect unstable or unphysical molecular dynamics during a run."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+import json
+from pathlib import Path
+from typing import Any
+
+from ase import Atoms
+from ase.calculators.calculator import PropertyNotImplementedError
+from ase.data import atomic_numbers
+from ase.md.md import MolecularDynamics
+from ase.neighborlist import neighbor_list
+import numpy as np
+
+
+class MDInstabilityError(RuntimeError):
+    """
+    Error raised by a monitor to stop a simulation.
+
+    Parameters
+    ----------
+    classification
+        Type of failure, e.g. "nan_forces".
+    message
+        Description of the failure.
+    step
+        Step at which the failure was detected. Default is `None`.
+    """
+
+    def __init__(self, classification: str, message: str, step: int | None = None):
+        """
+        Initialise error.
+
+        Parameters
+        ----------
+        classification
+            Type of failure, e.g. "nan_forces".
+        message
+            Description of the failure.
+        step
+            Step at which the failure was detected. Default is `None`.
+        """
+        super().__init__(f"{classification}: {message}")
+        self.classification = classification
+        self.message = message
+        self.step = step
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get failure information as a dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            Classification, message and step of the failure.
+        """
+        return {
+            "classification": self.classification,
+            "message": self.message,
+            "step": self.step,
+        }
+
+
+class MDMonitor(ABC):
+    """Base class for checks on the state of a simulation."""
+
+    classification: str
+
+    @abstractmethod
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check the current state of the simulation.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+
+
+class NaNForcesMonitor(MDMonitor):
+    """Detect non-finite forces."""
+
+    classification = "nan_forces"
+
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check that all forces are finite.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+        forces = atoms.get_forces()
+        if np.isfinite(forces).all() and np.isfinite(atoms.positions).all():
+            return None
+        return f"{np.count_nonzero(~np.isfinite(forces).all(axis=1))} atoms"
+
+
+class MinDistanceMonitor(MDMonitor):
+    """
+    Detect atoms closer than a cutoff distance, using a neighbour list.
+
+    Parameters
+    ----------
+    cutoff
+        Minimum allowed distance between atoms, in Å.
+    elements
+        Pair of elements to check. Default is `None`, which checks all pairs.
+    patience
+        Number of consecutive checks that must fail before stopping, to ignore
+        transient close contacts. Default is 1.
+    classification
+        Type of failure to report. Default is "atom_overlap".
+    """
+
+    def __init__(
+        self,
+        cutoff: float,
+        elements: tuple[str, str] | None = None,
+        patience: int = 1,
+        classification: str = "atom_overlap",
+    ) -> None:
+        """
+        Initialise monitor.
+
+        Parameters
+        ----------
+        cutoff
+            Minimum allowed distance between atoms, in Å.
+        elements
+            Pair of elements to check. Default is `None`, which checks all pairs.
+        patience
+            Number of consecutive checks that must fail before stopping, to ignore
+            transient close contacts. Default is 1.
+        classification
+            Type of failure to report. Default is "atom_overlap".
+        """
+        self.cutoff = cutoff
+        self.elements = elements
+        self.patience = patience
+        self.classification = classification
+        self.n_failed = 0
+
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check that no atoms are closer than the cutoff.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+        i, j, d = neighbor_list("ijd", atoms, self.cutoff)
+        if self.elements is not None:
+            z_1, z_2 = (atomic_numbers[element] for element in self.elements)
+            numbers = atoms.numbers
+            mask = ((numbers[i] == z_1) & (numbers[j] == z_2)) | (
+                (numbers[i] == z_2) & (numbers[j] == z_1)
+            )
+            d = d[mask]
+
+        if not d.size:
+            self.n_failed = 0
+            return None
+
+        self.n_failed += 1
+        if self.n_failed < self.patience:
+            return None
+        pair = "-".join(self.elements) if self.elements else "atom"
+        return f"{pair} distance of {d.min():.3f} Å, below {self.cutoff} Å"
+
+
+class TemperatureMonitor(MDMonitor):
+    """
+    Detect temperatures above a maximum.
+
+    Parameters
+    ----------
+    max_temperature
+        Maximum allowed temperature, in K.
+    """
+
+    classification = "temperature_excursion"
+
+    def __init__(self, max_temperature: float) -> None:
+        """
+        Initialise monitor.
+
+        Parameters
+        ----------
+        max_temperature
+            Maximum allowed temperature, in K.
+        """
+        self.max_temperature = max_temperature
+
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check that the temperature is below the maximum.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+        temperature = atoms.get_temperature()
+        if temperature <= self.max_temperature:
+            return None
+        return f"temperature of {temperature:.1f} K, above {self.max_temperature} K"
+
+
+class DensityMonitor(MDMonitor):
+    """
+    Detect large changes in density relative to the first check.
+
+    Parameters
+    ----------
+    min_ratio
+        Minimum allowed ratio of the density to its initial value. Default is 0.5.
+    max_ratio
+        Maximum allowed ratio of the density to its initial value. Default is 2.0.
+    """
+
+    classification = "density_collapse"
+
+    def __init__(self, min_ratio: float = 0.5, max_ratio: float = 2.0) -> None:
+        """
+        Initialise monitor.
+
+        Parameters
+        ----------
+        min_ratio
+            Minimum allowed ratio of the density to its initial value. Default is 0.5.
+        max_ratio
+            Maximum allowed ratio of the density to its initial value. Default is 2.0.
+        """
+        self.min_ratio = min_ratio
+        self.max_ratio = max_ratio
+        self.initial_volume = None
+
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check that the density is within the allowed range.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+        volume = atoms.get_volume()
+        if self.initial_volume is None:
+            self.initial_volume = volume
+        ratio = self.initial_volume / volume
+        if self.min_ratio <= ratio <= self.max_ratio:
+            return None
+        return f"density changed by a factor of {ratio:.3f}"
+
+
+class EnergyDriftMonitor(MDMonitor):
+    """
+    Detect drift in the conserved energy relative to the first check.
+
+    Dynamics without a conserved energy, or calculators unable to provide it, are not
+    checked.
+
+    Parameters
+    ----------
+    max_drift
+        Maximum allowed change in the conserved energy per atom, in eV.
+    """
+
+    classification = "energy_drift"
+
+    def __init__(self, max_drift: float) -> None:
+        """
+        Initialise monitor.
+
+        Parameters
+        ----------
+        max_drift
+            Maximum allowed change in the conserved energy per atom, in eV.
+        """
+        self.max_drift = max_drift
+        self.initial_energy = None
+        self.enabled = True
+
+    def check(self, atoms: Atoms, dyn: MolecularDynamics) -> str | None:
+        """
+        Check that the conserved energy has not drifted beyond the maximum.
+
+        Parameters
+        ----------
+        atoms
+            Current structure of the simulation.
+        dyn
+            Dynamics being run.
+
+        Returns
+        -------
+        str | None
+            Description of the failure, or `None` if the state is acceptable.
+        """
+        if not self.enabled:
+            return None
+        try:
+            energy = dyn.get_conserved_energy() / len(atoms)
+        except (AttributeError, PropertyNotImplementedError):
+            self.enabled = False
+            return None
+
+        if self.initial_energy is None:
+            self.initial_energy = energy
+        drift = energy - self.initial_energy
+        if abs(drift) <= self.max_drift:
+            return None
+        return f"conserved energy drift of {drift:.4f} eV/atom"
+
+
+def check_monitors(
+    monitors: Sequence[MDMonitor], atoms: Atoms, dyn: MolecularDynamics
+) -> None:
+    """
+    Run checks, raising an error for the first that fails.
+
+    Parameters
+    ----------
+    monitors
+        Checks to run.
+    atoms
+        Current structure of the simulation.
+    dyn
+        Dynamics being run.
+    """
+    for monitor in monitors:
+        message = monitor.check(atoms, dyn)
+        if message is not None:
+            raise MDInstabilityError(monitor.classification, message, step=dyn.nsteps)
+
+
+def attach_monitors(
+    dyn: MolecularDynamics, monitors: Sequence[MDMonitor], interval: int
+) -> None:
+    """
+    Run checks periodically during dynamics.
+
+    A failed check raises `MDInstabilityError` from the dynamics' `run` method.
+
+    Parameters
+    ----------
+    dyn
+        Dynamics to attach to.
+    monitors
+        Checks to run.
+    interval
+        Interval in steps between checks.
+    """
+    dyn.attach(
+        check_monitors, interval=interval, monitors=monitors, atoms=dyn.atoms, dyn=dyn
+    )
+
+
+def write_failure(path: Path, error: MDInstabilityError) -> None:
+    """
+    Record the failure of a simulation.
+
+    Parameters
+    ----------
+    path
+        Path to write JSON file to.
+    error
+        Error raised by the monitor.
+    """
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(error.to_dict(), file)
+
+
+def read_failure(path: Path) -> dict[str, Any] | None:
+    """
+    Read the recorded failure of a simulation, if any.
+
+    Parameters
+    ----------
+    path
+        Path to JSON file written by `write_failure`.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Classification, message and step of the failure, or `None` if no failure was
+        recorded.
+    """
+    if not Path(path).exists():
+        return None
+    with open(path, encoding="utf8") as file:
+        return json.load(file)
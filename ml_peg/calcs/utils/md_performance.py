@@ -0,0 +1,286 @@
+"""Measure and record the throughput of molecular dynamics simulations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+from ase import Atoms, units
+from ase.calculators.calculator import Calculator, all_changes
+from ase.calculators.mixing import SumCalculator
+from ase.md.md import MolecularDynamics
+
+from ml_peg.calcs.utils.utils import split_dispersion
+
+
+class TimedCalculator(Calculator):
+    """
+    Calculator recording the time spent in another calculator.
+
+    Parameters
+    ----------
+    calc
+        Calculator to time.
+    """
+
+    def __init__(self, calc: Calculator) -> None:
+        """
+        Initialise calculator.
+
+        Parameters
+        ----------
+        calc
+            Calculator to time.
+        """
+        super().__init__()
+        self.calc = calc
+        self.implemented_properties = list(calc.implemented_properties)
+        self.time = 0.0
+
+    def calculate(
+        self,
+        atoms: Atoms | None = None,
+        properties: list[str] | None = None,
+        system_changes: list[str] = all_changes,
+    ) -> None:
+        """
+        Calculate the requested properties using the timed calculator.
+
+        Parameters
+        ----------
+        atoms
+            Structure to calculate properties of.
+        properties
+            Properties to calculate. Default is `None`, which calculates the energy.
+        system_changes
+            Changes since the last calculation. Default is all changes.
+        """
+        properties = ["energy"] if properties is None else properties
+        super().calculate(atoms, properties, system_changes)
+        start = time.perf_counter()
+        try:
+            for name in properties:
+                self.calc.get_property(name, atoms)
+        finally:
+            self.time += time.perf_counter() - start
+        # Include any other properties calculated at the same time
+        self.results = dict(self.calc.results)
+
+
+def _combine(calcs: list[Calculator]) -> Calculator:
+    """
+    Combine calculators into a single calculator.
+
+    Parameters
+    ----------
+    calcs
+        Calculators to combine.
+
+    Returns
+    -------
+    Calculator
+        The calculator if only one is passed, otherwise their sum.
+    """
+    return calcs[0] if len(calcs) == 1 else SumCalculator(calcs)
+
+
+def _neighbour_list_counts(calcs: list[Calculator]) -> tuple[int, int]:
+    """
+    Count calculations and neighbour list rebuilds of dispersion corrections.
+
+    Parameters
+    ----------
+    calcs
+        Dispersion calculators. Only those reusing neighbour lists, such as
+        ``SkinD3Calculator``, are counted.
+
+    Returns
+    -------
+    tuple[int, int]
+        Total number of calculations and of neighbour list rebuilds.
+    """
+    calls = sum(getattr(calc, "n_calls", 0) for calc in calcs)
+    rebuilds = sum(getattr(calc, "n_rebuilds", 0) for calc in calcs)
+    return calls, rebuilds
+
+
+def get_num_threads() -> int:
+    """
+    Get the number of threads available to models.
+
+    Returns
+    -------
+    int
+        Number of PyTorch threads if PyTorch has been imported, otherwise the number of
+        CPUs.
+    """
+    if "torch" in sys.modules:
+        return sys.modules["torch"].get_num_threads()
+    return os.cpu_count() or 1
+
+
+class PerformanceRecorder:
+    """
+    Accumulate the time spent running a simulation.
+
+    Time is split between the model, dispersion corrections, and the rest of each step,
+    including integration, monitoring and writing outputs.
+
+    Parameters
+    ----------
+    n_atoms
+        Number of atoms in the simulation.
+    timestep
+        Time step in ASE units.
+    **metadata
+        Additional information to include in records, such as the RESPA interval.
+    """
+
+    def __init__(self, n_atoms: int, timestep: float, **metadata) -> None:
+        """
+        Initialise recorder.
+
+        Parameters
+        ----------
+        n_atoms
+            Number of atoms in the simulation.
+        timestep
+            Time step in ASE units.
+        **metadata
+            Additional information to include in records.
+        """
+        self.n_atoms = n_atoms
+        self.timestep_fs = timestep / units.fs
+        self.metadata = metadata
+        self.n_steps = 0
+        self.wall_time = 0.0
+        self.model_time = 0.0
+        self.dispersion_time = 0.0
+        self.dispersion_calls = 0
+        self.neighbour_list_rebuilds = 0
+        # Timed local and dispersion calculators, reused between measurements
+        self._timers: tuple[TimedCalculator, TimedCalculator | None] | None = None
+
+    @contextmanager
+    def measure(
+        self, calc: Calculator, dyn: MolecularDynamics
+    ) -> Iterator[tuple[Calculator, Calculator | None]]:
+        """
+        Time dynamics run using a calculator.
+
+        Parameters
+        ----------
+        calc
+            Calculator to time. Dispersion corrections in a sum of calculators are timed
+            separately.
+        dyn
+            Dynamics being run, used to count steps.
+
+        Yields
+        ------
+        tuple[Calculator, Calculator | None]
+            Timed local (MLIP) calculator, and timed dispersion calculator, or `None`
+            if `calc` has no separate dispersion correction. The sum of the two gives
+            the same results as `calc`. The same timed calculators are yielded by
+            each measurement, wrapping the calculators of `calc`, so they keep the
+            results of the last step, and need not be evaluated again if dynamics
+            are continued.
+        """
+        local_calcs, dispersion_calcs = split_dispersion(calc)
+        local_calc = _combine(local_calcs)
+        dispersion_calc = _combine(dispersion_calcs) if dispersion_calcs else None
+        if self._timers is None or (self._timers[1] is None) != (
+            dispersion_calc is None
+        ):
+            self._timers = (
+                TimedCalculator(local_calc),
+                TimedCalculator(dispersion_calc) if dispersion_calc else None,
+            )
+        local_timer, dispersion_timer = self._timers
+        local_timer.calc = local_calc
+        if dispersion_timer is not None:
+            dispersion_timer.calc = dispersion_calc
+
+        start_model_time = local_timer.time
+        start_dispersion_time = dispersion_timer.time if dispersion_timer else 0.0
+        start_steps = dyn.nsteps
+        start_calls, start_rebuilds = _neighbour_list_counts(dispersion_calcs)
+        start = time.perf_counter()
+        try:
+            yield local_timer, dispersion_timer
+        finally:
+            self.wall_time += time.perf_counter() - start
+            self.n_steps += dyn.nsteps - start_steps
+            self.model_time += local_timer.time - start_model_time
+            if dispersion_timer is not None:
+                self.dispersion_time += dispersion_timer.time - start_dispersion_time
+            calls, rebuilds = _neighbour_list_counts(dispersion_calcs)
+            self.dispersion_calls += calls - start_calls
+            self.neighbour_list_rebuilds += rebuilds - start_rebuilds
+
+    def get_record(self) -> dict[str, Any]:
+        """
+        Get a summary of the time measured.
+
+        Returns
+        -------
+        dict[str, Any]
+            Number of atoms and steps, time split, dispersion calculations and
+            neighbour list rebuilds, and throughput in steps per second and ns per day.
+        """
+        steps_per_s = self.n_steps / self.wall_time if self.wall_time else 0.0
+        return {
+            "n_atoms": self.n_atoms,
+            "n_steps": self.n_steps,
+            "timestep_fs": self.timestep_fs,
+            "threads": get_num_threads(),
+            "wall_time_s": self.wall_time,
+            "model_time_s": self.model_time,
+            "dispersion_time_s": self.dispersion_time,
+            "dispersion_calls": self.dispersion_calls,
+            "neighbour_list_rebuilds": self.neighbour_list_rebuilds,
+            "integrator_time_s": max(
+                0.0, self.wall_time - self.model_time - self.dispersion_time
+            ),
+            "steps_per_s": steps_per_s,
+            "ns_per_day": steps_per_s * self.timestep_fs * 1e-6 * 86400,
+            "timestamp": time.time(),
+        } | self.metadata
+
+    def write(self, path: Path | str) -> None:
+        """
+        Append a record of the time measured to a JSON Lines file, if any steps ran.
+
+        Parameters
+        ----------
+        path
+            Path to JSON Lines file.
+        """
+        if not self.n_steps:
+            return
+        with open(path, "a", encoding="utf8") as file:
+            file.write(json.dumps(self.get_record()) + "\n")
+
+
+def read_performance_records(path: Path | str) -> list[dict[str, Any]]:
+    """
+    Read performance records written by `PerformanceRecorder`.
+
+    Parameters
+    ----------
+    path
+        Path to JSON Lines file.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Records, one for each session of a simulation.
+    """
+    with open(path, encoding="utf8") as file:
+        return [json.loads(line) for line in file if line.strip()]
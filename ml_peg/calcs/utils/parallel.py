@@ -0,0 +1,134 @@
+"""Utilities to parallelise per-structure calculations."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+from typing import Any, TypeVar
+
+from tqdm import tqdm
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+# State created by `init_worker` in each worker process, such as a calculator
+_WORKER_STATE: Any = None
+
+
+def _init_worker(init_worker: Callable[..., Any] | None, init_args: tuple) -> None:
+    """
+    Initialise state for the current worker process.
+
+    Parameters
+    ----------
+    init_worker
+        Function to create the worker state, or `None` to not create state.
+    init_args
+        Arguments to pass to `init_worker`.
+    """
+    global _WORKER_STATE
+    _WORKER_STATE = init_worker(*init_args) if init_worker is not None else None
+
+
+def _run_item(func: Callable[[Item, Any], Result], item: Item) -> Result:
+    """
+    Apply function to an item using the current worker state.
+
+    Parameters
+    ----------
+    func
+        Function to apply, which is passed the item and worker state.
+    item
+        Item to process.
+
+    Returns
+    -------
+    Result
+        Result of applying `func` to `item`.
+    """
+    return func(item, _WORKER_STATE)
+
+
+def parallel_map(
+    func: Callable[[Item, Any], Result],
+    items: Iterable[Item],
+    *,
+    init_worker: Callable[..., Any] | None = None,
+    init_args: tuple = (),
+    n_jobs: int = 1,
+    max_in_flight: int | None = None,
+    desc: str | None = None,
+    start_method: str = "spawn",
+) -> list[Result]:
+    """
+    Apply a function to each item, optionally across a pool of processes.
+
+    Each worker calls ``init_worker(*init_args)`` once, typically to load a
+    calculator, and the result is passed to every call of `func` in that worker. This
+    avoids reloading models for each item, and ensures calculators are never shared
+    between processes.
+
+    Parameters
+    ----------
+    func
+        Function called as ``func(item, state)``, where `state` is the result of
+        `init_worker`. Must be picklable, e.g. defined at the top level of a module, if
+        ``n_jobs > 1``.
+    items
+        Items to process. These are consumed lazily.
+    init_worker
+        Function to create the state for each worker. Default is `None`, for which
+        `state` is `None`.
+    init_args
+        Arguments to pass to `init_worker`. Default is ``()``.
+    n_jobs
+        Number of worker processes. If 1, items are processed in the current process.
+        Default is 1.
+    max_in_flight
+        Maximum number of items submitted but not yet collected, which bounds the
+        memory used by pending inputs and results. Default is ``2 * n_jobs``.
+    desc
+        Description for the progress bar. Default is `None`.
+    start_method
+        Multiprocessing start method. Default is "spawn", which is safe for libraries
+        that use threads or GPUs, such as PyTorch.
+
+    Returns
+    -------
+    list[Result]
+        Results of applying `func` to each item, in the order of `items`.
+    """
+    total = len(items) if hasattr(items, "__len__") else None
+
+    if n_jobs <= 1:
+        state = init_worker(*init_args) if init_worker is not None else None
+        return [func(item, state) for item in tqdm(items, desc=desc, total=total)]
+
+    max_in_flight = max_in_flight if max_in_flight is not None else 2 * n_jobs
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    results = []
+    pending: deque[Future] = deque()
+    with (
+        ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(init_worker, init_args),
+        ) as executor,
+        tqdm(desc=desc, total=total) as progress,
+    ):
+        for item in items:
+            if len(pending) >= max_in_flight:
+                results.append(pending.popleft().result())
+                progress.update()
+            pending.append(executor.submit(_run_item, func, item))
+
+        while pending:
+            results.append(pending.popleft().result())
+            progress.update()
+
+    return results
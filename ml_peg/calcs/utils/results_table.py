@@ -0,0 +1,72 @@
+"""Columnar tables of calculation results, read by analysis in a single load."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+import numpy as np
+
+# Column identifying each row, e.g. the material or system label
+ID_COLUMN = "id"
+# Column of structure file paths relative to the table, empty if not written
+STRUCTURE_COLUMN = "structure"
+
+
+def write_results_table(
+    path: Path, columns: Mapping[str, Sequence[Any] | np.ndarray]
+) -> None:
+    """
+    Write a table of results, with one array per column.
+
+    Tables are stored as uncompressed ``.npz`` files, so each column is read as a
+    single array. Missing floating point values should be stored as NaN. Columns
+    may be vectors of a fixed length, with one row per entry of the first axis.
+
+    Parameters
+    ----------
+    path
+        Path to write the table to, typically with the suffix ``.npz``.
+    columns
+        Values of each column, which must all have the same length. A column named
+        `ID_COLUMN` is recommended to identify rows, and `STRUCTURE_COLUMN` to
+        reference structure files relative to `path`.
+    """
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+    lengths = {name: len(array) for name, array in arrays.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Columns must all have the same length, got {lengths}")
+    for name, array in arrays.items():
+        if array.dtype == object:
+            raise TypeError(
+                f"Column '{name}' cannot be stored as a numeric or string array"
+            )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".npz", delete=False
+    ) as file:
+        np.savez(file, **arrays)
+    os.replace(file.name, path)
+
+
+def read_results_table(path: Path) -> dict[str, np.ndarray]:
+    """
+    Read a table of results written by `write_results_table`.
+
+    Parameters
+    ----------
+    path
+        Path to table.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Values of each column.
+    """
+    with np.load(path, allow_pickle=False) as table:
+        return {name: table[name] for name in table.files}
@@ -0,0 +1,414 @@
+"""Compact binary trajectories for molecular dynamics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+import json
+from pathlib import Path
+import struct
+from typing import Any
+
+from ase import Atoms
+from ase.io import write
+from ase.md.md import MolecularDynamics
+import numpy as np
+
+MAGIC = b"MLPEGTRJ"
+VERSION = 1
+# Magic string, followed by version and length of the JSON header
+_PREFIX = struct.Struct("<II")
+
+
+def _frame_dtype(n_atoms: int, dtype: str, info_keys: Sequence[str]) -> np.dtype:
+    """
+    Get structured dtype of a single frame.
+
+    Parameters
+    ----------
+    n_atoms
+        Number of atoms in each frame.
+    dtype
+        Floating point type used to store positions.
+    info_keys
+        Keys of scalar ``Atoms.info`` values stored for each frame.
+
+    Returns
+    -------
+    np.dtype
+        Structured dtype describing a frame.
+    """
+    fields = [
+        ("step", "<i8"),
+        ("cell", "<f8", (3, 3)),
+        ("positions", np.dtype(dtype).newbyteorder("<"), (n_atoms, 3)),
+    ]
+    if info_keys:
+        fields.append(("info", "<f8", (len(info_keys),)))
+    return np.dtype(fields)
+
+
+def _read_header(path: Path) -> tuple[dict[str, Any], int]:
+    """
+    Read the header of a binary trajectory.
+
+    Parameters
+    ----------
+    path
+        Path to binary trajectory.
+
+    Returns
+    -------
+    tuple[dict[str, Any], int]
+        Header metadata, and offset of the first frame in bytes.
+    """
+    with open(path, "rb") as file:
+        magic = file.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary trajectory")
+        version, header_len = _PREFIX.unpack(file.read(_PREFIX.size))
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary trajectory version: {version}")
+        header = json.loads(file.read(header_len).decode("utf8"))
+    return header, len(MAGIC) + _PREFIX.size + header_len
+
+
+class BinaryTrajectoryWriter:
+    """
+    Buffered writer for fixed-composition trajectories.
+
+    Frames are stored as fixed-size binary records after a short header, so
+    trajectories can be appended to and individual frames can be read without parsing
+    the rest of the file. Frames are buffered in memory and written every
+    `flush_interval` frames, and any incomplete frame left by an interrupted run is
+    discarded when appending.
+
+    Parameters
+    ----------
+    path
+        Path to write trajectory to.
+    atoms
+        Structure to write. Its atomic numbers and periodic boundary conditions are
+        fixed for the trajectory.
+    mode
+        "w" to overwrite any existing trajectory, or "a" to append to it. Default is
+        "w".
+    stride
+        Interval in steps at which frames are written when attached to dynamics.
+        Default is 1.
+    flush_interval
+        Number of frames to buffer before writing to file. Default is 100.
+    dtype
+        Floating point type used to store positions. Default is "float32".
+    info_keys
+        Keys of scalar ``atoms.info`` values to store for each frame. Default is
+        ``()``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        atoms: Atoms,
+        mode: str = "w",
+        stride: int = 1,
+        flush_interval: int = 100,
+        dtype: str = "float32",
+        info_keys: Sequence[str] = (),
+    ) -> None:
+        """
+        Initialise writer, writing the header for new trajectories.
+
+        Parameters
+        ----------
+        path
+            Path to write trajectory to.
+        atoms
+            Structure to write. Its atomic numbers and periodic boundary conditions are
+            fixed for the trajectory.
+        mode
+            "w" to overwrite any existing trajectory, or "a" to append to it. Default
+            is "w".
+        stride
+            Interval in steps at which frames are written when attached to dynamics.
+            Default is 1.
+        flush_interval
+            Number of frames to buffer before writing to file. Default is 100.
+        dtype
+            Floating point type used to store positions. Default is "float32".
+        info_keys
+            Keys of scalar ``atoms.info`` values to store for each frame. Default is
+            ``()``.
+        """
+        if mode not in ("w", "a"):
+            raise ValueError(f"Invalid mode: {mode}. Must be 'w' or 'a'")
+
+        self.path = Path(path)
+        self.atoms = atoms
+        self.stride = stride
+        self.flush_interval = flush_interval
+        self.n_written = 0
+
+        header = {
+            "numbers": atoms.numbers.tolist(),
+            "pbc": atoms.pbc.tolist(),
+            "dtype": np.dtype(dtype).name,
+            "info_keys": list(info_keys),
+        }
+
+        if mode == "a" and self.path.exists() and self.path.stat().st_size:
+            existing, offset = _read_header(self.path)
+            if existing != header:
+                raise ValueError(
+                    f"Cannot append to {self.path}: atoms or stored fields differ"
+                )
+            self._dtype = _frame_dtype(len(atoms), header["dtype"], info_keys)
+            n_frames = (self.path.stat().st_size - offset) // self._dtype.itemsize
+            self._file = open(self.path, "r+b")  # noqa: SIM115
+            # Discard any partially written frame
+            self._file.truncate(offset + n_frames * self._dtype.itemsize)
+            self._file.seek(0, 2)
+            self.n_written = n_frames
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._dtype = _frame_dtype(len(atoms), header["dtype"], info_keys)
+            encoded = json.dumps(header).encode("utf8")
+            self._file = open(self.path, "wb")  # noqa: SIM115
+            self._file.write(MAGIC + _PREFIX.pack(VERSION, len(encoded)) + encoded)
+            self._file.flush()
+
+        self._info_keys = tuple(info_keys)
+        self._buffer = np.zeros(max(flush_interval, 1), dtype=self._dtype)
+        self._n_buffered = 0
+
+    def write(self, atoms: Atoms | None = None, step: int | None = None) -> None:
+        """
+        Add a frame to the buffer, writing the buffer to file if full.
+
+        Parameters
+        ----------
+        atoms
+            Structure to write. Default is the structure passed on initialisation.
+        step
+            Step number to store with the frame. Default is the frame index.
+        """
+        atoms = self.atoms if atoms is None else atoms
+        if len(atoms) != self._dtype["positions"].shape[0]:
+            raise ValueError("Number of atoms cannot change within a trajectory")
+
+        frame = self._buffer[self._n_buffered]
+        frame["step"] = self.n_written if step is None else step
+        frame["cell"] = atoms.cell.array
+        frame["positions"] = atoms.positions
+        if self._info_keys:
+            frame["info"] = [atoms.info.get(key, np.nan) for key in self._info_keys]
+
+        self._n_buffered += 1
+        self.n_written += 1
+        if self._n_buffered >= len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered frames to file."""
+        if self._n_buffered:
+            self._file.write(self._buffer[: self._n_buffered].tobytes())
+            self._n_buffered = 0
+        self._file.flush()
+
+    def attach(self, dyn: MolecularDynamics) -> None:
+        """
+        Write frames every `stride` steps of dynamics.
+
+        Parameters
+        ----------
+        dyn
+            Dynamics to attach to.
+        """
+        dyn.attach(lambda: self.write(step=dyn.nsteps), interval=self.stride)
+
+    def close(self) -> None:
+        """Write any buffered frames and close file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> BinaryTrajectoryWriter:
+        """
+        Enter context manager.
+
+        Returns
+        -------
+        BinaryTrajectoryWriter
+            Trajectory writer.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Exit context manager, closing file.
+
+        Parameters
+        ----------
+        *args
+            Exception information, if raised.
+        """
+        self.close()
+
+
+class BinaryTrajectoryReader(Sequence):
+    """
+    Random-access reader for binary trajectories.
+
+    Frames are memory-mapped, so only the frames accessed are read from disk.
+
+    Parameters
+    ----------
+    path
+        Path to binary trajectory.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Initialise reader.
+
+        Parameters
+        ----------
+        path
+            Path to binary trajectory.
+        """
+        self.path = Path(path)
+        header, offset = _read_header(self.path)
+        self.numbers = np.array(header["numbers"], dtype=int)
+        self.pbc = np.array(header["pbc"], dtype=bool)
+        self.info_keys = header["info_keys"]
+
+        dtype = _frame_dtype(len(self.numbers), header["dtype"], self.info_keys)
+        n_frames = (self.path.stat().st_size - offset) // dtype.itemsize
+        self.frames = (
+            np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=n_frames)
+            if n_frames
+            else np.zeros(0, dtype=dtype)
+        )
+
+    @property
+    def steps(self) -> np.ndarray:
+        """
+        Get the step number of each frame.
+
+        Returns
+        -------
+        np.ndarray
+            Step numbers of all frames.
+        """
+        return np.asarray(self.frames["step"])
+
+    @property
+    def cells(self) -> np.ndarray:
+        """
+        Get the cell of each frame.
+
+        Returns
+        -------
+        np.ndarray
+            Cells of all frames, with shape ``(n_frames, 3, 3)``.
+        """
+        return np.asarray(self.frames["cell"])
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Get the positions of each frame.
+
+        Returns
+        -------
+        np.ndarray
+            Memory-mapped positions of all frames, with shape ``(n_frames, n_atoms,
+            3)``.
+        """
+        return self.frames["positions"]
+
+    def get_atoms(self, index: int) -> Atoms:
+        """
+        Get a single frame as an ASE structure.
+
+        Parameters
+        ----------
+        index
+            Index of frame.
+
+        Returns
+        -------
+        Atoms
+            Structure of the frame.
+        """
+        frame = self.frames[index]
+        atoms = Atoms(
+            numbers=self.numbers,
+            positions=np.asarray(frame["positions"], dtype=float),
+            cell=np.asarray(frame["cell"]),
+            pbc=self.pbc,
+        )
+        atoms.info["step"] = int(frame["step"])
+        for key, value in zip(
+            self.info_keys, frame["info"] if self.info_keys else (), strict=True
+        ):
+            atoms.info[key] = float(value)
+        return atoms
+
+    def __len__(self) -> int:
+        """
+        Get number of frames.
+
+        Returns
+        -------
+        int
+            Number of complete frames in the trajectory.
+        """
+        return len(self.frames)
+
+    def __getitem__(self, index: int | slice) -> Atoms | list[Atoms]:
+        """
+        Get frame(s) as ASE structures.
+
+        Parameters
+        ----------
+        index
+            Index or slice of frames.
+
+        Returns
+        -------
+        Atoms | list[Atoms]
+            Structure, or list of structures if `index` is a slice.
+        """
+        if isinstance(index, slice):
+            return [self.get_atoms(i) for i in range(len(self))[index]]
+        return self.get_atoms(index)
+
+    def __iter__(self) -> Iterator[Atoms]:
+        """
+        Iterate over frames.
+
+        Yields
+        ------
+        Atoms
+            Structure of each frame.
+        """
+        for i in range(len(self)):
+            yield self.get_atoms(i)
+
+
+def binary_trajectory_to_extxyz(
+    path: Path | str, out_path: Path | str, stride: int = 1
+) -> None:
+    """
+    Convert a binary trajectory to extended XYZ, e.g. for visualisation.
+
+    Parameters
+    ----------
+    path
+        Path to binary trajectory.
+    out_path
+        Path to write extended XYZ file to.
+    stride
+        Interval between frames to write. Default is 1.
+    """
+    reader = BinaryTrajectoryReader(path)
+    write(out_path, reader[::stride], format="extxyz")
@@ -8,6 +8,8 @@ import pathlib
 from pathlib import Path
 import zipfile
 
+from ase.calculators.calculator import Calculator
+from ase.calculators.mixing import LinearCombinationCalculator
 import requests
 
 from ml_peg.data.data import download
@@ -139,3 +141,46 @@ def chdir(path: Path):
         yield
     finally:
         os.chdir(prev_cwd)
+
+
+def _dispersion_calculator_types() -> tuple[type[Calculator], ...]:
+    """
+    Get the classes of dispersion corrections added to models.
+
+    Returns
+    -------
+    tuple[type[Calculator], ...]
+        Dispersion calculator classes, or an empty tuple if ``torch_dftd`` is not
+        installed, in which case no calculator can be a dispersion correction.
+    """
+    try:
+        from torch_dftd.torch_dftd3_calculator import TorchDFTD3Calculator
+    except ImportError:
+        return ()
+    return (TorchDFTD3Calculator,)
+
+
+def split_dispersion(calc: Calculator) -> tuple[list[Calculator], list[Calculator]]:
+    """
+    Separate local calculators from long-range dispersion corrections.
+
+    Parameters
+    ----------
+    calc
+        ASE calculator, which may be a sum of calculators including D3 corrections.
+        Weighted combinations of calculators are not separated.
+
+    Returns
+    -------
+    tuple[list[Calculator], list[Calculator]]
+        Local (MLIP) calculators, and long-range dispersion calculators.
+    """
+    if not isinstance(calc, LinearCombinationCalculator) or any(
+        weight != 1 for weight in calc.mixer.weights
+    ):
+        return [calc], []
+    dispersion_types = _dispersion_calculator_types()
+    calcs = calc.mixer.calcs
+    local_calcs = [sub for sub in calcs if not isinstance(sub, dispersion_types)]
+    dispersion_calcs = [sub for sub in calcs if isinstance(sub, dispersion_types)]
+    return local_calcs, dispersion_calcs
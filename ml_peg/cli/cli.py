@@ -161,6 +161,10 @@ def run_calcs(
     run_very_slow: Annotated[
         bool, Option(help="Whether to run calculations labelled very slow.")
     ] = False,
+    jobs: Annotated[
+        int,
+        Option(help="Number of parallel workers for calculations that support it."),
+    ] = 1,
     verbose: Annotated[
         bool, Option(help="Whether to run pytest with verbose and stdout printed.")
     ] = True,
@@ -185,6 +189,8 @@ def run_calcs(
         Whether to run slow calculations. Default is `True`.
     run_very_slow
         Whether to run very slow calculations. Default is `False`.
+    jobs
+        Number of parallel workers for calculations that support it. Default is 1.
     verbose
         Whether to run pytest with verbose and stdout printed. Default is `True`.
     """
@@ -210,6 +216,8 @@ def run_calcs(
     if models:
         options.extend(["--models", models])
 
+    options.extend(["--jobs", str(jobs)])
+
     # Parse any custom options to pytest
     options.extend(ctx.args)
 
@@ -234,6 +242,10 @@ def run_analysis(
     test: Annotated[
         str, Option(help="Test to run analysis for. Default is all tests.")
     ] = "*",
+    jobs: Annotated[
+        int,
+        Option(help="Number of tests to analyse concurrently, slowest first."),
+    ] = 1,
     verbose: Annotated[
         bool, Option(help="Whether to run pytest with verbose and stdout printed.")
     ] = True,
@@ -251,12 +263,16 @@ def run_analysis(
     test
         Test to run analysis for. Default is `*`, corresponding to all tests in the
         category.
+    jobs
+        Number of tests to analyse concurrently, each in its own process. Tests that
+        took longest to analyse previously are started first. Default is 1.
     verbose
         Whether to run pytest with verbose and stdout printed. Default is `True`.
     """
     import pytest
 
     from ml_peg.analysis import ANALYSIS_ROOT
+    from ml_peg.analysis.utils.runner import run_analysis_parallel
 
     options = list(ANALYSIS_ROOT.glob(f"{category}/{test}/analyse_*.py"))
     if not options:
@@ -271,6 +287,14 @@ def run_analysis(
     if models:
         options.extend(["--models", models])
 
+    if jobs > 1:
+        paths = [option for option in options if isinstance(option, Path)]
+        pytest_args = [option for option in options if not isinstance(option, Path)]
+        exit_code = run_analysis_parallel(
+            paths, pytest_args, n_jobs=jobs, verbose=verbose
+        )
+        raise Exit(exit_code)
+
     pytest.main(options)
 
 
@@ -0,0 +1,147 @@
+"""Dispersion corrections with reusable neighbour lists."""
+
+from __future__ import annotations
+
+import torch
+from torch import Tensor
+from torch_dftd.functions.edge_extraction import calc_edge_index
+from torch_dftd.torch_dftd3_calculator import TorchDFTD3Calculator
+
+# Default distance beyond the cutoff included in the neighbour list, in Å
+DEFAULT_SKIN = 2.0
+
+
+class SkinD3Calculator(TorchDFTD3Calculator):
+    """
+    TorchDFTD3 calculator that reuses a Verlet neighbour list between calls.
+
+    The neighbour list includes pairs within ``cutoff + skin``, and is only rebuilt
+    once an atom may have moved far enough for a pair outside the list to come within
+    the cutoff. Without changes to the cell, this is when the maximum displacement
+    since the last rebuild exceeds half the skin. Changes to the cell, such as during
+    NPT simulations, are accounted for by measuring displacements relative to the
+    affine deformation of the cell. Pairs in the list beyond the cutoff are excluded
+    from each calculation, so results match those of `TorchDFTD3Calculator`.
+
+    Parameters
+    ----------
+    *args
+        Arguments passed to `TorchDFTD3Calculator`.
+    skin
+        Distance beyond the cutoff included in the neighbour list, in Å. Default is
+        `DEFAULT_SKIN`.
+    **kwargs
+        Keyword arguments passed to `TorchDFTD3Calculator`.
+    """
+
+    name = "SkinD3Calculator"
+
+    def __init__(self, *args, skin: float = DEFAULT_SKIN, **kwargs) -> None:
+        """
+        Initialise calculator.
+
+        Parameters
+        ----------
+        *args
+            Arguments passed to `TorchDFTD3Calculator`.
+        skin
+            Distance beyond the cutoff included in the neighbour list, in Å. Default
+            is `DEFAULT_SKIN`.
+        **kwargs
+            Keyword arguments passed to `TorchDFTD3Calculator`.
+        """
+        super().__init__(*args, **kwargs)
+        self.skin = skin
+        self.n_calls = 0
+        self.n_rebuilds = 0
+        self._edge_index: Tensor | None = None
+        self._shifts: Tensor | None = None
+        self._ref_pos: Tensor | None = None
+        self._ref_cell: Tensor | None = None
+        self._ref_pbc: Tensor | None = None
+
+    def _needs_rebuild(self, pos: Tensor, cell: Tensor | None, pbc: Tensor) -> bool:
+        """
+        Check whether any pair outside the neighbour list may be within the cutoff.
+
+        Parameters
+        ----------
+        pos
+            Atomic positions.
+        cell
+            Unit cell, or `None` for non-periodic systems.
+        pbc
+            Periodic boundary conditions.
+
+        Returns
+        -------
+        bool
+            Whether the neighbour list must be rebuilt.
+        """
+        if (
+            self._edge_index is None
+            or pos.shape != self._ref_pos.shape
+            or (cell is None) != (self._ref_cell is None)
+            or not torch.equal(pbc, self._ref_pbc)
+        ):
+            return True
+
+        if cell is None:
+            displacements = pos - self._ref_pos
+            min_stretch = 1.0
+        else:
+            # Displacements relative to the affine deformation of the cell
+            deformation = torch.linalg.solve(self._ref_cell, cell)
+            displacements = pos - self._ref_pos @ deformation
+            min_stretch = torch.linalg.svdvals(deformation).min().item()
+
+        max_displacement = torch.linalg.norm(displacements, dim=1).max().item()
+        return (
+            2 * max_displacement
+            >= min_stretch * (self.cutoff + self.skin) - self.cutoff
+        )
+
+    def _calc_edge_index(
+        self, pos: Tensor, cell: Tensor | None = None, pbc: Tensor | None = None
+    ) -> tuple[Tensor, Tensor]:
+        """
+        Get pairs within the cutoff, rebuilding the neighbour list only if required.
+
+        Parameters
+        ----------
+        pos
+            Atomic positions.
+        cell
+            Unit cell, or `None` for non-periodic systems. Default is `None`.
+        pbc
+            Periodic boundary conditions. Default is `None`.
+
+        Returns
+        -------
+        tuple[Tensor, Tensor]
+            Indices of pairs within the cutoff, and their periodic shifts.
+        """
+        self.n_calls += 1
+        if len(pos) == 0:
+            return super()._calc_edge_index(pos, cell, pbc)
+
+        if self._needs_rebuild(pos, cell, pbc):
+            self._edge_index, self._shifts = calc_edge_index(
+                pos,
+                cell,
+                pbc,
+                cutoff=self.cutoff + self.skin,
+                bidirectional=self.bidirectional,
+            )
+            self._ref_pos = pos.detach().clone()
+            self._ref_cell = None if cell is None else cell.detach().clone()
+            self._ref_pbc = pbc.detach().clone()
+            self.n_rebuilds += 1
+
+        idx_i, idx_j = self._edge_index
+        pos = pos.detach()
+        vectors = pos[idx_j] - pos[idx_i]
+        if cell is not None:
+            vectors = vectors + self._shifts @ cell
+        within = torch.linalg.norm(vectors, dim=1) <= self.cutoff
+        return self._edge_index[:, within], self._shifts[within]
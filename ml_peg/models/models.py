@@ -24,7 +24,8 @@ class SumCalc:
 
     ``add_d3_calculator`` only wraps calculators with an explicit TorchDFTD3
     correction when ``trained_on_dispersion`` is ``False``; otherwise the original
-    calculator is returned untouched.
+    calculator is returned untouched. The correction reuses its neighbour list between
+    calls, with a skin set by ``dispersion_kwargs["skin"]``.
     """
 
     trained_on_dispersion: bool = False
@@ -51,17 +52,19 @@ class SumCalc:
         from ase import units
         from ase.calculators.mixing import SumCalculator
         import torch
-        from torch_dftd.torch_dftd3_calculator import TorchDFTD3Calculator
+
+        from ml_peg.models.dispersion import DEFAULT_SKIN, SkinD3Calculator
 
         if not isinstance(calcs, list):
             calcs = [calcs]
 
-        d3_calc = TorchDFTD3Calculator(
+        d3_calc = SkinD3Calculator(
             device=self.dispersion_kwargs.get("device", "cpu"),
             damping=self.dispersion_kwargs.get("damping", "bj"),
             xc=self.dispersion_kwargs.get("xc", "pbe"),
             dtype=getattr(torch, self.dispersion_kwargs.get("dtype", "float32")),
             cutoff=self.dispersion_kwargs.get("cutoff", 40.0 * units.Bohr),
+            skin=self.dispersion_kwargs.get("skin", DEFAULT_SKIN),
         )
         calcs.append(d3_calc)
 
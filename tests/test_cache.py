@@ -0,0 +1,104 @@
+"""Test caching of per-model analysis results."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ml_peg.analysis.utils import cache
+from ml_peg.analysis.utils.cache import CACHE_DIR_NAME, cache_per_model
+
+
+def test_cache_per_model(tmp_path: Path):
+    """Test results are recomputed only when a model's inputs change."""
+    calc_path = tmp_path / "calcs"
+    for model_name in ("model_a", "model_b"):
+        (calc_path / model_name).mkdir(parents=True)
+        (calc_path / model_name / "out.xyz").write_text(model_name)
+
+    calls = []
+
+    @cache_per_model(tmp_path / CACHE_DIR_NAME, lambda model: calc_path / model)
+    def analyse(model_name: str, scale: float = 1.0) -> float:
+        """
+        Record the call and return a result.
+
+        Parameters
+        ----------
+        model_name
+            Name of model.
+        scale
+            Additional argument included in the cache key.
+
+        Returns
+        -------
+        float
+            Result for the model.
+        """
+        calls.append((model_name, scale))
+        return len(calls) * scale
+
+    assert analyse("model_a") == 1.0
+    assert analyse("model_b") == 2.0
+    # Unchanged inputs are read from the cache
+    assert analyse("model_a") == 1.0
+    assert analyse("model_b") == 2.0
+    assert calls == [("model_a", 1.0), ("model_b", 1.0)]
+
+    # Changing the modification time of an input only recomputes that model
+    out_file = calc_path / "model_a" / "out.xyz"
+    mtime_ns = out_file.stat().st_mtime_ns
+    os.utime(out_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert analyse("model_a") == 3.0
+    assert analyse("model_b") == 2.0
+    assert analyse("model_a") == 3.0
+    assert len(calls) == 3
+
+    # New input files and different arguments are also recomputed
+    (calc_path / "model_b" / "new.xyz").write_text("new")
+    assert analyse("model_b") == 4.0
+    assert analyse("model_b", 2.0) == 10.0
+    assert analyse("model_b", 2.0) == 10.0
+    assert len(calls) == 5
+
+
+def test_cache_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test results are recomputed when the cache version changes."""
+    (tmp_path / "model.xyz").write_text("model")
+    calls = []
+
+    @cache_per_model(tmp_path / CACHE_DIR_NAME, lambda model: tmp_path / "model.xyz")
+    def analyse(model_name: str) -> int:
+        """
+        Record the call and return a result.
+
+        Parameters
+        ----------
+        model_name
+            Name of model.
+
+        Returns
+        -------
+        int
+            Number of calls so far.
+        """
+        calls.append(model_name)
+        return len(calls)
+
+    assert analyse("model") == 1
+    assert analyse("model") == 1
+
+    monkeypatch.setattr(cache, "CACHE_VERSION", cache.CACHE_VERSION + 1)
+    cache._source_hash.cache_clear()
+    assert analyse("model") == 2
+    assert analyse("model") == 2
+    cache._source_hash.cache_clear()
+
+
+def test_helper_modules_in_key():
+    """Test helper modules imported by a module are included in its cache key."""
+    helpers = cache._helper_files(Path(__file__).resolve())
+
+    assert Path(cache.__file__).resolve() in helpers
@@ -0,0 +1,102 @@
+"""Test sampling of density scatter grids."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ml_peg.analysis.utils.utils import sample_density_grid
+
+GRID_SIZE = 10
+MAX_POINTS_PER_CELL = 3
+
+
+def check_sample(ref: np.ndarray, pred: np.ndarray) -> None:
+    """
+    Check a grid sample is consistent with binning the finite points directly.
+
+    Parameters
+    ----------
+    ref
+        Reference values, which may include NaN.
+    pred
+        Predicted values, which may include NaN.
+    """
+    sample = sample_density_grid(
+        ref, pred, grid_size=GRID_SIZE, max_points_per_cell=MAX_POINTS_PER_CELL
+    )
+    valid = np.flatnonzero(np.isfinite(ref) & np.isfinite(pred))
+
+    # Bin valid points directly, one at a time
+    x, y = ref[valid], pred[valid]
+    bins_x = np.clip((x - x.min()) / np.ptp(x), 0, 0.999999) * GRID_SIZE
+    bins_y = np.clip((y - y.min()) / np.ptp(y), 0, 0.999999) * GRID_SIZE
+    point_cells = bins_x.astype(int) * GRID_SIZE + bins_y.astype(int)
+    expected = {
+        cell_id: valid[point_cells == cell_id] for cell_id in np.unique(point_cells)
+    }
+
+    # CSR offsets and members list every valid point once, grouped by cell
+    np.testing.assert_array_equal(sample.cell_ids, sorted(expected))
+    assert sample.offsets[0] == 0
+    assert sample.offsets[-1] == len(sample.members) == len(valid)
+    assert np.all(np.diff(sample.offsets) > 0)
+    for cell, cell_id in enumerate(sample.cell_ids):
+        members = sample.members[sample.offsets[cell] : sample.offsets[cell + 1]]
+        np.testing.assert_array_equal(members, expected[cell_id])
+
+    # Sampled points are distinct members of their cell, up to the maximum per cell
+    assert len(np.unique(sample.indices)) == len(sample)
+    assert np.isin(sample.indices, valid).all()
+    for point, index in enumerate(sample.indices):
+        members = sample.get_members(point)
+        assert index in members
+        assert sample.density[point] == len(members)
+    sampled_per_cell = np.bincount(sample.cells, minlength=len(sample.cell_ids))
+    np.testing.assert_array_equal(
+        sampled_per_cell,
+        np.minimum(np.diff(sample.offsets), MAX_POINTS_PER_CELL),
+    )
+
+
+def test_sample_consistent():
+    """Test cell memberships and samples match binning points directly."""
+    rng = np.random.default_rng(0)
+    ref = rng.normal(size=500)
+    pred = ref + rng.normal(scale=0.3, size=500)
+
+    check_sample(ref, pred)
+
+
+def test_sample_skips_nan():
+    """Test points with missing values are neither binned nor sampled."""
+    rng = np.random.default_rng(1)
+    ref = rng.normal(size=300)
+    pred = ref + rng.normal(scale=0.3, size=300)
+    ref[::7] = np.nan
+    pred[::11] = np.nan
+
+    check_sample(ref, pred)
+
+    sample = sample_density_grid(ref, pred)
+    assert not np.isin(np.arange(0, 300, 7), sample.members).any()
+    assert not np.isin(np.arange(0, 300, 11), sample.members).any()
+
+
+def test_sample_deterministic():
+    """Test sampling is reproducible for a fixed seed."""
+    rng = np.random.default_rng(2)
+    ref = rng.normal(size=200)
+    pred = rng.normal(size=200)
+
+    first = sample_density_grid(ref, pred, grid_size=GRID_SIZE)
+    second = sample_density_grid(ref, pred, grid_size=GRID_SIZE)
+    np.testing.assert_array_equal(first.indices, second.indices)
+
+
+def test_sample_all_missing():
+    """Test values that are all missing give an empty sample."""
+    sample = sample_density_grid([np.nan, None], [1.0, 2.0])
+
+    assert len(sample) == 0
+    np.testing.assert_array_equal(sample.offsets, [0])
+    assert len(sample.members) == 0
@@ -0,0 +1,215 @@
+"""Test fast extended XYZ reading and writing against ASE."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ase import Atoms
+from ase.build import bulk, molecule
+from ase.calculators.singlepoint import SinglePointCalculator
+from ase.constraints import FixAtoms
+from ase.io import read, write
+import numpy as np
+import pytest
+
+from ml_peg.calcs.utils.extxyz import ExtxyzReader, read_extxyz, write_extxyz
+
+
+def make_frames(n_frames: int = 3) -> list[Atoms]:
+    """
+    Build periodic and molecular frames with calculator results and info.
+
+    Parameters
+    ----------
+    n_frames
+        Number of frames to build.
+
+    Returns
+    -------
+    list[Atoms]
+        Structures to write.
+    """
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(n_frames):
+        atoms = bulk("Cu", cubic=True) * (2, 1, 1) if i % 2 else molecule("H2O")
+        atoms.positions += rng.normal(scale=0.05, size=atoms.positions.shape)
+        atoms.info.update({"step": i, "temperature": 300.5 + i, "label": f"frame{i}"})
+        atoms.new_array("charges", rng.normal(size=len(atoms)))
+        results = {
+            "energy": float(rng.normal()),
+            "forces": rng.normal(size=(len(atoms), 3)),
+        }
+        if atoms.pbc.all():
+            results["stress"] = rng.normal(size=6)
+        atoms.calc = SinglePointCalculator(atoms, **results)
+        frames.append(atoms)
+    return frames
+
+
+def assert_same_atoms(actual: Atoms, expected: Atoms) -> None:
+    """
+    Check two structures are identical, including info, arrays and results.
+
+    Parameters
+    ----------
+    actual
+        Structure read by ml_peg.
+    expected
+        Structure read by ASE.
+    """
+    assert actual.get_chemical_symbols() == expected.get_chemical_symbols()
+    np.testing.assert_array_equal(actual.positions, expected.positions)
+    np.testing.assert_array_equal(actual.cell.array, expected.cell.array)
+    np.testing.assert_array_equal(actual.pbc, expected.pbc)
+
+    assert actual.info.keys() == expected.info.keys()
+    for key, value in expected.info.items():
+        if isinstance(value, np.ndarray):
+            np.testing.assert_array_equal(actual.info[key], value)
+        else:
+            assert actual.info[key] == value
+
+    assert actual.arrays.keys() == expected.arrays.keys()
+    for key, value in expected.arrays.items():
+        np.testing.assert_array_equal(actual.arrays[key], value)
+
+    assert [type(c) for c in actual.constraints] == [
+        type(c) for c in expected.constraints
+    ]
+    for actual_constraint, expected_constraint in zip(
+        actual.constraints, expected.constraints, strict=True
+    ):
+        assert actual_constraint.todict() == expected_constraint.todict()
+
+    if expected.calc is None:
+        assert actual.calc is None
+    else:
+        assert actual.calc.results.keys() == expected.calc.results.keys()
+        for key, value in expected.calc.results.items():
+            np.testing.assert_array_equal(actual.calc.results[key], value)
+
+
+def assert_matches_ase(path: Path) -> None:
+    """
+    Check every frame, and the default last frame, are read as by ASE.
+
+    Parameters
+    ----------
+    path
+        Path to extended XYZ file.
+    """
+    expected = read(path, index=":", format="extxyz")
+    actual = read_extxyz(path, index=":")
+    assert len(actual) == len(expected)
+    for actual_atoms, expected_atoms in zip(actual, expected, strict=True):
+        assert_same_atoms(actual_atoms, expected_atoms)
+    assert_same_atoms(read_extxyz(path), read(path, format="extxyz"))
+
+
+@pytest.mark.parametrize("n_frames", [1, 3])
+def test_write_matches_ase(tmp_path: Path, n_frames: int):
+    """Test structures are written identically to ASE."""
+    frames = make_frames(n_frames)
+    write(tmp_path / "ase.xyz", frames, format="extxyz")
+    write_extxyz(tmp_path / "fast.xyz", frames)
+
+    assert (tmp_path / "fast.xyz").read_text() == (tmp_path / "ase.xyz").read_text()
+
+
+@pytest.mark.parametrize("n_frames", [1, 3])
+def test_read_matches_ase(tmp_path: Path, n_frames: int):
+    """Test single and multi-frame files are read identically to ASE."""
+    path = tmp_path / "frames.xyz"
+    write(path, make_frames(n_frames), format="extxyz")
+
+    assert_matches_ase(path)
+
+
+def test_read_crlf(tmp_path: Path):
+    """Test files with Windows line endings are read identically to ASE."""
+    path = tmp_path / "crlf.xyz"
+    write(path, make_frames(), format="extxyz")
+    path.write_bytes(path.read_bytes().replace(b"\n", b"\r\n"))
+
+    assert_matches_ase(path)
+
+
+def test_read_plain_xyz(tmp_path: Path):
+    """Test plain XYZ files, without properties, are read identically to ASE."""
+    path = tmp_path / "plain.xyz"
+    path.write_text(
+        "3\nwater molecule\nO 0.0 0.0 0.1\nH 0.0 0.76 -0.47\nH 0.0 -0.76 -0.47\n"
+        "2\n\nH 0.0 0.0 0.0\nH 0.0 0.0 0.74\n"
+    )
+
+    assert_matches_ase(path)
+
+
+def test_read_trailing_blank_lines(tmp_path: Path):
+    """Test blank lines after the last frame are ignored, as by ASE."""
+    path = tmp_path / "trailing.xyz"
+    write(path, make_frames(), format="extxyz")
+    with open(path, "a", encoding="utf8") as file:
+        file.write("\n\n  \n")
+
+    assert_matches_ase(path)
+
+
+def test_read_vec_lines(tmp_path: Path):
+    """Test cell vectors given as VEC lines are read by the ASE fallback."""
+    path = tmp_path / "vec.xyz"
+    path.write_text(
+        "2\n\nCu 0.0 0.0 0.0\nCu 1.8 1.8 0.0\n"
+        "VEC1 3.6 0.0 0.0\nVEC2 0.0 3.6 0.0\nVEC3 0.0 0.0 3.6\n"
+    )
+
+    assert_matches_ase(path)
+    assert read_extxyz(path).pbc.all()
+
+
+def test_read_json_and_bracketed_info(tmp_path: Path):
+    """Test JSON and bracketed comment line values are read as by ASE."""
+    atoms = molecule("H2O")
+    atoms.info["settings"] = {"method": "PBE", "cutoff": 500}
+    atoms.info["kpoints"] = [1, 2, 3]
+    atoms.info["name"] = "water with spaces"
+    path = tmp_path / "info.xyz"
+    write(path, atoms, format="extxyz")
+
+    assert_matches_ase(path)
+    assert read_extxyz(path).info["settings"] == {"method": "PBE", "cutoff": 500}
+
+
+def test_constraints_round_trip(tmp_path: Path):
+    """Test constrained structures are written and read as by ASE."""
+    frames = make_frames()
+    for atoms in frames:
+        atoms.set_constraint(FixAtoms(indices=[0]))
+    write(tmp_path / "ase.xyz", frames, format="extxyz")
+    write_extxyz(tmp_path / "fast.xyz", frames)
+
+    assert (tmp_path / "fast.xyz").read_text() == (tmp_path / "ase.xyz").read_text()
+    assert_matches_ase(tmp_path / "fast.xyz")
+    assert isinstance(read_extxyz(tmp_path / "fast.xyz").constraints[0], FixAtoms)
+
+
+def test_reader_close(tmp_path: Path):
+    """Test the reader releases the file on leaving its context."""
+    path = tmp_path / "frames.xyz"
+    write(path, make_frames(), format="extxyz")
+
+    with ExtxyzReader(path) as reader:
+        assert len(reader) == 3
+        assert_same_atoms(reader[1], read(path, index=1, format="extxyz"))
+    with pytest.raises(ValueError, match="closed"):
+        reader.get_atoms(0)
+    reader.close()
+
+
+def test_read_empty_file(tmp_path: Path):
+    """Test empty files contain no frames."""
+    path = tmp_path / "empty.xyz"
+    path.touch()
+
+    assert read_extxyz(path, index=":") == []
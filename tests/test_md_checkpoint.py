@@ -0,0 +1,100 @@
+"""Test resuming molecular dynamics from checkpoints."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ase import Atoms, units
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.md.nose_hoover_chain import IsotropicMTKNPT
+from ase.md.velocitydistribution import MaxwellBoltzmannDistribution
+import numpy as np
+
+from ml_peg.calcs.utils.md_checkpoint import (
+    CHAIN_ATTRS,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+N_STEPS = 20
+
+
+def make_dynamics() -> IsotropicMTKNPT:
+    """
+    Build NPT dynamics of thermalised bulk copper from the same initial state.
+
+    Returns
+    -------
+    IsotropicMTKNPT
+        Dynamics with an EMT calculator.
+    """
+    atoms = bulk("Cu", cubic=True) * (2, 2, 2)
+    atoms.calc = EMT()
+    MaxwellBoltzmannDistribution(atoms, temperature_K=600, rng=np.random.default_rng(0))
+    return IsotropicMTKNPT(
+        atoms,
+        timestep=2 * units.fs,
+        temperature_K=600,
+        pressure_au=units.bar,
+        tdamp=20 * units.fs,
+        pdamp=200 * units.fs,
+    )
+
+
+def get_state(dyn: IsotropicMTKNPT) -> dict[str, np.ndarray]:
+    """
+    Get the atoms, thermostat and barostat state of dynamics.
+
+    Parameters
+    ----------
+    dyn
+        Dynamics to get the state of.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Positions, momenta, cell, and chain variables.
+    """
+    atoms: Atoms = dyn.atoms
+    state = {
+        "positions": atoms.positions,
+        "momenta": atoms.get_momenta(),
+        "cell": atoms.cell.array,
+    }
+    for name, attrs in CHAIN_ATTRS.items():
+        for attr in attrs:
+            state[f"{name}.{attr}"] = np.asarray(getattr(getattr(dyn, name), attr))
+    return state
+
+
+def test_resume_matches_uninterrupted(tmp_path: Path):
+    """Test a run resumed from a checkpoint matches an uninterrupted run."""
+    uninterrupted = make_dynamics()
+    uninterrupted.run(N_STEPS)
+
+    interrupted = make_dynamics()
+    interrupted.run(N_STEPS // 2)
+    checkpoint = tmp_path / "md.ckpt.npz"
+    save_checkpoint(
+        checkpoint,
+        interrupted,
+        metadata={"frames": 3},
+        arrays={"densities": np.arange(3.0)},
+    )
+    assert not list(tmp_path.glob(".*"))
+
+    # Resume in fresh dynamics, as after restarting the process
+    resumed = make_dynamics()
+    metadata, arrays = load_checkpoint(checkpoint, resumed)
+    assert metadata == {"frames": 3}
+    np.testing.assert_array_equal(arrays["densities"], np.arange(3.0))
+    assert resumed.nsteps == N_STEPS // 2
+    resumed.run(N_STEPS - resumed.nsteps)
+
+    assert resumed.nsteps == uninterrupted.nsteps
+    expected = get_state(uninterrupted)
+    actual = get_state(resumed)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_allclose(actual[key], value, rtol=1e-12, atol=1e-12)
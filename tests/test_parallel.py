@@ -0,0 +1,73 @@
+"""Test parallel mapping over items."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from ml_peg.calcs.utils.parallel import parallel_map
+
+
+def make_state(offset: int) -> dict[str, int]:
+    """
+    Create the state of a worker.
+
+    Parameters
+    ----------
+    offset
+        Value added to each item.
+
+    Returns
+    -------
+    dict[str, int]
+        Worker state, including the process it was created in.
+    """
+    return {"offset": offset, "pid": os.getpid()}
+
+
+def add_offset(item: int, state: dict[str, int]) -> tuple[int, int]:
+    """
+    Add the worker offset to an item, finishing later items sooner.
+
+    Parameters
+    ----------
+    item
+        Item to process.
+    state
+        Worker state created by `make_state`.
+
+    Returns
+    -------
+    tuple[int, int]
+        Processed item, and the process that created the worker state.
+    """
+    time.sleep(0.01 * ((10 - item) % 5))
+    return item + state["offset"], state["pid"]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_parallel_map_order(n_jobs: int):
+    """Test results are returned in the order of the items."""
+    results = parallel_map(
+        add_offset,
+        (item for item in range(10)),
+        init_worker=make_state,
+        init_args=(100,),
+        n_jobs=n_jobs,
+        max_in_flight=4,
+    )
+
+    assert [value for value, _ in results] == list(range(100, 110))
+    pids = {pid for _, pid in results}
+    if n_jobs == 1:
+        assert pids == {os.getpid()}
+    else:
+        assert os.getpid() not in pids
+
+
+def test_parallel_map_invalid_in_flight():
+    """Test at least one item must be allowed in flight."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        parallel_map(add_offset, range(3), n_jobs=2, max_in_flight=0)
@@ -0,0 +1,68 @@
+"""Test streaming partial RDFs against ASE."""
+
+from __future__ import annotations
+
+from ase import Atoms
+from ase.build import bulk
+from ase.data import atomic_numbers
+from ase.geometry.rdf import get_rdf
+import numpy as np
+import pytest
+
+from ml_peg.analysis.utils.rdf import compute_partial_rdfs
+
+PAIRS = [("Na", "Cl"), ("Cl", "Na"), ("Cl", "Cl")]
+RMAX = 5.0
+NBINS = 50
+
+
+def make_frames(cell: np.ndarray, n_frames: int = 5) -> list[Atoms]:
+    """
+    Build frames of NaCl with randomly displaced atoms.
+
+    Parameters
+    ----------
+    cell
+        Cell of each frame, which atoms are scaled to.
+    n_frames
+        Number of frames to build.
+
+    Returns
+    -------
+    list[Atoms]
+        Structures to average over.
+    """
+    rng = np.random.default_rng(0)
+    atoms = bulk("NaCl", "rocksalt", a=5.64, cubic=True) * (2, 2, 2)
+    atoms.set_cell(cell, scale_atoms=True)
+    frames = []
+    for _ in range(n_frames):
+        frame = atoms.copy()
+        frame.positions += rng.normal(scale=0.2, size=frame.positions.shape)
+        frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize(
+    "cell",
+    [
+        np.diag([11.28, 11.5, 12.0]),
+        np.array([[11.28, 0.0, 0.0], [2.0, 11.0, 0.0], [1.5, -1.0, 11.5]]),
+    ],
+    ids=["orthorhombic", "triclinic"],
+)
+def test_matches_ase(cell: np.ndarray):
+    """Test partial RDFs match those from ASE, averaged over frames."""
+    frames = make_frames(cell)
+    r, rdfs = compute_partial_rdfs(frames, PAIRS, RMAX, NBINS, chunk_size=2)
+
+    for pair in PAIRS:
+        elements = [atomic_numbers[symbol] for symbol in pair]
+        expected = []
+        for frame in frames:
+            rdf, distances = get_rdf(frame, RMAX, NBINS, elements=elements)
+            expected.append(rdf)
+        np.testing.assert_allclose(r, distances)
+        np.testing.assert_allclose(
+            rdfs[pair], np.mean(expected, axis=0), rtol=1e-10, atol=1e-10
+        )
@@ -0,0 +1,130 @@
+"""Test binary trajectory writing and reading."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ase import Atoms
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.io import read
+from ase.md.verlet import VelocityVerlet
+import numpy as np
+import pytest
+
+from ml_peg.calcs.utils.trajectory import (
+    BinaryTrajectoryReader,
+    BinaryTrajectoryWriter,
+    binary_trajectory_to_extxyz,
+)
+
+
+def make_frames(n_frames: int) -> list[Atoms]:
+    """
+    Build frames of a triclinic cell with changing positions, cell and info.
+
+    Parameters
+    ----------
+    n_frames
+        Number of frames to build.
+
+    Returns
+    -------
+    list[Atoms]
+        Structures to write.
+    """
+    rng = np.random.default_rng(0)
+    atoms = bulk("Cu", "fcc", a=3.6) * (2, 2, 2)
+    frames = []
+    for i in range(n_frames):
+        frame = atoms.copy()
+        frame.positions += rng.normal(scale=0.1, size=frame.positions.shape)
+        frame.set_cell(frame.cell.array * (1 + 0.01 * i), scale_atoms=False)
+        frame.info.update({"temperature": 300.0 + rng.normal(), "volume": i / 3})
+        frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize(
+    ("dtype", "atol"), [("float64", 0.0), ("float32", 1e-5)], ids=["float64", "float32"]
+)
+def test_round_trip(tmp_path: Path, dtype: str, atol: float):
+    """Test positions, cell and info are read back as written."""
+    frames = make_frames(5)
+    path = tmp_path / "md.btraj"
+    with BinaryTrajectoryWriter(
+        path,
+        frames[0],
+        flush_interval=2,
+        dtype=dtype,
+        info_keys=("temperature", "volume"),
+    ) as writer:
+        for step, frame in enumerate(frames):
+            writer.write(frame, step=10 * step)
+
+    reader = BinaryTrajectoryReader(path)
+    assert len(reader) == len(frames)
+    np.testing.assert_array_equal(reader.steps, 10 * np.arange(len(frames)))
+    for written, read_atoms in zip(frames, reader, strict=True):
+        np.testing.assert_array_equal(read_atoms.numbers, written.numbers)
+        np.testing.assert_array_equal(read_atoms.pbc, written.pbc)
+        np.testing.assert_array_equal(read_atoms.cell.array, written.cell.array)
+        np.testing.assert_allclose(
+            read_atoms.positions, written.positions, rtol=0, atol=atol
+        )
+        for key in ("temperature", "volume"):
+            assert read_atoms.info[key] == written.info[key]
+
+
+def test_append_across_writers(tmp_path: Path):
+    """Test frames are appended by new writers, discarding partial frames."""
+    frames = make_frames(6)
+    path = tmp_path / "md.btraj"
+    with BinaryTrajectoryWriter(path, frames[0], dtype="float64") as writer:
+        for frame in frames[:3]:
+            writer.write(frame)
+
+    # Interrupted run, leaving part of a frame
+    with open(path, "ab") as file:
+        file.write(b"\x00" * 7)
+
+    with BinaryTrajectoryWriter(path, frames[0], mode="a", dtype="float64") as writer:
+        assert writer.n_written == 3
+        for frame in frames[3:]:
+            writer.write(frame)
+
+    reader = BinaryTrajectoryReader(path)
+    np.testing.assert_array_equal(reader.steps, np.arange(6))
+    np.testing.assert_array_equal(
+        reader.positions, np.stack([frame.positions for frame in frames])
+    )
+
+
+def test_append_different_atoms(tmp_path: Path):
+    """Test appending frames of a different structure is rejected."""
+    atoms = bulk("Cu", cubic=True)
+    path = tmp_path / "md.btraj"
+    with BinaryTrajectoryWriter(path, atoms) as writer:
+        writer.write()
+
+    with pytest.raises(ValueError, match="Cannot append"):
+        BinaryTrajectoryWriter(path, bulk("Au", cubic=True), mode="a")
+
+
+def test_attach_and_convert(tmp_path: Path):
+    """Test frames are written every stride steps and convert to extxyz."""
+    atoms = bulk("Cu", cubic=True) * (2, 2, 2)
+    atoms.calc = EMT()
+    path = tmp_path / "md.btraj"
+    dyn = VelocityVerlet(atoms, timestep=1.0)
+    with BinaryTrajectoryWriter(path, atoms, stride=5, dtype="float64") as writer:
+        writer.attach(dyn)
+        dyn.run(20)
+
+    reader = BinaryTrajectoryReader(path)
+    np.testing.assert_array_equal(reader.steps, [0, 5, 10, 15, 20])
+    np.testing.assert_array_equal(reader[-1].positions, atoms.positions)
+
+    binary_trajectory_to_extxyz(path, tmp_path / "md.xyz", stride=2)
+    converted = read(tmp_path / "md.xyz", index=":")
+    assert [frame.info["step"] for frame in converted] == [0, 10, 20]